@@ -1,13 +1,23 @@
 """
 Configuration management using Pydantic Settings
 """
-from pydantic_settings import BaseSettings
-from typing import Optional
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+from functools import lru_cache
+from typing import Annotated, List, Optional
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        case_sensitive=True,
+        frozen=True  # Read-only after load - override via environment, not assignment
+    )
+    
     # Server
     PORT: int = 8000
     HOST: str = "0.0.0.0"
@@ -17,13 +27,18 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = ""
     SUPABASE_KEY: str = ""
     SUPABASE_SERVICE_ROLE_KEY: Optional[str] = None
+    DATABASE_URL: str = ""  # Direct Postgres connection - lets the worker LISTEN for new prompts
     
     # Storage
     STORAGE_PATH: str = "./storage"
     LOG_PATH: str = "./logs"
+    LOG_LEVEL: str = "INFO"  # Console level - WARNING in production drops INFO formatting entirely
+    SUPABASE_STORAGE_BUCKET: str = "scrape-artifacts"  # Large raw HTML goes here, not the responses row
+    CAPTURE_RAW_HTML: bool = False  # Save page HTML with each response (development only)
     
     # Anti-Detection
     HEADLESS: bool = False
+    HEADLESS_MODE: str = "new"  # "new" (full Chrome) or "shell" (faster, easier to detect)
     USE_STEALTH: bool = True
     RANDOM_DELAY_MIN: int = 1
     RANDOM_DELAY_MAX: int = 3
@@ -32,11 +47,17 @@ class Settings(BaseSettings):
     RATE_LIMIT_DELAY: int = 180  # 3 minutes between requests
     MAX_CONCURRENT_SESSIONS: int = 3
     
+    # Browser Pool (API server keeps browsers open between requests)
+    BROWSER_POOL_SIZE: int = 2  # Browsers per AI source, launched at startup
+    BROWSER_POOL_RECYCLE_AFTER: int = 25  # Queries before a browser is closed and relaunched
+    WORKER_PROMPTS_PER_MINUTE: float = 4  # Prompt starts per AI source in the background worker
+    SCRAPE_TIMEOUT_SECONDS: int = 300  # Worker gives up on a query (and closes its browser) after this
+    
     # Oxylabs Proxy Configuration
     OXYLABS_USERNAME: str = ""
     OXYLABS_PASSWORD: str = ""
     OXYLABS_PROXY_HOST: str = "dc.oxylabs.io"
-    OXYLABS_PROXY_PORTS: str = "8001,8002,8003,8004,8005"
+    OXYLABS_PROXY_PORTS: Annotated[List[int], NoDecode] = [8001, 8002, 8003, 8004, 8005]
     USE_PROXY: bool = True  # MUST be True to use proxies
     
     # Google AI Studio API Key (for LLM-powered extraction)
@@ -46,10 +67,20 @@ class Settings(BaseSettings):
     LLM_ENABLED: bool = True  # Toggle LLM extraction
     LLM_MODEL: str = "gemini-2.5-flash"  # Fast & free model
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    @field_validator('OXYLABS_PROXY_PORTS', mode='before')
+    @classmethod
+    def _split_proxy_ports(cls, value):
+        """Parse comma-separated ports from the environment once at startup"""
+        if isinstance(value, str):
+            return [int(port) for port in value.split(',') if port.strip()]
+        return value
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings (validated once, use with Depends)"""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -1,11 +1,76 @@
 """
 Supabase database client and operations
 """
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
+from postgrest.exceptions import APIError
 from app.config import settings
-from typing import Optional, List, Dict, Any
+from app.utils.compression import compress_bytes, compress_text
+from typing import Optional, List, Dict, Tuple, Any, Callable, Awaitable, Hashable
 from uuid import UUID
 from loguru import logger
+from cachetools import TTLCache
+from datetime import datetime, timezone
+from functools import lru_cache
+import asyncio
+import httpx
+import time
+
+
+# Explicit column projections for hot read paths - select('*') on responses
+# would also pull the (large) raw HTML column
+RESPONSE_COLUMNS = 'id, prompt_id, prompt_text, response_text, ai_source, brands_mentioned, status, error_message, created_at, completed_at'
+PROMPT_COLUMNS = 'id, text, category_id, created_at'
+BRAND_COLUMNS = 'id, name, category_id, logo_url, website, created_at'
+CATEGORY_COLUMNS = 'id, name, description, created_at, updated_at'
+
+# Write-behind buffer: flush every WRITE_BATCH_SIZE rows or WRITE_BATCH_WINDOW seconds
+WRITE_BATCH_SIZE = 32
+WRITE_BATCH_WINDOW = 0.2
+
+# A prompt is pending for an AI source if it has no response in this window
+PENDING_WINDOW_SECONDS = 2 * 60 * 60
+
+# Raw HTML up to this size stays inline (compressed) - larger pages go to Supabase Storage
+RAW_HTML_INLINE_LIMIT = 4096
+
+
+def _citation_rows(response_id: str, brand_name: str, citations: List[Dict]) -> List[Dict[str, Any]]:
+    """
+    Citation table rows for one brand's LLM-extracted citations
+    
+    The LLM often repeats a URL for a brand - only the first is kept, since one
+    duplicate of (response_id, brand_name, url) fails the whole bulk insert.
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for citation in citations:
+        rows.setdefault(citation['url'], {
+            'response_id': response_id,
+            'brand_name': brand_name,
+            'url': citation['url'],
+            'title': citation.get('title'),
+            'domain': citation.get('domain', ''),
+            'position': citation.get('position', 0)
+        })
+    return list(rows.values())
+
+
+def _mention_row(response_id: str, brand_name: str, mention_data: Dict) -> Dict[str, Any]:
+    """brand_mentions table row for one brand's LLM-extracted context"""
+    return {
+        'response_id': response_id,
+        'brand_name': brand_name,
+        'context': mention_data.get('context', ''),
+        'full_context': mention_data.get('context', ''),  # Use context for both fields
+        'position': 0,  # Can be calculated if needed
+        'sentiment': mention_data.get('sentiment', 'neutral'),
+        'keywords': mention_data.get('keywords', [])
+    }
+
+
+@lru_cache(maxsize=1)
+def _utc_iso(timestamp: int) -> str:
+    """ISO-8601 UTC string for a whole-second timestamp (formatted at most once per second)"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
 
 
 class Database:
@@ -14,31 +79,241 @@ class Database:
     def __init__(self):
         """Initialize Supabase client"""
         try:
+            # Shared pooled HTTP session so TCP+TLS setup is paid once, not per query
+            self.http_client = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    retries=3,
+                    limits=httpx.Limits(
+                        max_connections=60,
+                        max_keepalive_connections=40,
+                        keepalive_expiry=60
+                    )
+                ),
+                timeout=120
+            )
+            
             self.client: Client = create_client(
                 settings.SUPABASE_URL,
-                settings.SUPABASE_KEY
+                settings.SUPABASE_KEY,
+                options=ClientOptions(httpx_client=self.http_client)
             )
             logger.info("✅ Supabase client initialized")
         except Exception as e:
             logger.error(f"❌ Failed to initialize Supabase client: {e}")
             raise
+        
+        # Reference data (categories, brands, prompts) changes rarely - cache for 5 minutes
+        self._cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        self._cache_locks: Dict[Hashable, List[Any]] = {}  # key -> [lock, callers using it]
+        
+        # Visibility scores move with every completed response - short TTL, and
+        # cleared whenever response updates are written
+        self._stats_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+        
+        # Write-behind buffer for response updates and session saves (see _writer_loop)
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+    
+    # ============= Cache Helpers =============
+    
+    async def _cached(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        cache: Optional[TTLCache] = None
+    ) -> Any:
+        """
+        Return cached value for key, calling fetch() on a miss
+        
+        Concurrent misses for the same key share a single fetch. Errors raised
+        by fetch() propagate and are never cached, and neither is None ("not found").
+        Uses the reference-data cache unless another cache is given.
+        """
+        if cache is None:
+            cache = self._cache
+        if key in cache:
+            return cache[key]
+        
+        # Keys can come from request parameters - the lock is dropped once nobody uses it
+        entry = self._cache_locks.get(key)
+        if entry is None:
+            entry = self._cache_locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                if key in cache:
+                    return cache[key]
+                value = await fetch()
+                if value is not None:
+                    cache[key] = value
+                return value
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._cache_locks[key]
+    
+    async def _execute(self, query: Any) -> Any:
+        """Run a blocking supabase-py query in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(query.execute)
+    
+    async def _select_one(
+        self,
+        table: str,
+        columns: str,
+        column: str,
+        value: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the first row where column == value, or None if there is no match"""
+        result = await self._execute(
+            self.client.table(table).select(columns).eq(column, value).limit(1)
+        )
+        return result.data[0] if result.data else None  # type: ignore
+    
+    def invalidate_cache(self):
+        """Drop all cached reference data (call after writes to categories/brands/prompts)"""
+        self._cache.clear()
+    
+    def invalidate_stats(self):
+        """Drop cached visibility scores (called after response writes)"""
+        self._stats_cache.clear()
+    
+    # ============= Write-Behind Buffer =============
+    
+    def _enqueue_write(self, kind: str, key: str, payload: Dict[str, Any]):
+        """Queue a write for the background writer, starting it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._writer_task is None or self._writer_task.get_loop() is not loop:
+            self._write_queue = asyncio.Queue()
+            self._writer_task = loop.create_task(self._writer_loop(self._write_queue))
+        self._write_queue.put_nowait((kind, key, payload))  # type: ignore
+    
+    async def _writer_loop(self, queue: asyncio.Queue):
+        """Drain the write queue in batches of up to 32 rows or every 200ms"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + WRITE_BATCH_WINDOW
+            
+            while len(batch) < WRITE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self._flush_writes(batch)
+            except Exception as e:
+                logger.error(f"❌ Write-behind flush error: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _flush_writes(self, batch: List[tuple]):
+        """Write one batch - later writes to the same row/session win"""
+        response_updates: Dict[str, Dict[str, Any]] = {}
+        sessions: Dict[str, Dict[str, Any]] = {}
+        
+        for kind, key, payload in batch:
+            if kind == 'response':
+                response_updates.setdefault(key, {'id': key}).update(payload)
+            elif kind == 'session':
+                sessions[key] = payload
+        
+        if response_updates:
+            rows = list(response_updates.values())
+            await asyncio.gather(*(
+                self._store_raw_html(row) for row in rows if 'raw_html' in row
+            ))
+            try:
+                # Single round-trip partial update (see performance_updates.sql)
+                await self._execute(self.client.rpc('update_responses_batch', {'p_updates': rows}))
+                for row in rows:
+                    logger.info("✅ Updated response {} with status: {}", row['id'], row['status'])
+            except Exception as e:
+                logger.warning(f"⚠️ Batch response update failed, retrying per row: {e}")
+                for row in rows:
+                    response_id = row['id']
+                    update_data = {k: v for k, v in row.items() if k != 'id'}
+                    update_data['completed_at'] = 'now()'
+                    try:
+                        await self._execute(self.client.table('responses').update(update_data).eq(
+                            'id', response_id
+                        ))
+                        logger.info("✅ Updated response {} with status: {}", response_id, row['status'])
+                    except Exception as row_error:
+                        logger.error(f"❌ Update error for {response_id}: {row_error}")
+            
+            self.invalidate_stats()
+        
+        if sessions:
+            try:
+                await self._execute(self.client.table('scraper_sessions').upsert(
+                    list(sessions.values()),
+                    on_conflict='ai_source'
+                ))
+                for ai_source in sessions:
+                    logger.info("✅ Saved session for {}", ai_source)
+            except Exception as e:
+                logger.error(f"❌ Session save error for {', '.join(sessions)}: {e}")
+    
+    async def _store_raw_html(self, row: Dict[str, Any]):
+        """
+        Replace row['raw_html'] with its stored form
+        
+        Small pages are kept inline as compressed BYTEA; large pages are uploaded
+        to Supabase Storage as responses/{id}.html.zst and only the key is kept.
+        """
+        raw_html = row.pop('raw_html')
+        if len(raw_html) <= RAW_HTML_INLINE_LIMIT:
+            row['raw_html_zstd'] = compress_text(raw_html)
+            return
+        
+        key = f"responses/{row['id']}.html.zst"
+        
+        def upload():
+            self.client.storage.from_(settings.SUPABASE_STORAGE_BUCKET).upload(
+                key,
+                compress_bytes(raw_html),
+                {'content-type': 'application/zstd', 'upsert': 'true'}
+            )
+        
+        try:
+            await asyncio.to_thread(upload)
+            row['raw_html_key'] = key
+        except Exception as e:
+            # Debug-only data - losing it must not fail the response update
+            logger.warning(f"⚠️ Raw HTML upload failed for {row['id']}: {e}")
+    
+    async def flush_writes(self):
+        """Wait until every queued write has been sent (call before shutdown)"""
+        if self._write_queue is not None and self._writer_task is not None \
+                and self._writer_task.get_loop() is asyncio.get_running_loop():
+            await self._write_queue.join()
     
     # ============= Category Operations =============
     
     async def get_categories(self) -> List[Dict[str, Any]]:
         """Get all categories with summary data (brand counts, top brands)"""
-        try:
-            result = self.client.table('category_summary').select('*').execute()
+        async def fetch():
+            result = await self._execute(self.client.table('category_summary').select('*'))
             return result.data if result.data else []
+        
+        try:
+            return await self._cached(('categories',), fetch)
         except Exception as e:
             logger.error(f"❌ Error fetching categories: {e}")
             return []
     
     async def get_category(self, category_id: str) -> Optional[Dict[str, Any]]:
         """Get a single category by ID"""
+        async def fetch():
+            return await self._select_one('categories', CATEGORY_COLUMNS, 'id', category_id)
+        
         try:
-            result = self.client.table('categories').select('*').eq('id', category_id).single().execute()
-            return result.data if result.data else None
+            return await self._cached(('category', category_id), fetch)
         except Exception as e:
             logger.error(f"❌ Error fetching category {category_id}: {e}")
             return None
@@ -46,8 +321,7 @@ class Database:
     async def get_category_summary(self, category_id: str) -> Optional[Dict[str, Any]]:
         """Get category with summary data"""
         try:
-            result = self.client.table('category_summary').select('*').eq('id', category_id).single().execute()
-            return result.data if result.data else None
+            return await self._select_one('category_summary', '*', 'id', category_id)
         except Exception as e:
             logger.error(f"❌ Error fetching category summary {category_id}: {e}")
             return None
@@ -56,26 +330,36 @@ class Database:
     
     async def get_brands(self, category_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all brands, optionally filtered by category"""
-        try:
-            query = self.client.table('brands').select('*')
+        async def fetch():
+            query = self.client.table('brands').select(BRAND_COLUMNS)
             if category_id:
                 query = query.eq('category_id', category_id)
-            result = query.execute()
+            result = await self._execute(query)
             return result.data if result.data else []
+        
+        try:
+            return await self._cached(('brands', category_id), fetch)
         except Exception as e:
             logger.error(f"❌ Error fetching brands: {e}")
             return []
     
-    async def get_brand_names(self, category_id: str) -> List[str]:
-        """Get all brand names for a category"""
-        brands = await self.get_brands(category_id)
-        return [brand['name'] for brand in brands]
+    async def get_brand_names(self, category_id: str) -> Tuple[str, ...]:
+        """
+        Get all brand names for a category (cached, longest names first)
+        
+        Returned as a tuple so it is hashable and can key downstream matcher caches.
+        """
+        async def fetch():
+            brands = await self.get_brands(category_id)
+            # Empty result may be a swallowed error - return None so it isn't cached
+            return tuple(sorted((brand['name'] for brand in brands), key=len, reverse=True)) or None
+        
+        return await self._cached(('brand_names', category_id), fetch) or ()
     
     async def get_brand_details(self, brand_id: str) -> Optional[Dict[str, Any]]:
         """Get comprehensive brand details including visibility scores"""
         try:
-            result = self.client.table('brand_details').select('*').eq('id', brand_id).single().execute()
-            return result.data if result.data else None
+            return await self._select_one('brand_details', '*', 'id', brand_id)
         except Exception as e:
             logger.error(f"❌ Error fetching brand details {brand_id}: {e}")
             return None
@@ -96,7 +380,7 @@ class Database:
             if ai_source:
                 query = query.eq('ai_source', ai_source)
             
-            result = query.execute()
+            result = await self._execute(query)
             return result.data if result.data else []
         except Exception as e:
             logger.error(f"❌ Error fetching brand timeseries {brand_id}: {e}")
@@ -105,10 +389,9 @@ class Database:
     async def get_brand_platform_scores(self, brand_id: str) -> List[Dict[str, Any]]:
         """Get brand visibility scores per platform"""
         try:
-            result = self.client.table('brand_platform_scores')\
+            result = await self._execute(self.client.table('brand_platform_scores')\
                 .select('*')\
-                .eq('brand_id', brand_id)\
-                .execute()
+                .eq('brand_id', brand_id))
             return result.data if result.data else []
         except Exception as e:
             logger.error(f"❌ Error fetching brand platform scores {brand_id}: {e}")
@@ -117,11 +400,10 @@ class Database:
     async def get_category_leaderboard(self, category_id: str) -> List[Dict[str, Any]]:
         """Get brand leaderboard for a category"""
         try:
-            result = self.client.table('brand_leaderboard')\
+            result = await self._execute(self.client.table('brand_leaderboard')\
                 .select('id, name, logo_url, overall_visibility_score, total_mentions')\
                 .eq('category_id', category_id)\
-                .order('overall_visibility_score', desc=True)\
-                .execute()
+                .order('overall_visibility_score', desc=True))
             return result.data if result.data else []
         except Exception as e:
             logger.error(f"❌ Error fetching category leaderboard {category_id}: {e}")
@@ -131,12 +413,15 @@ class Database:
     
     async def get_prompts(self, category_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all prompts, optionally filtered by category"""
-        try:
-            query = self.client.table('prompts').select('*')
+        async def fetch():
+            query = self.client.table('prompts').select(PROMPT_COLUMNS)
             if category_id:
                 query = query.eq('category_id', category_id)
-            result = query.execute()
+            result = await self._execute(query)
             return result.data if result.data else []
+        
+        try:
+            return await self._cached(('prompts', category_id), fetch)
         except Exception as e:
             logger.error(f"❌ Error fetching prompts: {e}")
             return []
@@ -144,12 +429,74 @@ class Database:
     async def get_prompt(self, prompt_id: str) -> Optional[Dict[str, Any]]:
         """Get a single prompt by ID"""
         try:
-            result = self.client.table('prompts').select('*').eq('id', prompt_id).single().execute()
-            return result.data if result.data else None
+            return await self._select_one('prompts', PROMPT_COLUMNS, 'id', prompt_id)
         except Exception as e:
             logger.error(f"❌ Error fetching prompt {prompt_id}: {e}")
             return None
     
+    async def get_prompts_by_ids(self, prompt_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get several prompts with a single query
+        
+        Args:
+            prompt_ids: Prompt UUIDs
+            
+        Returns:
+            Matching prompts (unordered, missing IDs are simply absent)
+        """
+        if not prompt_ids:
+            return []
+        
+        try:
+            result = await self._execute(
+                self.client.table('prompts').select(PROMPT_COLUMNS).in_('id', prompt_ids)
+            )
+            return result.data if result.data else []  # type: ignore
+        except Exception as e:
+            logger.error(f"❌ Error fetching {len(prompt_ids)} prompts: {e}")
+            return []
+    
+    async def get_prompt_with_brand_names(
+        self,
+        prompt_id: str
+    ) -> Tuple[Optional[Dict[str, Any]], Tuple[str, ...]]:
+        """
+        Get a prompt and its category's brand names in one round-trip
+        
+        Brands are embedded through prompts.category_id -> categories -> brands,
+        so the lookup no longer waits on the prompt before fetching brands.
+        
+        Args:
+            prompt_id: UUID of the prompt
+            
+        Returns:
+            (prompt, brand names longest first) - (None, ()) if not found
+        """
+        try:
+            row = await self._select_one(
+                'prompts',
+                f'{PROMPT_COLUMNS}, categories(brands(name))',
+                'id',
+                prompt_id
+            )
+        except Exception as e:
+            logger.error(f"❌ Error fetching prompt {prompt_id}: {e}")
+            return None, ()
+        
+        if not row:
+            return None, ()
+        
+        category = row.pop('categories', None) or {}
+        names = tuple(sorted(
+            (brand['name'] for brand in category.get('brands') or []),
+            key=len,
+            reverse=True
+        ))
+        if names:
+            # Same shape get_brand_names caches
+            self._cache[('brand_names', row['category_id'])] = names
+        return row, names
+    
     async def get_pending_prompts(
         self,
         ai_source: str,
@@ -168,37 +515,67 @@ class Database:
             List of prompts that need scraping
         """
         try:
-            from datetime import datetime, timedelta
-            
             # Calculate cutoff time (2 hours ago)
-            cutoff_time = (datetime.utcnow() - timedelta(hours=2)).isoformat()
-            
-            # Get all prompts for category
-            prompts = await self.get_prompts(category_id)
-            
-            # For each prompt, check if it has a recent response from this AI source
-            pending = []
-            for prompt in prompts:
-                # Check if scraped in last 2 hours
-                result = self.client.table('responses')\
-                    .select('id, created_at')\
-                    .eq('prompt_id', prompt['id'])\
-                    .eq('ai_source', ai_source)\
-                    .gte('created_at', cutoff_time)\
-                    .execute()
-                
-                # If no recent scrape, add to pending list
-                if not result.data or len(result.data) == 0:
-                    pending.append(prompt)
-                    
-                if len(pending) >= limit:
-                    break
+            cutoff_time = _utc_iso(int(time.time()) - PENDING_WINDOW_SECONDS)
             
-            return pending
+            # Anti-join runs server-side (see performance_updates.sql)
+            result = await self._execute(self.client.rpc('get_pending_prompts', {
+                'p_ai_source': ai_source,
+                'p_category_id': category_id,
+                'p_cutoff': cutoff_time,
+                'p_limit': limit
+            }))
+            
+            return result.data if result.data else []
         except Exception as e:
             logger.error(f"❌ Error fetching pending prompts: {e}")
             return []
     
+    async def claim_pending_prompts(
+        self,
+        ai_source: str,
+        category_id: Optional[str] = None,
+        limit: int = 10
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Take pending prompts for a worker and create their 'processing' responses atomically
+        
+        Concurrent claims for the same AI source are serialized in the database,
+        so no prompt is handed to two workers.
+        
+        Args:
+            ai_source: AI platform (chatgpt, gemini, perplexity)
+            category_id: Optional category filter
+            limit: Maximum number of prompts to claim
+            
+        Returns:
+            Claimed prompts (id, text, category_id, created_at, response_id), None
+            if claim_pending_prompts is not installed, or an empty list if the
+            claim failed (the caller retries on its next pass)
+        """
+        try:
+            cutoff_time = _utc_iso(int(time.time()) - PENDING_WINDOW_SECONDS)
+            
+            # See performance_updates.sql (section 7)
+            result = await self._execute(self.client.rpc('claim_pending_prompts', {
+                'p_ai_source': ai_source,
+                'p_category_id': category_id,
+                'p_cutoff': cutoff_time,
+                'p_limit': limit
+            }))
+            
+            return result.data if result.data else []
+        except APIError as e:
+            # PGRST202: no such function - anything else must not disable the atomic claim
+            if e.code == 'PGRST202':
+                logger.warning("⚠️ claim_pending_prompts is not installed - see performance_updates.sql")
+                return None
+            logger.error(f"❌ Error claiming pending prompts: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"❌ Error claiming pending prompts: {e}")
+            return []
+    
     # ============= Response Operations =============
     
     async def create_response(
@@ -219,16 +596,16 @@ class Database:
             Created response record or None on error
         """
         try:
-            result = self.client.table('responses').insert({
+            result = await self._execute(self.client.table('responses').insert({
                 'prompt_id': prompt_id,
                 'prompt_text': prompt_text,
                 'ai_source': ai_source,
                 'brands_mentioned': [],
                 'status': 'processing'
-            }).execute()
+            }))
             
             if result.data and len(result.data) > 0:
-                logger.info(f"✅ Created response record: {result.data[0]['id']}") # type: ignore
+                logger.info("✅ Created response record: {}", result.data[0]['id']) # type: ignore
                 return result.data[0] # type: ignore
             else:
                 logger.error("❌ No data returned from insert")
@@ -238,6 +615,42 @@ class Database:
             logger.error(f"❌ Database error creating response: {e}")
             return None
     
+    async def create_responses_batch(
+        self,
+        records: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many response records in processing state with a single insert
+        
+        Args:
+            records: Dicts with prompt_id, prompt_text and ai_source
+            
+        Returns:
+            Created response records (empty list on error)
+        """
+        if not records:
+            return []
+        
+        try:
+            result = await self._execute(self.client.table('responses').insert([
+                {
+                    'prompt_id': record['prompt_id'],
+                    'prompt_text': record['prompt_text'],
+                    'ai_source': record['ai_source'],
+                    'brands_mentioned': [],
+                    'status': 'processing'
+                }
+                for record in records
+            ]))
+            
+            created = result.data if result.data else []
+            logger.info("✅ Created {} response records", len(created))
+            return created  # type: ignore
+            
+        except Exception as e:
+            logger.error(f"❌ Database error creating {len(records)} responses: {e}")
+            return []
+    
     async def update_response(
         self,
         response_id: str,
@@ -248,7 +661,7 @@ class Database:
         raw_html: Optional[str] = None
     ) -> bool:
         """
-        Update response with scraping results
+        Queue a response update with scraping results (written in the background)
         
         Args:
             response_id: UUID of response record
@@ -259,33 +672,63 @@ class Database:
             raw_html: Raw HTML for debugging
             
         Returns:
-            True if successful, False otherwise
+            True if queued, False otherwise
         """
         try:
             update_data = {
                 'response_text': response_text,
                 'brands_mentioned': brands_mentioned,
-                'status': status,
-                'completed_at': 'now()'
+                'status': status
             }
             
             if error_message:
                 update_data['error_message'] = error_message
             
             if raw_html:
+                # Stored by the writer: inline when small, Storage object when large
                 update_data['raw_html'] = raw_html
             
-            result = self.client.table('responses').update(update_data).eq(
-                'id', response_id
-            ).execute()
-            
-            logger.info(f"✅ Updated response {response_id} with status: {status}")
+            self._enqueue_write('response', response_id, update_data)
             return True
             
         except Exception as e:
             logger.error(f"❌ Update error for {response_id}: {e}")
             return False
     
+    async def update_responses_batch(self, records: List[Dict[str, Any]]) -> bool:
+        """
+        Write scraping results for many responses with a single upsert
+        
+        Args:
+            records: Full response rows (id, prompt_id, prompt_text, ai_source
+                     plus response_text, brands_mentioned, status and optional
+                     error_message/raw_html) - upsert inserts need every NOT NULL column
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not records:
+            return True
+        
+        try:
+            rows = [{**record, 'completed_at': 'now()'} for record in records]
+            for row in rows:
+                if not row.get('raw_html'):
+                    row.pop('raw_html', None)
+            await asyncio.gather(*(
+                self._store_raw_html(row) for row in rows if 'raw_html' in row
+            ))
+            
+            await self._execute(self.client.table('responses').upsert(rows, on_conflict='id'))
+            self.invalidate_stats()
+            
+            logger.info("✅ Updated {} responses", len(rows))
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Batch update error for {len(records)} responses: {e}")
+            return False
+    
     async def get_response(self, response_id: str) -> Optional[Dict[str, Any]]:
         """
         Get response by ID
@@ -297,9 +740,9 @@ class Database:
             Response record or None if not found
         """
         try:
-            result = self.client.table('responses').select('*').eq(
+            result = await self._execute(self.client.table('responses').select(RESPONSE_COLUMNS).eq(
                 'id', response_id
-            ).execute()
+            ))
             
             if result.data and len(result.data) > 0:
                 return dict(result.data[0])  # type: ignore
@@ -317,25 +760,26 @@ class Database:
         cookies: List[Dict[str, Any]]
     ) -> bool:
         """
-        Save scraper session cookies to database
+        Queue scraper session cookies to be saved to database
+        
+        Repeated saves for the same AI source within one flush window
+        collapse into a single write.
         
         Args:
             ai_source: AI platform name
             cookies: List of browser cookies
             
         Returns:
-            True if successful
+            True if queued
         """
         try:
             # Upsert session (insert or update if exists)
-            result = self.client.table('scraper_sessions').upsert({
+            self._enqueue_write('session', ai_source, {
                 'ai_source': ai_source,
                 'cookies': cookies,
                 'is_logged_in': True,
                 'last_used_at': 'now()'
-            }).execute()
-            
-            logger.info(f"✅ Saved session for {ai_source}")
+            })
             return True
             
         except Exception as e:
@@ -353,17 +797,17 @@ class Database:
             List of cookies or None if not found
         """
         try:
-            result = self.client.table('scraper_sessions').select('cookies').eq(
+            result = await self._execute(self.client.table('scraper_sessions').select('cookies').eq(
                 'ai_source', ai_source
             ).eq(
                 'is_logged_in', True
-            ).execute()
+            ))
             
             if result.data and len(result.data) > 0:
-                logger.info(f"✅ Loaded session for {ai_source}")
+                logger.info("✅ Loaded session for {}", ai_source)
                 return result.data[0]['cookies'] # type: ignore
             else:
-                logger.info(f"ℹ️  No session found for {ai_source}")
+                logger.info("ℹ️  No session found for {}", ai_source)
                 return None
                 
         except Exception as e:
@@ -387,17 +831,11 @@ class Database:
             citations: List of citation dicts from LLM
         """
         try:
-            for citation in citations:
-                self.client.table('citations').insert({
-                    'response_id': response_id,
-                    'brand_name': brand_name,
-                    'url': citation['url'],
-                    'title': citation.get('title'),
-                    'domain': citation.get('domain', ''),
-                    'position': citation.get('position', 0)
-                }).execute()
+            await self._execute(self.client.table('citations').insert(
+                _citation_rows(response_id, brand_name, citations)
+            ))
             
-            logger.info(f"✅ Saved {len(citations)} citations for {brand_name}")
+            logger.info("✅ Saved {} citations for {}", len(citations), brand_name)
             return True
             
         except Exception as e:
@@ -419,23 +857,65 @@ class Database:
             mention_data: Dict with context, sentiment, keywords from LLM
         """
         try:
-            self.client.table('brand_mentions').insert({
-                'response_id': response_id,
-                'brand_name': brand_name,
-                'context': mention_data.get('context', ''),
-                'full_context': mention_data.get('context', ''),  # Use context for both fields
-                'position': 0,  # Can be calculated if needed
-                'sentiment': mention_data.get('sentiment', 'neutral'),
-                'keywords': mention_data.get('keywords', [])
-            }).execute()
+            await self._execute(self.client.table('brand_mentions').insert(
+                _mention_row(response_id, brand_name, mention_data)
+            ))
             
-            logger.info(f"✅ Saved mention context for {brand_name}")
+            logger.info("✅ Saved mention context for {}", brand_name)
             return True
             
         except Exception as e:
             logger.error(f"❌ Error saving brand mention: {e}")
             return False
     
+    async def save_extraction(self, response_id: str, brands: Dict[str, Dict]) -> bool:
+        """
+        Save every brand's citations and mention context for a response
+        
+        One bulk insert per table, both in flight at once - instead of two
+        round-trips per brand (plus one per citation).
+        
+        Args:
+            response_id: UUID of response
+            brands: Brand name -> extracted data (the 'brands' dict from LLMExtractor)
+            
+        Returns:
+            True if both tables were written, False if either insert failed
+        """
+        try:
+            citation_rows = []
+            mention_rows = []
+            for brand_name, brand_data in brands.items():
+                if brand_data.get('citations'):
+                    citation_rows.extend(_citation_rows(response_id, brand_name, brand_data['citations']))
+                mention_rows.append(_mention_row(response_id, brand_name, brand_data))
+            
+            if not mention_rows:
+                return True
+            
+            tables = ['brand_mentions']
+            inserts = [self._execute(self.client.table('brand_mentions').insert(mention_rows))]
+            if citation_rows:
+                tables.append('citations')
+                inserts.append(self._execute(self.client.table('citations').insert(citation_rows)))
+            results = await asyncio.gather(*inserts, return_exceptions=True)
+            
+            # The inserts are independent - one table can be written while the other failed
+            failed = False
+            for table, result in zip(tables, results):
+                if isinstance(result, Exception):
+                    logger.error(f"❌ Error saving {table} for response {response_id}: {result}")
+                    failed = True
+            if failed:
+                return False
+            
+            logger.info("✅ Saved {} citations and {} mention contexts", len(citation_rows), len(mention_rows))
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Error saving extraction: {e}")
+            return False
+    
     async def get_brand_citations(
         self, 
         brand_id: str, 
@@ -448,12 +928,11 @@ class Database:
             if not brand:
                 return []
             
-            result = self.client.table('brand_top_citations')\
+            result = await self._execute(self.client.table('brand_top_citations')\
                 .select('*')\
                 .eq('brand_id', brand_id)\
                 .order('citation_count', desc=True)\
-                .limit(limit)\
-                .execute()
+                .limit(limit))
             
             return result.data if result.data else []
             
@@ -473,12 +952,11 @@ class Database:
             if not brand:
                 return []
             
-            result = self.client.table('brand_mentions')\
+            result = await self._execute(self.client.table('brand_mentions')\
                 .select('*')\
                 .eq('brand_name', brand['name'])\
                 .order('created_at', desc=True)\
-                .limit(limit)\
-                .execute()
+                .limit(limit))
             
             return result.data if result.data else []
             
@@ -489,13 +967,7 @@ class Database:
     async def get_brand_sentiment(self, brand_id: str) -> Optional[Dict]:
         """Get sentiment breakdown for a brand"""
         try:
-            result = self.client.table('brand_sentiment_breakdown')\
-                .select('*')\
-                .eq('brand_id', brand_id)\
-                .single()\
-                .execute()
-            
-            return result.data if result.data else None
+            return await self._select_one('brand_sentiment_breakdown', '*', 'brand_id', brand_id)
             
         except Exception as e:
             logger.error(f"❌ Error fetching brand sentiment: {e}")
@@ -510,10 +982,9 @@ class Database:
                 return []
             
             # Get all keywords
-            result = self.client.table('brand_mentions')\
+            result = await self._execute(self.client.table('brand_mentions')\
                 .select('keywords')\
-                .eq('brand_name', brand['name'])\
-                .execute()
+                .eq('brand_name', brand['name']))
             
             # Flatten and count
             from collections import Counter
@@ -550,7 +1021,7 @@ class Database:
         Returns:
             List of visibility scores
         """
-        try:
+        async def fetch():
             if ai_source:
                 # Per-AI-source scores
                 query = self.client.table('brand_visibility_stats').select('*')
@@ -562,12 +1033,58 @@ class Database:
             if category_id:
                 query = query.eq('category_id', category_id)
             
-            result = query.order('visibility_score', desc=True).execute()
+            result = await self._execute(query.order('visibility_score', desc=True))
             return result.data if result.data else []
+        
+        try:
+            return await self._cached(
+                ('visibility_scores', category_id, ai_source),
+                fetch,
+                cache=self._stats_cache
+            )
         except Exception as e:
             logger.error(f"❌ Error fetching visibility scores: {e}")
             return []
     
+    async def get_responses_mentioning(
+        self,
+        brand_name: str,
+        category_id: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Get completed responses that mention a brand
+        
+        Matching runs in Postgres against the GIN index on brands_mentioned
+        (TEXT[] containment) instead of scanning rows in Python.
+        
+        Args:
+            brand_name: Brand name as stored in brands_mentioned
+            category_id: Optional category filter (via the response's prompt)
+            limit: Maximum number of responses to return
+            
+        Returns:
+            Most recent matching responses
+        """
+        try:
+            columns = RESPONSE_COLUMNS
+            if category_id:
+                columns += ', prompts!inner(category_id)'
+            
+            query = self.client.table('responses')\
+                .select(columns)\
+                .contains('brands_mentioned', [brand_name])\
+                .eq('status', 'completed')
+            
+            if category_id:
+                query = query.eq('prompts.category_id', category_id)
+            
+            result = await self._execute(query.order('created_at', desc=True).limit(limit))
+            return result.data if result.data else []
+        except Exception as e:
+            logger.error(f"❌ Error fetching responses mentioning {brand_name}: {e}")
+            return []
+    
     async def get_category_analytics(self, category_id: str) -> Optional[Dict[str, Any]]:
         """
         Get comprehensive analytics for a category
@@ -584,28 +1101,27 @@ class Database:
             if not category:
                 return None
             
-            # Get brands and prompts count
-            brands = await self.get_brands(category_id)
-            prompts = await self.get_prompts(category_id)
-            
-            # Get response counts
-            responses = self.client.table('responses')\
-                .select('id, ai_source, status')\
-                .in_('prompt_id', [p['id'] for p in prompts])\
-                .execute()
+            # Brands, prompts, response counts and top brands are independent - fetch concurrently
+            brands, prompts, stats_result, top_brands = await asyncio.gather(
+                self.get_brands(category_id),
+                self.get_prompts(category_id),
+                self._execute(self.client.rpc('get_category_response_stats', {
+                    'p_category_id': category_id
+                })),
+                self.get_visibility_scores(category_id)
+            )
             
-            total_responses = len(responses.data) if responses.data else 0
-            chatgpt_responses = len([r for r in (responses.data or []) if r['ai_source'] == 'chatgpt'])
-            gemini_responses = len([r for r in (responses.data or []) if r['ai_source'] == 'gemini'])
-            completed = len([r for r in (responses.data or []) if r['status'] == 'completed'])
+            # Counts are aggregated server-side (see performance_updates.sql)
+            stats = stats_result.data[0] if stats_result.data else {}
+            total_responses = stats.get('total_responses', 0)
+            chatgpt_responses = stats.get('chatgpt_responses', 0)
+            gemini_responses = stats.get('gemini_responses', 0)
+            completed = stats.get('completed_responses', 0)
             
             # Calculate completion rate
             expected_responses = len(prompts) * 2  # 2 AI sources
             completion_rate = (completed / expected_responses * 100) if expected_responses > 0 else 0
             
-            # Get top brands
-            top_brands = await self.get_visibility_scores(category_id)
-            
             return {
                 'category_id': category_id,
                 'category_name': category['name'],
@@ -2,27 +2,37 @@
 AI Visibility Tracker - FastAPI Scraping Service
 Main application entry point
 """
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from loguru import logger
 import sys
+import uuid
+import orjson
+from typing import Dict, List, Optional, Type
 from app.models.schemas import (
-    QueryRequest, QueryResponse, HealthResponse,
-    PromptScrapeRequest, Category, Brand, Prompt,
+    AISource, QueryRequest, QueryResponse, HealthResponse,
+    PromptScrapeRequest, PromptsScrapeRequest, BatchQueryResponse, Category, Brand, Prompt,
     VisibilityScore, CategoryAnalytics
 )
+from app.scrapers.base_scraper import BaseScraper
 from app.scrapers.chatgpt_scraper import ChatGPTScraper
 from app.scrapers.gemini_scraper import GeminiScraper
 from app.scrapers.perplexity_scraper import PerplexityScraper
+from app.scrapers.scraper_pool import ScraperPool
 from app.database import db
 from app.config import settings
+from app.utils.cors import CORSLite
+from app.utils.proxy_manager import proxy_manager
+from app.utils.responses import ORJSONResponse
 
 # Configure logging
 logger.remove()  # Remove default handler
 logger.add(
     sys.stdout,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-    level="INFO",
+    level=settings.LOG_LEVEL,
     colorize=True
 )
 logger.add(
@@ -30,35 +40,39 @@ logger.add(
     rotation="500 MB",
     retention="10 days",
     level="DEBUG",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}"
+    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
+    enqueue=True  # File writes happen on loguru's writer thread, not the event loop
 )
 
-# Initialize FastAPI application
-app = FastAPI(
-    title="AI Visibility Tracker - Scraping Service",
-    description="Python backend for browser automation and AI scraping with anti-detection",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
+# Scraper class per supported AI source - the single place to register a new one
+SCRAPER_CLASSES: Dict[str, Type[BaseScraper]] = {
+    'chatgpt': ChatGPTScraper,
+    'gemini': GeminiScraper,
+    'perplexity': PerplexityScraper,
+}
 
-# CORS middleware - allows Next.js frontend to call this API
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production: specify your Next.js URL
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Warm browser pools, built in lifespan startup
+# Key: ai_source, Value: ScraperPool
+scraper_pools: Dict[str, ScraperPool] = {}
+
+
+def build_health_body(scrapers: List[str]) -> bytes:
+    """Serialize the /health response (rebuilt only when pools change)"""
+    return HealthResponse(
+        status="healthy",
+        scrapers=scrapers,
+        environment=settings.ENVIRONMENT
+    ).model_dump_json().encode()
 
-# Global scraper instances (reused for performance)
-# Key: ai_source, Value: scraper instance
-scrapers = {}
 
+# Pre-serialized /health body
+health_body = build_health_body([])
 
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup"""
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build shared resources once on startup and tear them down on shutdown"""
+    global health_body
     logger.info("=" * 80)
     logger.info("🚀 Starting AI Visibility Tracker Scraping Service")
     logger.info("=" * 80)
@@ -68,46 +82,103 @@ async def startup_event():
     logger.info(f"⏱️  Rate limit delay: {settings.RATE_LIMIT_DELAY}s")
     logger.info(f"💾 Storage path: {settings.STORAGE_PATH}")
     logger.info(f"📝 Log path: {settings.LOG_PATH}")
-    logger.info("=" * 80)
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown"""
-    logger.info("=" * 80)
-    logger.info("👋 Shutting down scrapers...")
+    logger.info(f"🏊 Browser pool: {settings.BROWSER_POOL_SIZE} per source, recycled after {settings.BROWSER_POOL_RECYCLE_AFTER} queries")
     logger.info("=" * 80)
     
-    for source, scraper in scrapers.items():
-        try:
-            logger.info(f"Closing {source} scraper...")
-            await scraper.cleanup()
-        except Exception as e:
-            logger.error(f"Error cleaning up {source}: {e}")
+    try:
+        # Launch browsers now so requests only check one out
+        for source, scraper_class in SCRAPER_CLASSES.items():
+            pool = ScraperPool(
+                source,
+                scraper_class,
+                size=settings.BROWSER_POOL_SIZE,
+                recycle_after=settings.BROWSER_POOL_RECYCLE_AFTER
+            )
+            scraper_pools[source] = pool
+            await pool.start()
+        app.state.scraper_pools = scraper_pools
+        # Pools relaunch browsers on demand, so every built pool can serve requests
+        health_body = build_health_body(list(scraper_pools))
+        
+        yield
     
-    logger.info("✅ Shutdown complete")
+    finally:
+        logger.info("=" * 80)
+        logger.info("👋 Shutting down scrapers...")
+        logger.info("=" * 80)
+        
+        for source, pool in scraper_pools.items():
+            logger.info(f"Closing {source} scraper pool...")
+            await pool.close()
+        scraper_pools.clear()
+        health_body = build_health_body([])
+        proxy_manager.close()
+        
+        # Send any queued response/session writes before exiting
+        await db.flush_writes()
+        
+        logger.info("✅ Shutdown complete")
+        # Drain the enqueued file sink before the process exits
+        await logger.complete()
+
+
+# Initialize FastAPI application
+app = FastAPI(
+    title="AI Visibility Tracker - Scraping Service",
+    description="Python backend for browser automation and AI scraping with anti-detection",
+    version="1.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# CORS middleware - allows Next.js frontend to call this API
+# In production: restrict origins (swap back to CORSMiddleware with allow_origins=[...])
+app.add_middleware(CORSLite)
+
+# Compress larger JSON bodies (scrape results, analytics, score lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+def error_detail(error: Exception) -> str:
+    """Exception text for HTTP error bodies - hidden outside development"""
+    if settings.ENVIRONMENT == "development":
+        return str(error)
+    return "see server logs"
+
+
+async def _mark_failed(response_id: str, error: Exception):
+    """Mark a 'processing' response failed so it isn't left behind when a scrape errors"""
+    await db.update_response(
+        response_id=response_id,
+        response_text="",
+        brands_mentioned=[],
+        status='failed',
+        error_message=str(error)
+    )
+
+
+# Static service info, serialized once
+ROOT_BODY = orjson.dumps({
+    "service": "AI Visibility Tracker - Scraping Service",
+    "status": "running",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/health"
+})
 
 
 @app.get("/")
 async def root():
     """Root endpoint - service information"""
-    return {
-        "service": "AI Visibility Tracker - Scraping Service",
-        "status": "running",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    return HealthResponse(
-        status="healthy",
-        scrapers=list(scrapers.keys()),
-        environment=settings.ENVIRONMENT
-    )
+    return Response(content=health_body, media_type="application/json")
 
 
 @app.post("/scrape", response_model=QueryResponse)
@@ -138,19 +209,17 @@ async def scrape_endpoint(request: QueryRequest):
     }
     ```
     """
-    logger.info("\n" + "=" * 80)
-    logger.info(f"📥 NEW SCRAPE REQUEST")
-    logger.info(f"🤖 AI Source: {request.ai_source}")
-    logger.info(f"📝 Prompt: {request.prompt[:100]}{'...' if len(request.prompt) > 100 else ''}")
-    logger.info(f"🏷️  Tracking brands: {', '.join(request.brands)}")
-    logger.info("=" * 80)
+    logger.opt(lazy=True).info(
+        "📥 NEW SCRAPE REQUEST | 🤖 {} | 📝 {} | 🏷️  {}",
+        lambda: request.ai_source,
+        lambda: request.prompt[:100] + ('...' if len(request.prompt) > 100 else ''),
+        lambda: ', '.join(request.brands)
+    )
     
     try:
         # Create database record in 'processing' state
         # Note: For legacy endpoint, we create a response without linking to a prompt
         # The new /scrape/prompt endpoint should be used for proper tracking
-        logger.info("💾 Creating database record (legacy mode - no prompt_id)...")
-        
         # For backward compatibility, create a temporary prompt
         # In production, use /scrape/prompt endpoint instead
         temp_prompt = {
@@ -160,65 +229,34 @@ async def scrape_endpoint(request: QueryRequest):
         
         # Create response without prompt_id (will fail if schema enforces it)
         # We'll need to handle this differently
-        logger.warning("⚠️ Using legacy scrape endpoint - consider using /scrape/prompt instead")
+        logger.warning("⚠️ Legacy scrape endpoint - no database tracking, use /scrape/prompt instead")
         
         # Try to create response - this will fail with new schema that requires prompt_id
         # For now, skip database creation for legacy endpoint
         response_id = None
-        logger.warning("⚠️ Database storage skipped for legacy endpoint")
         
         # For legacy mode, still allow scraping but without database tracking
         # In production, this endpoint should be deprecated in favor of /scrape/prompt
         
-        # Get or create scraper instance
-        scraper = None
+        # Check out a warm scraper from the pool
+        pool = scraper_pools.get(request.ai_source)
+        if pool is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported AI source: {request.ai_source}"
+            )
         
         try:
-            # Check if we already have a scraper for this AI source
-            if request.ai_source not in scrapers:
-                logger.info(f"🔧 Creating new {request.ai_source} scraper instance...")
-                
-                if request.ai_source == 'chatgpt':
-                    scraper = ChatGPTScraper()
-                elif request.ai_source == 'gemini':
-                    scraper = GeminiScraper()
-                elif request.ai_source == 'perplexity':
-                    scraper = PerplexityScraper()
-                else:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Unsupported AI source: {request.ai_source}"
-                    )
-                
-                # Initialize the scraper
-                logger.info("🚀 Initializing scraper...")
-                success = await scraper.initialize()
-                
-                if not success:
-                    raise RuntimeError("Scraper initialization failed")
-                
-                # Cache the scraper for reuse
-                scrapers[request.ai_source] = scraper
-                logger.success(f"✅ {request.ai_source} scraper initialized and cached")
-            else:
-                # Reuse existing scraper
-                logger.info(f"♻️  Reusing existing {request.ai_source} scraper")
-                scraper = scrapers[request.ai_source]
-            
-            # Execute the query
-            logger.info("🔍 Executing query...")
-            result = await scraper.query(request.prompt, request.brands)
-            
-            # Skip database update for legacy endpoint
-            logger.warning("⚠️ Database update skipped - use /scrape/prompt for full tracking")
+            logger.debug("♻️  Checking out {} scraper ({} idle)", request.ai_source, pool.idle)
+            async with pool.checkout() as scraper:
+                # Execute the query
+                result = await scraper.query(request.prompt, request.brands)
             
-            logger.success("=" * 80)
-            logger.success("✅ SCRAPE REQUEST COMPLETED SUCCESSFULLY")
-            logger.success(f"📊 Response length: {len(result.text)} chars")
-            logger.success(f"🏷️  Brands found: {len(result.brands_mentioned)}")
-            logger.success("=" * 80 + "\n")
+            logger.success(
+                "✅ SCRAPE REQUEST COMPLETED | 📊 {} chars | 🏷️  {} brands found",
+                len(result.text), len(result.brands_mentioned)
+            )
             
-            import uuid
             return QueryResponse(
                 success=True,
                 data={
@@ -230,31 +268,13 @@ async def scrape_endpoint(request: QueryRequest):
                 }
             )
             
-        except HTTPException:
-            # Re-raise HTTP exceptions
-            raise
-            
         except Exception as scraper_error:
-            logger.error("=" * 80)
             logger.error(f"❌ SCRAPER ERROR: {scraper_error}")
-            logger.error("=" * 80)
-            
-            # Skip database update for legacy endpoint
-            logger.warning("⚠️ Database error tracking skipped for legacy endpoint")
-            
-            # Remove failed scraper from cache
-            if request.ai_source in scrapers:
-                try:
-                    logger.info(f"🧹 Cleaning up failed {request.ai_source} scraper...")
-                    await scrapers[request.ai_source].cleanup()
-                except:
-                    pass
-                del scrapers[request.ai_source]
-                logger.info(f"🗑️  Removed {request.ai_source} scraper from cache")
             
+            # The failed browser has already been recycled by the pool
             raise HTTPException(
                 status_code=500,
-                detail=f"Scraping failed: {str(scraper_error)}"
+                detail=f"Scraping failed: {error_detail(scraper_error)}"
             )
     
     except HTTPException:
@@ -262,10 +282,8 @@ async def scrape_endpoint(request: QueryRequest):
         raise
         
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+        logger.exception(f"❌ Unexpected error: {e}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {error_detail(e)}")
 
 
 @app.get("/responses/{response_id}")
@@ -487,55 +505,61 @@ async def scrape_prompt(request: PromptScrapeRequest):
     }
     ```
     """
-    logger.info("\n" + "=" * 80)
-    logger.info(f"📥 NEW PROMPT SCRAPE REQUEST")
-    logger.info(f"🆔 Prompt ID: {request.prompt_id}")
-    logger.info(f"🤖 AI Source: {request.ai_source}")
-    logger.info("=" * 80)
+    # Supabase filters and JSON bodies need the string form - format it once
+    prompt_id = str(request.prompt_id)
+    logger.info("📥 NEW PROMPT SCRAPE REQUEST | 🆔 {} | 🤖 {}", prompt_id, request.ai_source)
     
     try:
-        # Fetch prompt from database
-        prompt = await db.get_prompt(str(request.prompt_id))
+        # Fetch prompt and its category's brands in one query
+        prompt, brands = await db.get_prompt_with_brand_names(prompt_id)
         if not prompt:
             raise HTTPException(status_code=404, detail="Prompt not found")
         
-        # Get brands for this category
-        brands = await db.get_brand_names(prompt['category_id'])
         if not brands:
             raise HTTPException(status_code=400, detail="No brands found for this category")
         
-        logger.info(f"📝 Prompt: {prompt['text'][:100]}...")
-        logger.info(f"🏷️  Tracking {len(brands)} brands in category: {prompt['category_id']}")
+        logger.opt(lazy=True).debug(
+            "📝 Prompt: {}... | 🏷️  Tracking {} brands in category: {}",
+            lambda: prompt['text'][:100], lambda: len(brands), lambda: prompt['category_id']
+        )
         
-        # Create database record
-        logger.info("💾 Creating database record...")
-        response_record = await db.create_response(
-            prompt_id=str(request.prompt_id),
-            prompt_text=prompt['text'],
-            ai_source=request.ai_source
+        pool = scraper_pools.get(request.ai_source)
+        if pool is None:
+            raise HTTPException(status_code=400, detail=f"Unsupported AI source: {request.ai_source}")
+        
+        # Create the 'processing' record while waiting for a pooled browser
+        response_record, scraper = await asyncio.gather(
+            db.create_response(
+                prompt_id=prompt_id,
+                prompt_text=prompt['text'],
+                ai_source=request.ai_source
+            ),
+            pool.acquire(),
+            return_exceptions=True
         )
         
-        if not response_record:
+        if isinstance(scraper, BaseException):
+            if response_record and not isinstance(response_record, BaseException):
+                await _mark_failed(response_record['id'], scraper)
+            raise scraper
+        
+        if not response_record or isinstance(response_record, BaseException):
+            pool.release(scraper)
             raise HTTPException(status_code=500, detail="Database error creating record")
         
         response_id = response_record['id']
-        logger.info(f"✅ Record created with ID: {response_id}")
-        
-        # Create fresh scraper instance (will be auto-cleaned after query)
-        logger.info(f"🔧 Creating fresh {request.ai_source} scraper instance...")
-        
-        if request.ai_source == 'chatgpt':
-            scraper = ChatGPTScraper()
-        elif request.ai_source == 'gemini':
-            scraper = GeminiScraper()
-        elif request.ai_source == 'perplexity':
-            scraper = PerplexityScraper()
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported AI source: {request.ai_source}")
         
-        # Execute query with fresh browser (opens, queries, closes)
-        logger.info("🔍 Executing query with fresh browser...")
-        result = await scraper.query_with_fresh_browser(prompt['text'], brands)
+        # Browser is recycled by the pool after N uses or on error
+        logger.debug("🔍 Executing query on pooled {} browser ({} idle)", request.ai_source, pool.idle)
+        healthy = False
+        try:
+            result = await scraper.query(prompt['text'], brands)
+            healthy = True
+        except Exception as e:
+            await _mark_failed(response_id, e)
+            raise
+        finally:
+            pool.release(scraper, healthy)
         
         # Update database
         await db.update_response(
@@ -546,13 +570,13 @@ async def scrape_prompt(request: PromptScrapeRequest):
             raw_html=result.raw_html
         )
         
-        logger.success("✅ PROMPT SCRAPE COMPLETED")
+        logger.success("✅ PROMPT SCRAPE COMPLETED | 🆔 {} | 🏷️  {} brands found", response_id, len(result.brands_mentioned))
         
         return QueryResponse(
             success=True,
             data={
                 "id": response_id,
-                "prompt_id": str(request.prompt_id),
+                "prompt_id": prompt_id,
                 "prompt": prompt['text'],
                 "ai_source": request.ai_source,
                 "response": result.text,
@@ -563,20 +587,136 @@ async def scrape_prompt(request: PromptScrapeRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception(f"❌ Error: {e}")
+        raise HTTPException(status_code=500, detail=error_detail(e))
+
+
+@app.post("/scrape/prompts", response_model=BatchQueryResponse)
+async def scrape_prompts(request: PromptsScrapeRequest):
+    """
+    Scrape several prompts across the pooled browsers
+    
+    Prompts are fetched with one query, brands are looked up once per category,
+    all response records are created with one insert and all results are
+    written with one upsert. Up to BROWSER_POOL_SIZE prompts run at once.
+    
+    Request body:
+    ```json
+    {
+        "prompt_ids": ["550e8400-e29b-41d4-a716-446655440000", "..."],
+        "ai_source": "chatgpt"
+    }
+    ```
+    """
+    # Keep request order, drop duplicates
+    prompt_ids = list(dict.fromkeys(str(prompt_id) for prompt_id in request.prompt_ids))
+    logger.info("📥 NEW BATCH SCRAPE REQUEST | {} prompts | 🤖 {}", len(prompt_ids), request.ai_source)
+    
+    try:
+        pool = scraper_pools.get(request.ai_source)
+        if pool is None:
+            raise HTTPException(status_code=400, detail=f"Unsupported AI source: {request.ai_source}")
+        
+        found = {prompt['id']: prompt for prompt in await db.get_prompts_by_ids(prompt_ids)}
+        errors = {prompt_id: "Prompt not found" for prompt_id in prompt_ids if prompt_id not in found}
+        prompts = [found[prompt_id] for prompt_id in prompt_ids if prompt_id in found]
+        if not prompts:
+            raise HTTPException(status_code=404, detail="Prompts not found")
+        
+        # Brand names once per category (cached in the db layer)
+        category_ids = list({prompt['category_id'] for prompt in prompts})
+        brand_lists = await asyncio.gather(*(db.get_brand_names(category_id) for category_id in category_ids))
+        brands_by_category = dict(zip(category_ids, brand_lists))
+        
+        for prompt in prompts:
+            if not brands_by_category[prompt['category_id']]:
+                errors[prompt['id']] = "No brands found for this category"
+        prompts = [prompt for prompt in prompts if prompt['id'] not in errors]
+        if not prompts:
+            raise HTTPException(status_code=400, detail="No brands found for these categories")
+        
+        records = await db.create_responses_batch([
+            {'prompt_id': prompt['id'], 'prompt_text': prompt['text'], 'ai_source': request.ai_source}
+            for prompt in prompts
+        ])
+        if len(records) != len(prompts):
+            raise HTTPException(status_code=500, detail="Database error creating records")
+        
+        # Prompts run in parallel across the pooled browsers
+        results = await pool.query_batch([
+            (prompt['text'], brands_by_category[prompt['category_id']]) for prompt in prompts
+        ])
+        
+        # Insert order matches prompt order
+        updates = []
+        data = []
+        for record, prompt, result in zip(records, prompts, results):
+            row = {
+                'id': record['id'],
+                'prompt_id': prompt['id'],
+                'prompt_text': prompt['text'],
+                'ai_source': request.ai_source
+            }
+            if isinstance(result, Exception):
+                logger.error(f"❌ Prompt {prompt['id']} failed: {result}")
+                errors[prompt['id']] = error_detail(result)
+                row.update(response_text='', brands_mentioned=[], status='failed', error_message=str(result))
+            else:
+                row.update(
+                    response_text=result.text,
+                    brands_mentioned=result.brands_mentioned,
+                    status='completed',
+                    raw_html=result.raw_html
+                )
+                data.append({
+                    "id": record['id'],
+                    "prompt_id": prompt['id'],
+                    "prompt": prompt['text'],
+                    "ai_source": request.ai_source,
+                    "response": result.text,
+                    "brands_mentioned": result.brands_mentioned
+                })
+            updates.append(row)
+        
+        if not await db.update_responses_batch(updates):
+            # Don't leave the rows 'processing' - queue them one by one on the write-behind path
+            logger.warning("⚠️ Batch update failed, falling back to per-response updates")
+            await asyncio.gather(*(
+                db.update_response(
+                    response_id=row['id'],
+                    response_text=row['response_text'],
+                    brands_mentioned=row['brands_mentioned'],
+                    status=row['status'],
+                    error_message=row.get('error_message'),
+                    raw_html=row.get('raw_html')
+                )
+                for row in updates
+            ))
+        
+        logger.success("✅ BATCH SCRAPE COMPLETED | {} ok | {} failed", len(data), len(errors))
+        
+        return BatchQueryResponse(success=bool(data), data=data, errors=errors)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"❌ Error: {e}")
+        raise HTTPException(status_code=500, detail=error_detail(e))
 
 
 @app.get("/visibility/scores")
-async def get_visibility_scores(category_id: str = None, ai_source: str = None): # type: ignore
+async def get_visibility_scores(
+    category_id: Optional[str] = Query(None, min_length=1, max_length=100),
+    ai_source: Optional[AISource] = None
+):
     """
     Get brand visibility scores
     
+    Invalid filters are rejected with 422 before reaching the database.
+    
     Query Parameters:
-        category_id: Filter by category (optional)
-        ai_source: Filter by AI source - chatgpt/gemini (optional, if None returns combined)
+        category_id: Filter by category (optional, categories.id is VARCHAR(100))
+        ai_source: Filter by AI source - chatgpt/gemini/perplexity (optional, if None returns combined)
     """
     logger.info(f"📊 Fetching visibility scores (category={category_id}, ai_source={ai_source})")
     scores = await db.get_visibility_scores(category_id, ai_source)
@@ -586,11 +726,19 @@ async def get_visibility_scores(category_id: str = None, ai_source: str = None):
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info("Starting server with uvicorn...")
+    # uvloop is much cheaper per await than the default loop; it has no Windows build
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    
+    logger.info(f"Starting server with uvicorn ({loop} event loop)...")
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.ENVIRONMENT == "development",
-        log_level="info"
+        log_level="info",
+        loop=loop
     )
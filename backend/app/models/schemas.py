@@ -1,12 +1,16 @@
 """
 Pydantic models for API request/response validation
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, List, Literal, Optional
 from datetime import datetime
 from uuid import UUID
 
 
+# Supported AI platforms - validated as a literal set, not a regex
+AISource = Literal["chatgpt", "gemini", "perplexity"]
+
+
 # ============= Category Models =============
 
 class CategoryBase(BaseModel):
@@ -21,8 +25,7 @@ class Category(CategoryBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class CategoryWithCounts(Category):
@@ -44,8 +47,7 @@ class Brand(BrandBase):
     id: UUID
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class BrandWithStats(Brand):
@@ -70,8 +72,7 @@ class Prompt(PromptBase):
     id: UUID
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class PromptWithStatus(Prompt):
@@ -86,40 +87,83 @@ class PromptWithStatus(Prompt):
 class QueryRequest(BaseModel):
     """Request model for scraping endpoint"""
     prompt: str = Field(..., min_length=1, max_length=1000, description="The query to send to AI platform")
-    brands: List[str] = Field(..., min_items=1, max_items=20, description="List of brands to track") # type: ignore
-    ai_source: str = Field(..., pattern="^(chatgpt|gemini|perplexity)$", description="AI platform to query")
+    brands: List[str] = Field(..., min_length=1, max_length=20, description="List of brands to track")
+    ai_source: AISource = Field(..., description="AI platform to query")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "prompt": "What's the best CRM software for startups?",
                 "brands": ["Salesforce", "HubSpot", "Pipedrive", "Zoho"],
                 "ai_source": "chatgpt"
             }
         }
+    )
 
 
 class PromptScrapeRequest(BaseModel):
     """Request to scrape a specific prompt by ID"""
     prompt_id: UUID
-    ai_source: str = Field(..., pattern="^(chatgpt|gemini|perplexity)$")
+    ai_source: AISource
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "prompt_id": "550e8400-e29b-41d4-a716-446655440000",
                 "ai_source": "chatgpt"
             }
         }
+    )
+
+
+class ScrapeResult(BaseModel):
+    """Scraped answer returned by the scraping endpoints"""
+    model_config = ConfigDict(frozen=True)
+    
+    id: str
+    prompt_id: Optional[str] = None  # None for the legacy /scrape endpoint
+    prompt: str
+    ai_source: str
+    response: str
+    brands_mentioned: List[str] = []
 
 
 class QueryResponse(BaseModel):
     """Response model for scraping endpoint"""
+    model_config = ConfigDict(frozen=True)
+    
     success: bool
-    data: Optional[dict] = None
+    data: Optional[ScrapeResult] = None
     error: Optional[str] = None
 
 
+class PromptsScrapeRequest(BaseModel):
+    """Request to scrape several prompts in one browser session"""
+    prompt_ids: List[UUID] = Field(..., min_length=1, max_length=10, description="Prompts to scrape, in order")
+    ai_source: AISource
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "prompt_ids": [
+                    "550e8400-e29b-41d4-a716-446655440000",
+                    "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
+                ],
+                "ai_source": "chatgpt"
+            }
+        }
+    )
+
+
+class BatchQueryResponse(BaseModel):
+    """Response model for the batch scraping endpoint"""
+    model_config = ConfigDict(frozen=True)
+    
+    success: bool
+    data: List[ScrapeResult] = []
+    errors: Dict[str, str] = {}  # prompt_id -> error message
+
+
 class ResponseData(BaseModel):
     """Detailed response data from database"""
     id: UUID
@@ -133,14 +177,15 @@ class ResponseData(BaseModel):
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============= Analytics Models =============
 
 class VisibilityScore(BaseModel):
     """Visibility score for a brand in a category"""
+    model_config = ConfigDict(frozen=True)
+    
     brand_id: UUID
     brand_name: str
     category_id: str
@@ -153,6 +198,8 @@ class VisibilityScore(BaseModel):
 
 class CategoryAnalytics(BaseModel):
     """Analytics for an entire category"""
+    model_config = ConfigDict(frozen=True)
+    
     category_id: str
     category_name: str
     total_brands: int
@@ -179,14 +226,16 @@ class WorkerStatus(BaseModel):
 
 class WorkerControl(BaseModel):
     """Worker control request"""
-    action: str = Field(..., pattern="^(start|stop|restart)$")
-    ai_source: Optional[str] = Field(None, pattern="^(chatgpt|gemini|all)$")
+    action: Literal["start", "stop", "restart"]
+    ai_source: Optional[Literal["chatgpt", "gemini", "all"]] = None
 
 
 # ============= Health Models =============
 
 class HealthResponse(BaseModel):
     """Health check response"""
+    model_config = ConfigDict(frozen=True)
+    
     status: str
     scrapers: List[str] = []
     environment: str
@@ -4,25 +4,200 @@ Base scraper class with anti-detection capabilities and shared browser logic
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 import undetected_chromedriver as uc
+from selenium.webdriver import ChromeOptions, Remote
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    JavascriptException, TimeoutException, NoSuchElementException, WebDriverException
+)
+import asyncio
+import base64
 import time
 import random
-import json
 import os
 import re
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import orjson
 from loguru import logger
 from app.config import settings
 from app.database import db
+from app.utils.brand_matcher import BrandMatcher, brand_variations
 from app.utils.proxy_manager import proxy_manager
 
 
+# Browser identity - keep the UA and Client Hints in step so neither leaks "HeadlessChrome"
+CHROME_MAJOR_VERSION = "144"
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) '
+    f'Chrome/{CHROME_MAJOR_VERSION}.0.0.0 Safari/537.36'
+)
+USER_AGENT_METADATA = {
+    "brands": [
+        {"brand": "Chromium", "version": CHROME_MAJOR_VERSION},
+        {"brand": "Google Chrome", "version": CHROME_MAJOR_VERSION},
+        {"brand": "Not=A?Brand", "version": "24"},
+    ],
+    "fullVersion": f"{CHROME_MAJOR_VERSION}.0.0.0",
+    "platform": "Windows",
+    "platformVersion": "10.0.0",
+    "architecture": "x86",
+    "model": "",
+    "mobile": False,
+}
+
+# Connections kept open to chromedriver (query thread + headroom for concurrent calls)
+DRIVER_POOL_MAXSIZE = 4
+
+# Distinct brand sets kept compiled before the cache is reset
+BRAND_MATCHER_CACHE_SIZE = 64
+
+# Resolves with the first element matching a selector as soon as the DOM has it,
+# instead of Selenium re-querying over HTTP every 500ms
+WAIT_FOR_SELECTOR_JS = """
+const [selector, clickable, timeoutMs, done] = arguments;
+const ready = () => {
+    const el = document.querySelector(selector);
+    if (!el) return null;
+    if (clickable && (el.disabled || !el.getClientRects().length)) return null;
+    return el;
+};
+const found = ready();
+if (found) { done(found); return; }
+const observer = new MutationObserver(() => {
+    const el = ready();
+    if (el) { observer.disconnect(); clearTimeout(timer); done(el); }
+});
+const timer = setTimeout(() => { observer.disconnect(); done(null); }, timeoutMs);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+"""
+
+# Shared threads for blocking Selenium calls: one per pooled browser of each
+# AI source, plus headroom for launches and warm-driver returns
+DRIVER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=3 * settings.BROWSER_POOL_SIZE + 4,
+    thread_name_prefix="selenium"
+)
+_LAUNCH_LOCK = threading.Lock()
+
+# Seconds between performance-log reads while waiting for a reply stream to end
+STREAM_POLL_INTERVAL = 0.25
+
+# Resolves true as soon as __CONDITION__ (a JS function body) holds, re-checking on
+# every DOM mutation, or false after the timeout - one WebDriver call per wait
+WAIT_UNTIL_JS = """
+const timeoutMs = arguments[0];
+const args = Array.prototype.slice.call(arguments, 1, -1);
+const done = arguments[arguments.length - 1];
+const ready = () => {
+    try { return Boolean((() => { __CONDITION__ })()); } catch (e) { return false; }
+};
+if (ready()) { done(true); return; }
+const observer = new MutationObserver(() => {
+    if (ready()) { observer.disconnect(); clearTimeout(timer); done(true); }
+});
+const timer = setTimeout(() => { observer.disconnect(); done(false); }, timeoutMs);
+observer.observe(document.body, {childList: true, subtree: true, attributes: true, characterData: true});
+"""
+
+# Defines markdownToText(root): response markdown as plain text with link URLs kept.
+# innerText is the browser's own rendering of the text (blocks and <br> already
+# become newlines), so no clone or rewrite of the response DOM is needed.
+# Registered once per browser (see _install_page_helpers) rather than sent with every extraction.
+MARKDOWN_TO_TEXT_JS = """
+function markdownToText(root) {
+    const text = root.innerText || root.textContent || '';
+    
+    // Put each link's URL after its text, in document order: "link text (URL)"
+    let out = '';
+    let cursor = 0;
+    for (const link of root.getElementsByTagName('a')) {
+        const href = link.getAttribute('href');
+        const label = link.innerText || link.textContent || '';
+        if (!href || !label) continue;
+        const at = text.indexOf(label, cursor);
+        if (at === -1) continue;
+        out += text.slice(cursor, at + label.length) + ` (${href})`;
+        cursor = at + label.length;
+    }
+    out += text.slice(cursor);
+    
+    // Clean up multiple newlines
+    return out.replace(/\\n{3,}/g, '\\n\\n').trim();
+}
+"""
+
+# Manual login: seconds to let the page settle, longest wait, and re-check interval
+LOGIN_GRACE_SECONDS = 5
+LOGIN_WAIT_SECONDS = 180
+LOGIN_POLL_INTERVAL = 2
+
+# Longest single observer wait - stays under chromedriver's default 30s script timeout
+WAIT_SLICE_SECONDS = 25
+
+# Chrome executables tried on Linux/macOS when detecting the installed version
+CHROME_BINARIES = [
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+
+
+@lru_cache(maxsize=1)
+def detect_chrome_major() -> Optional[int]:
+    """
+    Detect the installed Chrome major version once per process
+    
+    Every browser launch needs it. Windows reads the registry in-process;
+    Linux/macOS run the Chrome binary with --version.
+    
+    Returns:
+        Major version, or None if it could not be detected
+    """
+    try:
+        if sys.platform == 'win32':
+            import winreg
+            # Read Chrome's own version key in-process instead of spawning 'reg query'
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Software\Google\Chrome\BLBeacon') as key:
+                version, _ = winreg.QueryValueEx(key, 'version')
+            match = re.match(r'(\d+)', str(version))
+        else:
+            binary = next((path for path in map(shutil.which, CHROME_BINARIES) if path), None)
+            if binary is None:
+                return None
+            result = subprocess.run([binary, '--version'], capture_output=True, text=True, timeout=5)
+            match = re.search(r'(\d+)\.\d+', result.stdout)
+        
+        if match:
+            chrome_version = int(match.group(1))
+            logger.info(f"🔍 Detected Chrome version: {chrome_version}")
+            return chrome_version
+    except Exception as e:
+        logger.debug(f"Could not detect Chrome version: {e}")
+    return None
+
+
+# Subresources the scraper never needs - only response text is read
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf',
+    '*.mp4', '*.webm', '*.mp3',
+    '*/analytics/*', '*doubleclick*', '*googletagmanager*',
+]
+
+
 class ScraperResponse:
     """Response from AI scraper containing text and brand mentions"""
     
+    __slots__ = ("text", "brands_mentioned", "raw_html", "citations")
+    
     def __init__(
         self,
         text: str,
@@ -36,12 +211,35 @@ class ScraperResponse:
         self.citations = citations or []
 
 
+_dirs_ready = False
+
+
+def _ensure_dirs():
+    """Create the storage and log directories once per process"""
+    global _dirs_ready
+    if not _dirs_ready:
+        os.makedirs(settings.STORAGE_PATH, exist_ok=True)
+        os.makedirs(settings.LOG_PATH, exist_ok=True)
+        _dirs_ready = True
+
+
+class _AttachedDriver(Remote):
+    """Remote driver bound to an existing WebDriver session instead of starting one"""
+    
+    def __init__(self, executor_url: str, session_id: str):
+        self._existing_session_id = session_id
+        super().__init__(command_executor=executor_url, options=ChromeOptions())
+    
+    def start_session(self, capabilities: dict) -> None:
+        self.session_id = self._existing_session_id
+
+
 class BaseScraper(ABC):
     """
     Base class for all AI scrapers with anti-detection features
     
     Features:
-    - Fresh browser per query
+    - Warm browser pool per AI source (fresh conversation per query)
     - Cookie persistence
     - Random delays to mimic human behavior
     - Rate limiting
@@ -55,6 +253,14 @@ class BaseScraper(ABC):
     INPUT_SELECTOR: str = ""  # Selector for text input
     SEND_BUTTON_SELECTOR: str = ""  # Selector for send button
     RESPONSE_SELECTOR: str = ""  # Selector for response content
+    STREAM_URL_HINT: str = ""  # URL fragment of the streaming reply request (besides text/event-stream)
+    
+    # Warm drivers reused by query_with_fresh_browser, per AI source, for the process lifetime
+    _driver_pools: Dict[str, asyncio.Queue] = {}
+    _return_tasks: set = set()
+    
+    # Compiled brand matchers keyed by (scraper class, brand set)
+    _brand_matchers: Dict[tuple, BrandMatcher] = {}
     
     def __init__(self, ai_source: str):
         """
@@ -65,69 +271,65 @@ class BaseScraper(ABC):
         """
         self.ai_source = ai_source
         self.driver = None
+        self._proxy_port: Optional[int] = None  # Leased in _setup_proxy, moves to the driver at launch
+        # Set when a query is cancelled - a launch still running in its driver thread quits its own browser
+        self._abandoned = False
+        self._driver_lock = threading.Lock()
         self.cookies_path = os.path.join(
             settings.STORAGE_PATH,
             f"{ai_source}_cookies.json"
         )
+        self.session_path = os.path.join(
+            settings.STORAGE_PATH,
+            f"{ai_source}_session.json"
+        )
         self.last_request_time = 0
-        self._screenshot_thread = None
-        self._stop_screenshots = False
-        self._screenshot_dir = None
         
         # Ensure storage directory exists
-        os.makedirs(settings.STORAGE_PATH, exist_ok=True)
-        os.makedirs(settings.LOG_PATH, exist_ok=True)
+        _ensure_dirs()
     
     # ==================== BROWSER MANAGEMENT ====================
     
-    def _start_screenshot_capture(self, interval: int = 2):
-        """Start background thread to capture screenshots for debugging"""
-        import threading
-        from datetime import datetime
-        
-        def capture_screenshots():
-            screenshot_num = 0
-            while not self._stop_screenshots and self.driver:
-                try:
-                    screenshot_num += 1
-                    timestamp = datetime.now().strftime("%H%M%S")
-                    filename = f"debug_{screenshot_num:03d}_{timestamp}.png"
-                    filepath = os.path.join(self._screenshot_dir, filename)
-                    self.driver.save_screenshot(filepath)
-                    logger.debug(f"📸 Screenshot saved: {filename}")
-                except Exception as e:
-                    logger.debug(f"Screenshot error: {e}")
-                time.sleep(interval)
-        
-        if settings.HEADLESS:  # Only in headless mode
+    def capture_debug(self, name: str):
+        """
+        Save a JPEG screenshot of the current page for debugging (failure paths only)
+        
+        Chrome encodes the image via CDP, so this costs one call instead of a
+        background thread streaming PNGs for the whole session. Headless only -
+        in visible mode the page is on screen.
+        
+        Args:
+            name: Short label used in the file name (e.g. "query_timeout")
+        """
+        if not self.driver or not settings.HEADLESS:
+            return
+        
+        try:
             from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self._screenshot_dir = os.path.join(
-                settings.STORAGE_PATH, 
-                "debug", 
-                self.ai_source, 
-                timestamp
+            shot = self.driver.execute_cdp_cmd(
+                "Page.captureScreenshot",
+                {"format": "jpeg", "quality": 40}
             )
-            os.makedirs(self._screenshot_dir, exist_ok=True)
-            
-            self._stop_screenshots = False
-            self._screenshot_thread = threading.Thread(target=capture_screenshots, daemon=True)
-            self._screenshot_thread.start()
-            logger.info(f"📸 Screenshot capture started: {self._screenshot_dir}")
-    
-    def _stop_screenshot_capture(self):
-        """Stop background screenshot capture"""
-        self._stop_screenshots = True
-        if self._screenshot_thread:
-            self._screenshot_thread.join(timeout=2)
-            logger.info("📸 Screenshot capture stopped")
+            debug_dir = os.path.join(settings.STORAGE_PATH, "debug", self.ai_source)
+            os.makedirs(debug_dir, exist_ok=True)
+            filepath = os.path.join(
+                debug_dir,
+                f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{name}.jpg"
+            )
+            with open(filepath, 'wb') as f:
+                f.write(base64.b64decode(shot['data']))
+            logger.info(f"📸 Debug screenshot saved: {filepath}")
+        except Exception as e:
+            logger.debug(f"Screenshot error: {e}")
     
-    async def initialize(self, load_cookies: bool = True) -> bool:
+    async def initialize(self, load_cookies: bool = True, allow_manual_login: bool = True) -> bool:
         """
         Initialize scraper with undetected Chrome browser
         
         Args:
             load_cookies: Whether to load saved cookies (default: True)
+            allow_manual_login: Wait for a manual login if the saved cookies don't
+                log in (False fails right away, e.g. for headless pool startup)
         
         Returns:
             True if successful, False otherwise
@@ -136,71 +338,29 @@ class BaseScraper(ABC):
             logger.info(f"🚀 Initializing {self.ai_source} scraper with undetected-chromedriver...")
             
             # Validate proxy configuration
-            if not self._setup_proxy():
+            if not await self._setup_proxy():
                 return False
             
             # Configure and launch browser
             options = self._get_chrome_options()
             
-            logger.info("🌐 Launching Chrome browser...")
-            # Launch browser with proper headless handling
-            try:
-                # Detect Chrome version to avoid mismatches
-                chrome_version = None
-                try:
-                    import re
-                    import subprocess
-                    result = subprocess.run(
-                        ['reg', 'query', 'HKEY_CURRENT_USER\\Software\\Google\\Chrome\\BLBeacon', '/v', 'version'],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    if result.returncode == 0:
-                        match = re.search(r'version\s+REG_SZ\s+(\d+)', result.stdout)
-                        if match:
-                            chrome_version = int(match.group(1))
-                            logger.info(f"🔍 Detected Chrome version: {chrome_version}")
-                except Exception as e:
-                    logger.debug(f"Could not detect Chrome version: {e}")
-                
-                # Launch with version if detected
-                if settings.HEADLESS:
-                    logger.info("🕶️ Launching in headless mode...")
-                    if chrome_version:
-                        self.driver = uc.Chrome(options=options, version_main=chrome_version, use_subprocess=False)
-                    else:
-                        self.driver = uc.Chrome(options=options, use_subprocess=False)
-                else:
-                    logger.info("👁️ Launching in visible mode...")
-                    if chrome_version:
-                        self.driver = uc.Chrome(options=options, version_main=chrome_version)
-                    else:
-                        self.driver = uc.Chrome(options=options)
-                        
-            except Exception as uc_error:
-                logger.error(f"❌ Failed to launch with undetected-chromedriver: {uc_error}")
-                logger.info("⚙️ Trying standard ChromeDriver as fallback...")
-                from selenium import webdriver
-                service = webdriver.ChromeService()
-                self.driver = webdriver.Chrome(service=service, options=options)
-            
-            logger.success("✅ Browser launched successfully!")
-            
-            # Start screenshot capture for debugging (headless only)
-            self._start_screenshot_capture(interval=5)
-            
-            # Navigate to AI platform
-            logger.info(f"🌐 Navigating to {self.URL}...")
-            self.driver.get(self.URL)
-            self.random_delay(3, 5)
+            # Launch off the event loop so other scrapers keep working meanwhile
+            await self._in_driver_thread(self._launch_browser, options)
+            await self.async_random_delay(3, 5)
             
             # Load cookies if available
             if load_cookies:
-                self._load_and_apply_cookies()
+                await self._load_and_apply_cookies()
             
             # Check login status
             is_logged_in = await self.check_login_status()
             
-            if not is_logged_in and load_cookies:
+            if not is_logged_in and load_cookies and not allow_manual_login:
+                logger.error(
+                    f"❌ Not logged in to {self.ai_source} - run setup_{self.ai_source}_login.py to refresh the session"
+                )
+                return False
+            elif not is_logged_in and load_cookies:
                 await self._handle_manual_login()
                 is_logged_in = await self.check_login_status()
                 if not is_logged_in:
@@ -209,16 +369,166 @@ class BaseScraper(ABC):
             elif is_logged_in:
                 logger.success(f"✅ Already logged in to {self.ai_source}!")
             
+            if settings.ENVIRONMENT == 'development':
+                self._save_session_handle()
+            
             logger.success(f"🎉 {self.ai_source} scraper initialized successfully!")
             return True
             
         except Exception as e:
-            logger.error(f"❌ Initialization failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Initialization failed: {e}")
+            await self._in_driver_thread(self.capture_debug, "init_failed")
+            # Browser never started - the leased proxy port is free again
+            proxy_manager.release_port(self._proxy_port)
+            self._proxy_port = None
             return False
     
-    def _setup_proxy(self) -> bool:
+    def _launch_browser(self, options: uc.ChromeOptions):
+        """Start Chrome and open the platform (blocking - runs in a driver thread)"""
+        logger.info("🌐 Launching Chrome browser...")
+        # One launch at a time - concurrent launches race on patching chromedriver
+        with _LAUNCH_LOCK:
+            self._start_chrome(options)
+        
+        with self._driver_lock:
+            abandoned = self._abandoned
+            if abandoned:
+                driver, self.driver = self.driver, None
+            else:
+                # The proxy lease now lives as long as this browser (released in _quit_driver/cleanup)
+                self.driver.proxy_port, self._proxy_port = self._proxy_port, None
+        
+        if abandoned:
+            # The query was cancelled while Chrome was starting - nobody will use this browser
+            if driver is not None:
+                self._quit_driver(driver)
+            raise RuntimeError("Browser launch abandoned")
+        
+        logger.success("✅ Browser launched successfully!")
+        
+        # Scrub headless tokens before the first navigation
+        self._apply_identity_overrides()
+        self._install_page_helpers()
+        self._tune_driver_connection()
+        self._apply_network_rules()
+        
+        # Navigate to AI platform
+        logger.info(f"🌐 Navigating to {self.URL}...")
+        self.driver.get(self.URL)
+    
+    def _start_chrome(self, options: uc.ChromeOptions):
+        """Create the driver with proper headless handling"""
+        try:
+            # Detect Chrome version to avoid mismatches (cached per process)
+            chrome_version = detect_chrome_major()
+            
+            # Launch with version if detected
+            if settings.HEADLESS:
+                logger.info("🕶️ Launching in headless mode...")
+                if chrome_version:
+                    self.driver = uc.Chrome(options=options, version_main=chrome_version, use_subprocess=False)
+                else:
+                    self.driver = uc.Chrome(options=options, use_subprocess=False)
+            else:
+                logger.info("👁️ Launching in visible mode...")
+                if chrome_version:
+                    self.driver = uc.Chrome(options=options, version_main=chrome_version)
+                else:
+                    self.driver = uc.Chrome(options=options)
+                    
+        except Exception as uc_error:
+            logger.error(f"❌ Failed to launch with undetected-chromedriver: {uc_error}")
+            logger.info("⚙️ Trying standard ChromeDriver as fallback...")
+            from selenium import webdriver
+            service = webdriver.ChromeService()
+            self.driver = webdriver.Chrome(service=service, options=options)
+    
+    @staticmethod
+    async def _in_driver_thread(func, *args):
+        """Run a blocking Selenium call on the shared driver thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(DRIVER_EXECUTOR, func, *args)
+    
+    def _apply_identity_overrides(self):
+        """
+        Align User-Agent and sec-ch-ua Client Hints and hide navigator.webdriver
+        
+        Headless Chrome still reports "HeadlessChrome" in Client Hints even with a
+        custom UA flag, which gets pages soft-blocked into slow timeouts.
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.setUserAgentOverride", {
+                "userAgent": USER_AGENT,
+                "userAgentMetadata": USER_AGENT_METADATA
+            })
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+            })
+        except Exception as e:
+            logger.warning(f"⚠️  Could not apply browser identity overrides: {e}")
+    
+    def _install_page_helpers(self):
+        """Define the shared extraction JS (markdownToText) in every document the browser loads"""
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": MARKDOWN_TO_TEXT_JS
+            })
+        except Exception as e:
+            logger.warning(f"⚠️  Could not install page helpers: {e}")
+    
+    def _execute_with_helpers(self, script: str, *args):
+        """
+        Run a script that calls markdownToText()
+        
+        Only the script itself is sent - the helper is already defined in the page.
+        If it isn't (page loaded before the helper was registered, e.g. an attached
+        session), the script is retried with the helper sent inline.
+        
+        Args:
+            script: JS function body, as for execute_script
+            *args: Script arguments
+            
+        Returns:
+            The script's return value
+        """
+        try:
+            return self.driver.execute_script(script, *args)
+        except JavascriptException as e:
+            if 'markdownToText' not in str(e):
+                raise
+            return self.driver.execute_script(MARKDOWN_TO_TEXT_JS + script, *args)
+    
+    def _apply_network_rules(self):
+        """Block images, fonts, media and trackers so page loads only fetch what we read"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"⚠️  Could not apply network blocking rules: {e}")
+    
+    def _tune_driver_connection(self):
+        """
+        Keep the chromedriver HTTP connections alive and pooled
+        
+        Every find_element/execute_script/screenshot is an HTTP call to chromedriver.
+        The default urllib3 pool holds a single connection, so any overlapping calls
+        keep opening and discarding sockets.
+        """
+        try:
+            executor = self.driver.command_executor
+            config = executor.client_config
+            config.keep_alive = True
+            config.init_args_for_pool_manager = {
+                "init_args_for_pool_manager": {"maxsize": DRIVER_POOL_MAXSIZE, "block": False}
+            }
+            old_conn = getattr(executor, '_conn', None)
+            executor._conn = executor._get_connection_manager()
+            if old_conn is not None:
+                old_conn.clear()
+        except Exception as e:
+            # Older Selenium without ClientConfig - keep its defaults
+            logger.debug(f"Could not tune driver connection pool: {e}")
+    
+    async def _setup_proxy(self) -> bool:
         """Setup and validate proxy configuration"""
         if settings.USE_PROXY:
             if not settings.OXYLABS_USERNAME or not settings.OXYLABS_PASSWORD:
@@ -227,8 +537,12 @@ class BaseScraper(ABC):
             
             logger.info("🔒 Proxy mode enabled")
             
-            if not proxy_manager.test_proxy():
+            # Lease the least-loaded port - the test below checks the port this browser will use
+            self._proxy_port = proxy_manager.acquire_port()
+            if not await asyncio.to_thread(proxy_manager.test_proxy, self._proxy_port):
                 logger.error("❌ Proxy connection test failed!")
+                proxy_manager.release_port(self._proxy_port)
+                self._proxy_port = None
                 return False
         else:
             logger.warning("⚠️  WARNING: Running WITHOUT proxy!")
@@ -244,42 +558,63 @@ class BaseScraper(ABC):
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--no-sandbox')
         
+        # Lean runtime - pooled browsers sit in the background between queries,
+        # so keep their timers/renderers at full speed and skip unused services
+        options.add_argument('--disable-backgrounding-occluded-windows')
+        options.add_argument('--disable-renderer-backgrounding')
+        options.add_argument('--disable-background-timer-throttling')
+        options.add_argument('--disable-breakpad')
+        options.add_argument('--mute-audio')
+        options.add_argument('--no-first-run')
+        options.add_argument('--no-zygote')
+        options.add_argument('--disable-features=Translate,BackForwardCache,AcceptCHFrame')
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        
         # Headless mode
         if settings.HEADLESS:
-            # Use new headless mode (more stable)
-            options.add_argument('--headless=new')
-            options.add_argument('--disable-gpu')
+            # "new" = full Chrome (harder to fingerprint), "shell" = lighter headless shell
+            options.add_argument(f'--headless={settings.HEADLESS_MODE}')
             options.add_argument('--window-size=1920,1080')
-            logger.info("🕶️  Configuring headless mode")
+            logger.info(f"🕶️  Configuring headless mode ({settings.HEADLESS_MODE})")
         else:
             options.add_argument('--start-maximized')
             logger.info("👁️  Configuring visible mode")
         
-        # User agent
-        options.add_argument(
-            'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-            'AppleWebKit/537.36 (KHTML, like Gecko) '
-            'Chrome/144.0.0.0 Safari/537.36'
-        )
+        # Network events for _await_stream_end (read and drained via get_log)
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
+        # User agent (Client Hints are aligned after launch - see _apply_identity_overrides)
+        options.add_argument(f'user-agent={USER_AGENT}')
         
         # Proxy extension (only in non-headless mode)
         # Extensions often fail in headless, use direct proxy instead
         if settings.USE_PROXY and not settings.HEADLESS:
-            ext_path = proxy_manager.get_auth_extension_path()
+            ext_path = proxy_manager.get_auth_extension_path(self._proxy_port)
             if ext_path:
                 options.add_argument(f'--load-extension={ext_path}')
                 logger.success("✅ Proxy authentication extension loaded")
         elif settings.USE_PROXY and settings.HEADLESS:
             # In headless mode, configure proxy differently
-            proxy = proxy_manager.get_proxy_for_selenium()
+            proxy = proxy_manager.get_proxy_for_selenium(self._proxy_port)
             if proxy:
                 options.add_argument(f'--proxy-server={proxy}')
                 logger.info(f"🔒 Headless proxy configured: {proxy}")
         
         return options
     
-    def _load_and_apply_cookies(self):
-        """Load cookies from file and apply to browser"""
+    async def _load_and_apply_cookies(self):
+        """Load cookies from file and apply them to the browser in one CDP call"""
+        if await self._in_driver_thread(self._apply_saved_cookies):
+            await self.async_random_delay(2, 4)
+    
+    def _apply_saved_cookies(self) -> int:
+        """
+        Blocking part of _load_and_apply_cookies(), runs in a driver thread
+        
+        Returns:
+            Number of cookies applied (the page is reloaded if any were)
+        """
+        applied = 0
         cookies = self.load_cookies()
         if cookies:
             logger.info("🍪 Loading saved cookies...")
@@ -288,36 +623,86 @@ class BaseScraper(ABC):
             current_domain = self.driver.execute_script("return document.domain")
             logger.debug(f"Current domain: {current_domain}")
             
-            success_count = 0
+            cdp_cookies = []
             for cookie in cookies:
-                try:
-                    # Fix domain issues - remove domain or set to current domain
-                    if 'domain' in cookie:
-                        # If cookie domain doesn't match current domain, try to fix it
-                        cookie_domain = cookie['domain']
-                        if cookie_domain.startswith('.'):
-                            cookie_domain = cookie_domain[1:]  # Remove leading dot
-                        
-                        # Check if current domain matches or is subdomain
-                        if current_domain not in cookie_domain and cookie_domain not in current_domain:
-                            logger.debug(f"Skipping cookie {cookie.get('name')} - domain mismatch")
-                            continue
-                    
-                    # Remove sameSite if it's 'None' without secure flag (can cause issues)
-                    if cookie.get('sameSite') == 'None' and not cookie.get('secure'):
-                        cookie.pop('sameSite', None)
+                if 'name' not in cookie or 'value' not in cookie:
+                    continue
+                
+                # Fix domain issues - remove domain or set to current domain
+                if cookie.get('domain'):
+                    # If cookie domain doesn't match current domain, try to fix it
+                    cookie_domain = cookie['domain']
+                    if cookie_domain.startswith('.'):
+                        cookie_domain = cookie_domain[1:]  # Remove leading dot
                     
-                    self.driver.add_cookie(cookie)
-                    success_count += 1
-                except Exception as e:
-                    logger.debug(f"Could not add cookie {cookie.get('name', 'unknown')}: {e}")
+                    # Check if current domain matches or is subdomain
+                    if current_domain not in cookie_domain and cookie_domain not in current_domain:
+                        logger.debug(f"Skipping cookie {cookie.get('name')} - domain mismatch")
+                        continue
+                
+                cdp_cookies.append(self._to_cdp_cookie(cookie))
             
-            logger.info(f"✅ Successfully loaded {success_count}/{len(cookies)} cookies")
+            applied = self._set_cookies(cdp_cookies)
+            logger.info(f"✅ Successfully loaded {applied}/{len(cookies)} cookies")
             
-            if success_count > 0:
+            if applied > 0:
                 logger.info("🔄 Reloading page with cookies...")
                 self.driver.get(self.URL)
-                self.random_delay(2, 4)
+        return applied
+    
+    def _to_cdp_cookie(self, cookie: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a WebDriver cookie (as saved by get_cookies) to a CDP CookieParam
+        
+        Args:
+            cookie: Cookie dict with WebDriver field names
+            
+        Returns:
+            Cookie dict for Network.setCookies
+        """
+        cdp_cookie = {'name': cookie['name'], 'value': cookie['value']}
+        if cookie.get('domain'):
+            cdp_cookie['domain'] = cookie['domain']
+        else:
+            cdp_cookie['url'] = self.URL
+        for field in ('path', 'secure', 'httpOnly'):
+            if field in cookie:
+                cdp_cookie[field] = cookie[field]
+        if 'expiry' in cookie:
+            cdp_cookie['expires'] = cookie['expiry']
+        
+        # Drop sameSite=None without the secure flag (Chrome rejects it)
+        same_site = str(cookie.get('sameSite', '')).capitalize()
+        if same_site in ('Strict', 'Lax') or (same_site == 'None' and cookie.get('secure')):
+            cdp_cookie['sameSite'] = same_site
+        return cdp_cookie
+    
+    def _set_cookies(self, cdp_cookies: List[Dict[str, Any]]) -> int:
+        """
+        Apply cookies with a single Network.setCookies round trip
+        
+        Network.setCookies rejects the whole batch if one cookie is invalid, so
+        on failure each cookie is retried on its own and bad ones are skipped.
+        
+        Returns:
+            Number of cookies applied
+        """
+        if not cdp_cookies:
+            return 0
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+            return len(cdp_cookies)
+        except Exception as e:
+            logger.debug(f"Batch cookie set failed, retrying one by one: {e}")
+        
+        applied = 0
+        for cookie in cdp_cookies:
+            try:
+                self.driver.execute_cdp_cmd('Network.setCookie', cookie)
+                applied += 1
+            except Exception as e:
+                logger.debug(f"Could not add cookie {cookie['name']}: {e}")
+        return applied
     
     async def _handle_manual_login(self):
         """Handle manual login flow"""
@@ -326,32 +711,209 @@ class BaseScraper(ABC):
         logger.info("🔐 MANUAL LOGIN REQUIRED")
         logger.info("=" * 60)
         logger.info(f"Please log in to {self.ai_source} in the browser window.")
-        logger.info("Waiting 90 seconds for you to log in...")
+        logger.info(f"Waiting up to {LOGIN_WAIT_SECONDS} seconds for you to log in...")
         logger.info("=" * 60)
         
-        self.delay(90)
+        await self.wait_for_login()
         
         # Save cookies after login
         logger.info("💾 Saving login session...")
-        cookies = self.driver.get_cookies()
+        cookies = await self._in_driver_thread(self.driver.get_cookies)
         self.save_cookies(cookies)
         
         await db.save_session(self.ai_source, cookies)
         logger.success("✅ Session cookies saved!")
     
+    async def wait_for_login(self, timeout: float = LOGIN_WAIT_SECONDS) -> bool:
+        """
+        Wait for the user to log in in the browser window
+        
+        Checks for LOGIN_SELECTOR every LOGIN_POLL_INTERVAL seconds (after a short
+        grace period), so it returns as soon as the user is in.
+        
+        Args:
+            timeout: Seconds to wait after the grace period
+            
+        Returns:
+            True once logged in, False on timeout
+        """
+        await asyncio.sleep(LOGIN_GRACE_SECONDS)
+        deadline = time.monotonic() + timeout
+        
+        while time.monotonic() < deadline:
+            try:
+                if await self._in_driver_thread(self.driver.find_elements, By.CSS_SELECTOR, self.LOGIN_SELECTOR):
+                    logger.success(f"✅ Logged in to {self.ai_source}")
+                    return True
+            except WebDriverException as e:
+                logger.debug(f"Login check failed: {e}")
+            await asyncio.sleep(LOGIN_POLL_INTERVAL)
+        
+        logger.warning(f"⚠️  No login detected after {timeout:.0f} seconds")
+        return False
+    
     async def cleanup(self):
         """Close browser and cleanup resources"""
-        # Stop screenshot capture first
-        self._stop_screenshot_capture()
+        driver, self.driver = self.driver, None
+        if driver:
+            logger.info("🧹 Closing browser...")
+            await self._in_driver_thread(self._quit_driver, driver)
+            logger.success("✅ Browser closed successfully")
+    
+    def _save_session_handle(self):
+        """Remember the live session so a dev script can attach() to it later"""
+        try:
+            handle = {
+                'executor_url': self.driver.command_executor.client_config.remote_server_addr,
+                'session_id': self.driver.session_id
+            }
+            with open(self.session_path, 'wb') as f:
+                f.write(orjson.dumps(handle))
+        except Exception as e:
+            logger.debug(f"Could not save session handle: {e}")
+    
+    @classmethod
+    def attach(cls, session_id: Optional[str] = None, executor_url: Optional[str] = None) -> 'BaseScraper':
+        """
+        Attach to a browser still open from an earlier initialize() (development only)
+        
+        Skips launch, cookies and the login check so selector changes in
+        _wait_for_response/_extract_response can be retried in seconds.
+        
+        Args:
+            session_id: WebDriver session id (default: last one saved for this AI source)
+            executor_url: chromedriver URL (default: last one saved for this AI source)
+            
+        Returns:
+            Scraper whose driver is bound to the existing session
+        """
+        scraper = cls()
+        if not session_id or not executor_url:
+            with open(scraper.session_path, 'rb') as f:
+                handle = orjson.loads(f.read())
+            session_id = session_id or handle['session_id']
+            executor_url = executor_url or handle['executor_url']
+        
+        scraper.driver = _AttachedDriver(executor_url, session_id)
+        logger.info(f"🔗 Attached to {scraper.ai_source} session {session_id} at {executor_url}")
+        return scraper
+    
+    def _driver_pool(self) -> asyncio.Queue:
+        """Get the warm-driver pool for this AI source"""
+        pool = self._driver_pools.get(self.ai_source)
+        if pool is None:
+            pool = asyncio.Queue(maxsize=max(1, settings.BROWSER_POOL_SIZE))
+            self._driver_pools[self.ai_source] = pool
+        return pool
+    
+    @staticmethod
+    def _quit_driver(driver):
+        """Quit a driver, ignoring errors from an already-dead session"""
+        proxy_manager.release_port(getattr(driver, 'proxy_port', None))
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Driver quit error: {e}")
+    
+    @staticmethod
+    def _kill_driver(driver):
+        """Kill chromedriver and Chrome outright, failing any command stuck on the session"""
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        try:
+            if process is not None:
+                process.kill()
+            browser_pid = getattr(driver, 'browser_pid', None)
+            if browser_pid:
+                os.kill(browser_pid, signal.SIGTERM)
+        except OSError as e:
+            logger.debug(f"Driver kill error: {e}")
+    
+    async def _kill_and_quit(self, driver):
+        """Kill a hung driver, then quit it off the loop (frees its proxy lease and profile)"""
+        self._kill_driver(driver)
+        await self._in_driver_thread(self._quit_driver, driver)
+    
+    def _abandon(self):
+        """
+        Give up on this scraper's browser after a cancelled query
+        
+        The driver thread may still be inside a command or launching Chrome, so
+        the browser is killed rather than quit politely, and a launch that
+        finishes later quits its own browser (see _launch_browser).
+        """
+        with self._driver_lock:
+            self._abandoned = True
+            driver, self.driver = self.driver, None
+            port, self._proxy_port = self._proxy_port, None
+        
+        proxy_manager.release_port(port)
+        if driver is not None:
+            logger.warning(f"🔪 Killing unresponsive {self.ai_source} browser")
+            task = asyncio.create_task(self._kill_and_quit(driver))
+            self._return_tasks.add(task)
+            task.add_done_callback(self._return_tasks.discard)
+    
+    async def _acquire_driver(self, allow_manual_login: bool = True) -> bool:
+        """
+        Take a warm driver from the pool, launching a new browser if none is alive
         
-        if self.driver:
+        Args:
+            allow_manual_login: Passed to initialize() when a browser is launched
+            
+        Returns:
+            True if self.driver is ready, False otherwise
+        """
+        pool = self._driver_pool()
+        while not pool.empty():
+            driver = pool.get_nowait()
             try:
-                logger.info("🧹 Closing browser...")
-                self.driver.quit()
-                self.driver = None
-                logger.success("✅ Browser closed successfully")
+                await self._in_driver_thread(getattr, driver, 'current_url')  # Cheap liveness probe
             except Exception as e:
-                logger.error(f"❌ Cleanup error: {e}")
+                # A dead chromedriver surfaces as urllib3's MaxRetryError/ProtocolError, not WebDriverException
+                logger.info(f"♻️  Pooled {self.ai_source} browser is gone - discarding ({type(e).__name__})")
+                await self._in_driver_thread(self._quit_driver, driver)
+                continue
+            
+            logger.info(f"♻️  Reusing warm {self.ai_source} browser")
+            self.driver = driver
+            return True
+        
+        return await self.initialize(load_cookies=True, allow_manual_login=allow_manual_login)
+    
+    def _release_driver(self, healthy: bool):
+        """
+        Hand self.driver back to the pool (healthy) or close it (after an error)
+        
+        The page reset or quit runs in the background so the caller is not kept waiting.
+        """
+        driver, self.driver = self.driver, None
+        if driver is None:
+            return
+        
+        if healthy:
+            task = asyncio.create_task(self._return_driver(driver))
+        else:
+            task = asyncio.create_task(self._in_driver_thread(self._quit_driver, driver))
+        self._return_tasks.add(task)
+        task.add_done_callback(self._return_tasks.discard)
+    
+    async def _return_driver(self, driver):
+        """Open a fresh conversation and put the driver back (cookies are kept - they hold the login)"""
+        try:
+            await self._in_driver_thread(driver.get, self.URL)
+            self._driver_pool().put_nowait(driver)
+        except (asyncio.QueueFull, WebDriverException):
+            await self._in_driver_thread(self._quit_driver, driver)
+    
+    @classmethod
+    async def close_driver_pool(cls, ai_source: str):
+        """Quit every idle pooled driver for an AI source (call on shutdown)"""
+        if cls._return_tasks:
+            await asyncio.gather(*cls._return_tasks, return_exceptions=True)
+        
+        pool = cls._driver_pools.pop(ai_source, None)
+        while pool is not None and not pool.empty():
+            await cls._in_driver_thread(cls._quit_driver, pool.get_nowait())
     
     async def check_login_status(self) -> bool:
         """
@@ -361,7 +923,7 @@ class BaseScraper(ABC):
             True if logged in, False otherwise
         """
         try:
-            self.driver.find_element(By.CSS_SELECTOR, self.LOGIN_SELECTOR)
+            await self._in_driver_thread(self.driver.find_element, By.CSS_SELECTOR, self.LOGIN_SELECTOR)
             logger.info("✅ Login status: Logged in")
             return True
         except NoSuchElementException:
@@ -373,36 +935,48 @@ class BaseScraper(ABC):
     
     # ==================== QUERY EXECUTION ====================
     
-    async def query_with_fresh_browser(self, prompt: str, brands: List[str]) -> ScraperResponse:
+    async def query_with_fresh_browser(
+        self,
+        prompt: str,
+        brands: List[str],
+        allow_manual_login: bool = True
+    ) -> ScraperResponse:
         """
-        Query AI with a FRESH browser instance (opens, queries, closes)
+        Query AI in a fresh conversation on a warm pooled browser
+        
+        A browser is only launched when the pool for this AI source is empty.
+        After a successful query it returns to the pool; after an error it is closed.
         
         Args:
             prompt: The question/prompt to send
             brands: List of brands to track in response
+            allow_manual_login: Wait for a manual login if a newly launched browser
+                is logged out (False fails right away)
             
         Returns:
             ScraperResponse with AI's answer and brand mentions
         """
-        logger.info("\n" + "="*80)
-        logger.info(f"🆕 Starting FRESH BROWSER instance for {self.ai_source}")
-        logger.info("="*80)
-        
+        healthy = False
         try:
-            success = await self.initialize(load_cookies=True)
+            success = await self._acquire_driver(allow_manual_login)
             if not success:
                 raise RuntimeError("Failed to initialize browser")
             
             result = await self.query(prompt, brands)
+            healthy = True
             
-            logger.success("✅ Fresh browser session completed and closed")
+            logger.success("✅ Browser session completed and returned to pool")
             return result
             
+        except asyncio.CancelledError:
+            # Timed out - the driver thread is still running, see _abandon()
+            self._abandon()
+            raise
         except Exception as e:
-            logger.error(f"❌ Fresh browser query failed: {e}")
+            logger.error(f"❌ Pooled browser query failed: {e}")
             raise
         finally:
-            await self.cleanup()
+            self._release_driver(healthy)
     
     async def query(self, prompt: str, brands: List[str]) -> ScraperResponse:
         """
@@ -424,8 +998,14 @@ class BaseScraper(ABC):
         logger.info(f"🏷️  Tracking {len(brands)} brands")
         logger.info(f"{'='*60}\n")
         
+        # Selenium calls block - run them off the event loop so pooled browsers work in parallel
+        return await self._in_driver_thread(self._run_query, prompt, brands)
+    
+    def _run_query(self, prompt: str, brands: List[str]) -> ScraperResponse:
+        """Blocking part of query(), runs in a worker thread"""
         try:
             self.enforce_rate_limit()
+            self._reset_stream_log()
             
             # Find and interact with input field
             input_field = self._find_input_field()
@@ -436,8 +1016,10 @@ class BaseScraper(ABC):
             self._wait_for_response()
             response_text = self._extract_response()
             
-            # Get raw HTML for debugging
-            raw_html = self.driver.page_source if settings.ENVIRONMENT == 'development' else None
+            # Get raw HTML for debugging - the whole DOM over WebDriver, so opt-in only
+            raw_html = None
+            if settings.ENVIRONMENT == 'development' and settings.CAPTURE_RAW_HTML:
+                raw_html = self.driver.page_source
             
             # Extract brands mentioned
             brands_mentioned = self.extract_brands(response_text, brands)
@@ -455,21 +1037,52 @@ class BaseScraper(ABC):
             
         except TimeoutException:
             logger.error("❌ Timeout waiting for page elements")
+            self.capture_debug("query_timeout")
             raise RuntimeError(f"{self.ai_source} query timeout")
         
         except Exception as e:
-            logger.error(f"❌ Query failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Query failed: {e}")
+            self.capture_debug("query_failed")
+            raise
+    
+    def _wait_for_selector(self, selector: str, timeout: float, clickable: bool = False):
+        """
+        Wait for an element with a MutationObserver inside the page
+        
+        One WebDriver round trip that returns as soon as the element appears,
+        falling back to WebDriverWait polling if the script can't run.
+        
+        Args:
+            selector: CSS selector to wait for
+            timeout: Seconds to wait
+            clickable: Also require the element to be visible and enabled
+            
+        Returns:
+            The matching WebElement
+            
+        Raises:
+            TimeoutException: If no matching element appeared in time
+        """
+        try:
+            element = self.driver.execute_async_script(
+                WAIT_FOR_SELECTOR_JS, selector, clickable, int(timeout * 1000)
+            )
+        except TimeoutException:
             raise
+        except WebDriverException as e:
+            logger.debug(f"Observer wait failed, polling instead: {e}")
+            condition = EC.element_to_be_clickable if clickable else EC.presence_of_element_located
+            return WebDriverWait(self.driver, timeout).until(condition((By.CSS_SELECTOR, selector)))
+        
+        if element is None:
+            raise TimeoutException(f"Timed out waiting for {selector}")
+        return element
     
     def _find_input_field(self):
         """Find and return the input field element"""
         logger.info("⏳ Waiting for input field...")
         try:
-            input_field = WebDriverWait(self.driver, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.INPUT_SELECTOR))
-            )
+            input_field = self._wait_for_selector(self.INPUT_SELECTOR, 20)
             logger.success("✅ Input field found!")
             return input_field
         except TimeoutException:
@@ -500,9 +1113,7 @@ class BaseScraper(ABC):
         """Click send button or press Enter"""
         logger.info("📤 Finding send button...")
         try:
-            send_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, self.SEND_BUTTON_SELECTOR))
-            )
+            send_button = self._wait_for_selector(self.SEND_BUTTON_SELECTOR, 10, clickable=True)
             logger.info("🖱️  Clicking send button...")
             send_button.click()
             logger.info("⏳ Waiting 10-15 seconds for response to generate...")
@@ -513,6 +1124,105 @@ class BaseScraper(ABC):
             logger.info("⏳ Waiting 10-15 seconds for response to generate...")
             self.random_delay(10, 15)  # Wait for response to start generating
     
+    def _wait_until(self, condition: str, max_wait: float, *args) -> bool:
+        """
+        Block until a JS condition holds, checked by a MutationObserver in the page
+        
+        Replaces find_element/execute_script polling loops with one call per
+        WAIT_SLICE_SECONDS. Selectors are passed in `args` rather than pasted
+        into the condition, so each scraper keeps them as class constants.
+        
+        Args:
+            condition: JS function body that returns truthy when done (sees `args`)
+            max_wait: Seconds to wait
+            *args: Values exposed to the condition as the JS array `args`
+            
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        script = WAIT_UNTIL_JS.replace('__CONDITION__', condition)
+        deadline = time.time() + max_wait
+        
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            try:
+                if self.driver.execute_async_script(script, int(min(remaining, WAIT_SLICE_SECONDS) * 1000), *args):
+                    return True
+            except TimeoutException:
+                continue
+            except WebDriverException as e:
+                # e.g. the page re-rendered mid-wait - try again shortly
+                logger.debug(f"Observer wait interrupted: {e}")
+                time.sleep(1)
+    
+    def _reset_stream_log(self):
+        """Drop buffered network events so the next stream wait only sees this query"""
+        try:
+            self.driver.get_log('performance')
+        except Exception as e:
+            logger.debug(f"Performance log unavailable: {e}")
+    
+    def _is_stream_response(self, response: Dict[str, Any]) -> bool:
+        """Whether a Network.responseReceived response is the streamed AI reply"""
+        if 'event-stream' in response.get('mimeType', ''):
+            return True
+        return bool(self.STREAM_URL_HINT) and self.STREAM_URL_HINT in response.get('url', '')
+    
+    def _await_stream_end(self, max_wait: float = 120, find_within: float = 10, idle: float = 3) -> bool:
+        """
+        Block until the streamed reply finishes, using Chrome's network events
+        
+        Drains the performance log in batches instead of querying the DOM, and
+        returns once the stream request finishes or stops receiving chunks.
+        Callers still confirm completion in the DOM afterwards.
+        
+        Args:
+            max_wait: Overall limit in seconds
+            find_within: Give up if no stream request shows up in this many seconds
+            idle: Treat the stream as done after this many seconds without a chunk
+            
+        Returns:
+            True if the end of a stream was observed, False otherwise
+        """
+        start = time.time()
+        streams = set()
+        last_chunk = 0.0
+        
+        while time.time() - start < max_wait:
+            try:
+                entries = self.driver.get_log('performance')
+            except Exception as e:
+                logger.debug(f"Performance log unavailable: {e}")
+                return False
+            
+            for entry in entries:
+                event = orjson.loads(entry['message'])['message']
+                method = event.get('method', '')
+                params = event.get('params', {})
+                if method == 'Network.responseReceived':
+                    if self._is_stream_response(params.get('response', {})):
+                        streams.add(params.get('requestId'))
+                        last_chunk = time.time()
+                elif params.get('requestId') in streams:
+                    if method in ('Network.dataReceived', 'Network.eventSourceMessageReceived'):
+                        last_chunk = time.time()
+                    elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                        logger.debug(f"📡 Response stream finished after {time.time() - start:.1f}s")
+                        return True
+            
+            now = time.time()
+            if not streams and now - start > find_within:
+                logger.debug("No response stream seen - falling back to DOM polling")
+                return False
+            if streams and now - last_chunk > idle:
+                logger.debug(f"📡 Response stream idle for {idle}s")
+                return True
+            time.sleep(STREAM_POLL_INTERVAL)
+        
+        return False
+    
     @abstractmethod
     def _wait_for_response(self):
         """Wait for AI response to complete (platform-specific)"""
@@ -529,13 +1239,26 @@ class BaseScraper(ABC):
         """Sleep for specified seconds"""
         time.sleep(seconds)
     
-    def random_delay(self, min_sec: Optional[float] = None, max_sec: Optional[float] = None):
-        """Sleep for random duration to mimic human behavior"""
+    def _random_duration(self, min_sec: Optional[float], max_sec: Optional[float]) -> float:
+        """Pick a human-like pause length (defaults from settings)"""
         min_sec = min_sec or settings.RANDOM_DELAY_MIN
         max_sec = max_sec or settings.RANDOM_DELAY_MAX
         duration = random.uniform(min_sec, max_sec)
-        logger.debug(f"💤 Sleeping for {duration:.2f}s")
-        time.sleep(duration)
+        logger.debug("💤 Sleeping for {:.2f}s", duration)
+        return duration
+    
+    def random_delay(self, min_sec: Optional[float] = None, max_sec: Optional[float] = None):
+        """
+        Sleep for random duration to mimic human behavior
+        
+        Blocks the calling thread - only for the Selenium steps that run inside
+        query() (off the event loop). Coroutines use async_random_delay().
+        """
+        time.sleep(self._random_duration(min_sec, max_sec))
+    
+    async def async_random_delay(self, min_sec: Optional[float] = None, max_sec: Optional[float] = None):
+        """random_delay() for coroutines - yields to the event loop while waiting"""
+        await asyncio.sleep(self._random_duration(min_sec, max_sec))
     
     def enforce_rate_limit(self):
         """Ensure rate limiting between requests"""
@@ -554,8 +1277,8 @@ class BaseScraper(ABC):
     def save_cookies(self, cookies: List[Dict[str, Any]]):
         """Save cookies to local file for persistence"""
         try:
-            with open(self.cookies_path, 'w') as f:
-                json.dump(cookies, f, indent=2)
+            with open(self.cookies_path, 'wb') as f:
+                f.write(orjson.dumps(cookies, option=orjson.OPT_INDENT_2))
             logger.info(f"💾 Saved cookies to {self.cookies_path}")
         except Exception as e:
             logger.error(f"❌ Failed to save cookies: {e}")
@@ -563,14 +1286,13 @@ class BaseScraper(ABC):
     def load_cookies(self) -> Optional[List[Dict[str, Any]]]:
         """Load cookies from local file"""
         try:
-            if os.path.exists(self.cookies_path):
-                with open(self.cookies_path, 'r') as f:
-                    cookies = json.load(f)
-                logger.info(f"📂 Loaded {len(cookies)} cookies from {self.cookies_path}")
-                return cookies
-            else:
-                logger.info(f"ℹ️  No cookies file found at {self.cookies_path}")
-                return None
+            with open(self.cookies_path, 'rb') as f:
+                cookies = orjson.loads(f.read())
+            logger.info(f"📂 Loaded {len(cookies)} cookies from {self.cookies_path}")
+            return cookies
+        except FileNotFoundError:
+            logger.info(f"ℹ️  No cookies file found at {self.cookies_path}")
+            return None
         except Exception as e:
             logger.error(f"❌ Failed to load cookies: {e}")
             return None
@@ -597,100 +1319,24 @@ class BaseScraper(ABC):
         if not text or not brands:
             return []
         
-        mentioned = set()
-        text_lower = text.lower()
-        
-        # Pre-process text: normalize whitespace and punctuation
-        text_normalized = re.sub(r'[^\w\s]', ' ', text_lower)
-        text_normalized = re.sub(r'\s+', ' ', text_normalized)
-        
-        for brand in brands:
-            if self._is_brand_mentioned(text_lower, text_normalized, brand):
-                mentioned.add(brand)
-        
-        return list(mentioned)
+        return list(self._brand_matcher(brands).find(text))
     
-    def _is_brand_mentioned(self, text_lower: str, text_normalized: str, brand: str) -> bool:
+    def _brand_matcher(self, brands: List[str]) -> BrandMatcher:
         """
-        Check if a brand is mentioned in the text using multiple strategies
-        """
-        brand_lower = brand.lower()
+        Get the compiled matcher for a brand list, building it on first use
         
-        # Strategy 1: Exact word boundary match
-        pattern = r'\b' + re.escape(brand_lower) + r'\b'
-        if re.search(pattern, text_lower):
-            return True
-        
-        # Strategy 2: Match without spaces (e.g., "Hub Spot" matches "hubspot")
-        brand_no_space = brand_lower.replace(' ', '')
-        if len(brand_no_space) > 3:
-            pattern = r'\b' + re.escape(brand_no_space) + r'\b'
-            if re.search(pattern, text_normalized.replace(' ', '')):
-                return True
-        
-        # Strategy 3: Match with flexible spacing (e.g., "HubSpot" matches "Hub Spot")
-        brand_parts = brand_lower.split()
-        if len(brand_parts) > 1:
-            flexible_pattern = r'\b' + r'\s*'.join(re.escape(part) for part in brand_parts) + r'\b'
-            if re.search(flexible_pattern, text_lower):
-                return True
-        
-        # Strategy 4: Handle CamelCase brands (e.g., "HubSpot" -> "hub spot")
-        camel_split = re.sub(r'([a-z])([A-Z])', r'\1 \2', brand).lower()
-        if camel_split != brand_lower:
-            pattern = r'\b' + re.escape(camel_split) + r'\b'
-            if re.search(pattern, text_lower):
-                return True
-            # Also try without spaces
-            pattern = r'\b' + re.escape(camel_split.replace(' ', '')) + r'\b'
-            if re.search(pattern, text_normalized):
-                return True
-        
-        # Strategy 5: Common variations and aliases
-        variations = self._get_brand_variations(brand)
-        for variation in variations:
-            pattern = r'\b' + re.escape(variation.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                return True
-        
-        return False
+        Brand lists are stable across a scraping run, so patterns are compiled
+        once per (scraper class, brand set) instead of on every response.
+        """
+        key = (type(self), frozenset(brands))
+        matcher = self._brand_matchers.get(key)
+        if matcher is None:
+            if len(self._brand_matchers) >= BRAND_MATCHER_CACHE_SIZE:
+                self._brand_matchers.clear()
+            matcher = BrandMatcher(list(key[1]), self._get_brand_variations)
+            self._brand_matchers[key] = matcher
+        return matcher
     
     def _get_brand_variations(self, brand: str) -> List[str]:
         """Get common variations of a brand name"""
-        variations = []
-        brand_lower = brand.lower()
-        
-        # Common CRM/PM tool aliases
-        aliases = {
-            'salesforce': ['sfdc', 'sales force', 'salesforce.com'],
-            'hubspot': ['hub spot', 'hubspot crm'],
-            'zoho crm': ['zoho', 'zohocrm'],
-            'pipedrive': ['pipe drive'],
-            'freshsales': ['fresh sales', 'freshworks crm'],
-            'monday crm': ['monday.com crm'],
-            'monday.com': ['monday', 'mondaycom'],
-            'sugarcrm': ['sugar crm', 'sugar'],
-            'jira': ['jira software', 'atlassian jira'],
-            'asana': ['asana.com'],
-            'trello': ['trello.com'],
-            'clickup': ['click up', 'clickup.com'],
-            'notion': ['notion.so'],
-            'linear': ['linear.app'],
-            'basecamp': ['base camp'],
-            'smartsheet': ['smart sheet'],
-            'wrike': ['wrike.com'],
-            'copper': ['copper crm'],
-            'close': ['close crm', 'close.com'],
-            'insightly': ['insightly crm'],
-        }
-        
-        if brand_lower in aliases:
-            variations.extend(aliases[brand_lower])
-        
-        # Check if brand ends with common suffixes and try without
-        suffixes = [' crm', ' software', '.com', '.io', ' app']
-        for suffix in suffixes:
-            if brand_lower.endswith(suffix):
-                variations.append(brand_lower[:-len(suffix)])
-        
-        return variations
+        return list(brand_variations(brand))
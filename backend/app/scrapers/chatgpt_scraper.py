@@ -21,6 +21,9 @@ class ChatGPTScraper(BaseScraper):
     INPUT_SELECTOR = 'div[contenteditable="true"][id="prompt-textarea"]'
     SEND_BUTTON_SELECTOR = 'button[data-testid="send-button"]'
     RESPONSE_SELECTOR = '[data-message-author-role="assistant"] .markdown'
+    MESSAGE_SELECTOR = '[data-message-author-role="assistant"]'
+    STOP_BUTTON_SELECTOR = 'button[aria-label="Stop generating"]'
+    STREAM_URL_HINT = '/backend-api/conversation'
     
     def __init__(self):
         super().__init__('chatgpt')
@@ -31,19 +34,16 @@ class ChatGPTScraper(BaseScraper):
         max_wait = 120  # 2 minutes max
         start_time = time.time()
         
-        while (time.time() - start_time) < max_wait:
-            # Check if "Stop generating" button exists (means still generating)
-            stop_buttons = self.driver.find_elements(
-                "css selector",
-                'button[aria-label="Stop generating"]'
-            )
-            
-            if len(stop_buttons) == 0:
-                logger.success("✅ Response generation complete!")
-                break
-            
-            logger.debug("⏳ Still generating... (waiting 1s)")
-            self.delay(1)
+        # Sleep through the network stream first - the DOM check below then confirms
+        self._await_stream_end(max_wait)
+        
+        # Generation is done once the "Stop generating" button is gone
+        if self._wait_until(
+            "return !document.querySelector(args[0]);",
+            max_wait - (time.time() - start_time),
+            self.STOP_BUTTON_SELECTOR
+        ):
+            logger.success("✅ Response generation complete!")
         else:
             logger.warning("⚠️ Response took too long, extracting what we have...")
         
@@ -54,9 +54,9 @@ class ChatGPTScraper(BaseScraper):
         logger.info("📊 Extracting response text...")
         
         # Use JavaScript to get text content WITH URLs embedded
-        response_text = self.driver.execute_script("""
+        response_text = self._execute_with_helpers("""
             // Get all assistant messages
-            const messages = document.querySelectorAll('[data-message-author-role="assistant"]');
+            const messages = document.querySelectorAll(arguments[0]);
             
             if (messages.length === 0) {
                 return '';
@@ -68,40 +68,12 @@ class ChatGPTScraper(BaseScraper):
             // Try to get the markdown content div
             const markdownDiv = lastMessage.querySelector('.markdown');
             if (markdownDiv) {
-                // Clone the element to manipulate it
-                const clone = markdownDiv.cloneNode(true);
-                
-                // Replace links with text that includes the URL
-                // Format: "link text (URL)"
-                clone.querySelectorAll('a').forEach(link => {
-                    const text = link.textContent || link.innerText || '';
-                    const href = link.getAttribute('href') || '';
-                    if (href) {
-                        link.replaceWith(document.createTextNode(`${text} (${href})`));
-                    }
-                });
-                
-                // Replace <br> with newlines
-                clone.querySelectorAll('br').forEach(br => br.replaceWith('\\n'));
-                
-                // Replace block elements with newlines
-                clone.querySelectorAll('p, div, li, h1, h2, h3, h4, h5, h6').forEach(el => {
-                    el.prepend(document.createTextNode('\\n'));
-                    el.append(document.createTextNode('\\n'));
-                });
-                
-                // Get text content
-                let text = clone.textContent || clone.innerText || '';
-                
-                // Clean up multiple newlines
-                text = text.replace(/\\n{3,}/g, '\\n\\n').trim();
-                
-                return text;
+                return markdownToText(markdownDiv);
             }
             
             // Fallback to full message text
             return lastMessage.textContent || lastMessage.innerText || '';
-        """)
+        """, self.MESSAGE_SELECTOR)
         
         if not response_text or response_text.strip() == '':
             logger.warning("⚠️ Could not extract response text. Trying alternative method...")
@@ -110,7 +82,7 @@ class ChatGPTScraper(BaseScraper):
             try:
                 assistant_messages = self.driver.find_elements(
                     "css selector",
-                    '[data-message-author-role="assistant"]'
+                    self.MESSAGE_SELECTOR
                 )
                 if assistant_messages:
                     response_text = assistant_messages[-1].text
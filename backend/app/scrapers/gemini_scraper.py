@@ -21,6 +21,7 @@ class GeminiScraper(BaseScraper):
     INPUT_SELECTOR = 'div.ql-editor.textarea.new-input-ui[contenteditable="true"]'
     SEND_BUTTON_SELECTOR = 'button.send-button[aria-label="Send message"]'
     RESPONSE_SELECTOR = 'model-response .markdown.markdown-main-panel'
+    STREAM_URL_HINT = 'StreamGenerate'
     
     def __init__(self):
         super().__init__('gemini')
@@ -31,35 +32,24 @@ class GeminiScraper(BaseScraper):
         max_wait = 120  # 2 minutes max
         start_time = time.time()
         
-        while (time.time() - start_time) < max_wait:
-            try:
-                # Check for response container
-                response_containers = self.driver.find_elements(
-                    "css selector",
-                    'model-response .markdown.markdown-main-panel'
-                )
-                
-                if response_containers:
-                    # Check if still generating (aria-busy="true")
-                    is_busy = self.driver.execute_script("""
-                        const containers = document.querySelectorAll('model-response .markdown');
-                        if (containers.length === 0) return false;
-                        const lastContainer = containers[containers.length - 1];
-                        return lastContainer.getAttribute('aria-busy') === 'true';
-                    """)
-                    
-                    if not is_busy:
-                        logger.success("✅ Response generation complete!")
-                        break
-                    
-                    logger.debug("⏳ Still generating...")
-                    self.delay(1)
-                else:
-                    logger.debug("⏳ Waiting for response to appear...")
-                    self.delay(1)
-                    
-            except Exception:
-                self.delay(1)
+        # Sleep through the network stream first - the DOM check below then confirms
+        self._await_stream_end(max_wait)
+        
+        # Response container present and no longer marked aria-busy="true".
+        # Live tag/class collections - no selector matching on every mutation
+        if self._wait_until(
+            """
+            const responses = document.getElementsByTagName('model-response');
+            const lastResponse = responses[responses.length - 1];
+            if (!lastResponse) return false;
+            if (lastResponse.getElementsByClassName('markdown markdown-main-panel').length === 0) return false;
+            const containers = lastResponse.getElementsByClassName('markdown');
+            const lastContainer = containers[containers.length - 1];
+            return lastContainer.getAttribute('aria-busy') !== 'true';
+            """,
+            max_wait - (time.time() - start_time)
+        ):
+            logger.success("✅ Response generation complete!")
         else:
             logger.warning("⚠️ Response took too long, extracting what we have...")
         
@@ -70,9 +60,9 @@ class GeminiScraper(BaseScraper):
         logger.info("📊 Extracting response text...")
         
         # Use JavaScript to get text content WITH URLs embedded
-        response_text = self.driver.execute_script("""
+        response_text = self._execute_with_helpers("""
             // Get all model-response elements
-            const responses = document.querySelectorAll('model-response');
+            const responses = document.getElementsByTagName('model-response');
             
             if (responses.length === 0) {
                 return '';
@@ -82,37 +72,9 @@ class GeminiScraper(BaseScraper):
             const lastResponse = responses[responses.length - 1];
             
             // Find the markdown container inside it
-            const markdown = lastResponse.querySelector('.markdown.markdown-main-panel');
+            const markdown = lastResponse.getElementsByClassName('markdown markdown-main-panel')[0];
             if (markdown) {
-                // Clone the element to manipulate it
-                const clone = markdown.cloneNode(true);
-                
-                // Replace links with text that includes the URL
-                // Format: "link text (URL)"
-                clone.querySelectorAll('a').forEach(link => {
-                    const text = link.textContent || link.innerText || '';
-                    const href = link.getAttribute('href') || '';
-                    if (href) {
-                        link.replaceWith(document.createTextNode(`${text} (${href})`));
-                    }
-                });
-                
-                // Replace <br> with newlines
-                clone.querySelectorAll('br').forEach(br => br.replaceWith('\\n'));
-                
-                // Replace block elements with newlines
-                clone.querySelectorAll('p, div, li, h1, h2, h3, h4, h5, h6').forEach(el => {
-                    el.prepend(document.createTextNode('\\n'));
-                    el.append(document.createTextNode('\\n'));
-                });
-                
-                // Get text content
-                let text = clone.textContent || clone.innerText || '';
-                
-                // Clean up multiple newlines
-                text = text.replace(/\\n{3,}/g, '\\n\\n').trim();
-                
-                return text;
+                return markdownToText(markdown);
             }
             
             return '';
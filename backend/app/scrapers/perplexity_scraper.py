@@ -22,6 +22,7 @@ class PerplexityScraper(BaseScraper):
     INPUT_SELECTOR = 'div[contenteditable="true"][id="ask-input"]'
     SEND_BUTTON_SELECTOR = 'button[aria-label="Submit"]'
     RESPONSE_SELECTOR = 'div[id^="markdown-content-"] .prose'
+    ANSWER_SELECTOR = 'div[id^="markdown-content-"]'
     
     def __init__(self):
         super().__init__('perplexity')
@@ -40,27 +41,42 @@ class PerplexityScraper(BaseScraper):
         input_field.click()
         self.delay(0.5)
         
-        # Clear any existing content
+        # Clear any existing content and refocus, returning once Lexical has re-rendered
+        # (two animation frames, capped at 300ms in case frames are throttled)
         try:
-            self.driver.execute_script("""
+            self.driver.execute_async_script("""
                 const editor = arguments[0];
+                const done = arguments[arguments.length - 1];
                 editor.textContent = '';
                 editor.innerHTML = '<p><br></p>';
                 editor.focus();
+                requestAnimationFrame(() => requestAnimationFrame(() => done()));
+                setTimeout(() => done(), 300);
             """, input_field)
-            self.delay(0.3)
         except Exception as e:
             logger.debug(f"Clear content failed: {e}")
         
-        logger.info("⌨️  Typing prompt using send_keys...")
+        logger.info("⌨️  Inserting prompt...")
+        
+        # One CDP Input.insertText instead of a WebDriver key event per character.
+        # Lexical still gets a real beforeinput/input pair for the whole string
+        try:
+            self.driver.execute_cdp_cmd("Input.insertText", {"text": prompt})
+            inserted = self.driver.execute_script(
+                "return (arguments[0].textContent || '').trim().length > 0;",
+                input_field
+            )
+            if inserted:
+                logger.success("✅ Finished typing prompt")
+                self.random_delay(0.5, 1)
+                return
+            logger.warning("⚠️ insertText left the editor empty, falling back to send_keys...")
+        except Exception as e:
+            logger.warning(f"⚠️ insertText failed, falling back to send_keys: {e}")
         
         # Use Selenium's send_keys which triggers proper keyboard events
         try:
-            # Focus again
-            input_field.click()
-            self.delay(0.2)
-            
-            # Type the prompt
+            # Type the prompt (the editor is already focused)
             input_field.send_keys(prompt)
             
             logger.success("✅ Finished typing prompt")
@@ -111,13 +127,7 @@ class PerplexityScraper(BaseScraper):
         
         try:
             # Find the send button
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.common.by import By
-            
-            send_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, self.SEND_BUTTON_SELECTOR))
-            )
+            send_button = self._wait_for_selector(self.SEND_BUTTON_SELECTOR, 10, clickable=True)
             
             logger.info("🖱️  Clicking send button...")
             
@@ -139,16 +149,16 @@ class PerplexityScraper(BaseScraper):
             # Try to find any button that might be the send button
             logger.info("🔍 Looking for alternative send button...")
             try:
-                buttons = self.driver.find_elements("css selector", "button")
-                for btn in buttons:
-                    aria_label = btn.get_attribute("aria-label")
-                    if aria_label and "submit" in aria_label.lower():
-                        logger.info(f"Found button with aria-label: {aria_label}")
-                        btn.click()
-                        logger.success("✅ Clicked alternative send button")
-                        logger.info("⏳ Waiting 10-15 seconds for response to generate...")
-                        self.random_delay(10, 15)  # Wait for response to start generating
-                        return
+                # Case-insensitive attribute match - the browser filters, not one round-trip per button
+                buttons = self.driver.find_elements("css selector", 'button[aria-label*="submit" i]')
+                if buttons:
+                    btn = buttons[0]
+                    logger.info(f"Found button with aria-label: {btn.get_attribute('aria-label')}")
+                    btn.click()
+                    logger.success("✅ Clicked alternative send button")
+                    logger.info("⏳ Waiting 10-15 seconds for response to generate...")
+                    self.random_delay(10, 15)  # Wait for response to start generating
+                    return
             except Exception as e2:
                 logger.error(f"Alternative button search failed: {e2}")
             
@@ -163,40 +173,26 @@ class PerplexityScraper(BaseScraper):
         max_wait = 120  # 2 minutes max
         start_time = time.time()
         
-        while (time.time() - start_time) < max_wait:
-            try:
-                # Check for response container with markdown content
-                response_containers = self.driver.find_elements(
-                    "css selector",
-                    'div[id^="markdown-content-"]'
-                )
-                
-                if response_containers:
-                    # Check if response has actual content (not just placeholder)
-                    has_content = self.driver.execute_script("""
-                        const containers = document.querySelectorAll('div[id^="markdown-content-"]');
-                        if (containers.length === 0) return false;
-                        
-                        const lastContainer = containers[containers.length - 1];
-                        const prose = lastContainer.querySelector('.prose');
-                        if (!prose) return false;
-                        
-                        const text = prose.textContent || prose.innerText || '';
-                        return text.trim().length > 10; // More than just a greeting
-                    """)
-                    
-                    if has_content:
-                        logger.success("✅ Response generation complete!")
-                        break
-                    
-                    logger.debug("⏳ Still generating...")
-                    self.delay(2)
-                else:
-                    logger.debug("⏳ Waiting for response to appear...")
-                    self.delay(1)
-                    
-            except Exception:
-                self.delay(1)
+        # Sleep through the network stream first - the DOM check below then confirms
+        self._await_stream_end(max_wait)
+        
+        # Last answer block has real content (not just a placeholder)
+        if self._wait_until(
+            """
+            const containers = document.querySelectorAll(args[0]);
+            if (containers.length === 0) return false;
+            
+            const lastContainer = containers[containers.length - 1];
+            const prose = lastContainer.querySelector('.prose');
+            if (!prose) return false;
+            
+            const text = prose.textContent || prose.innerText || '';
+            return text.trim().length > 10; // More than just a greeting
+            """,
+            max_wait - (time.time() - start_time),
+            self.ANSWER_SELECTOR
+        ):
+            logger.success("✅ Response generation complete!")
         else:
             logger.warning("⚠️ Response took too long, extracting what we have...")
         
@@ -210,9 +206,9 @@ class PerplexityScraper(BaseScraper):
         logger.info("📊 Extracting response text...")
         
         # Use JavaScript to get text content WITH URLs embedded
-        response_text = self.driver.execute_script("""
+        response_text = self._execute_with_helpers("""
             // Get all markdown content containers
-            const containers = document.querySelectorAll('div[id^="markdown-content-"]');
+            const containers = document.querySelectorAll(arguments[0]);
             
             if (containers.length === 0) {
                 return '';
@@ -224,33 +220,7 @@ class PerplexityScraper(BaseScraper):
             // Find the prose content inside it
             const prose = lastContainer.querySelector('.prose');
             if (prose) {
-                // Clone the element to manipulate it
-                const clone = prose.cloneNode(true);
-                
-                // Replace links with text that includes the URL
-                // Format: "link text (URL)"
-                clone.querySelectorAll('a').forEach(link => {
-                    const text = link.textContent || link.innerText || '';
-                    const href = link.getAttribute('href') || '';
-                    if (href) {
-                        link.replaceWith(document.createTextNode(`${text} (${href})`));
-                    }
-                });
-                
-                // Replace <br> with newlines
-                clone.querySelectorAll('br').forEach(br => br.replaceWith('\\n'));
-                
-                // Replace block elements with newlines
-                clone.querySelectorAll('p, div, li, h1, h2, h3, h4, h5, h6').forEach(el => {
-                    el.prepend(document.createTextNode('\\n'));
-                    el.append(document.createTextNode('\\n'));
-                });
-                
-                // Get text content
-                let text = clone.textContent || clone.innerText || '';
-                
-                // Clean up multiple newlines
-                text = text.replace(/\\n{3,}/g, '\\n\\n').trim();
+                const text = markdownToText(prose);
                 
                 // Filter out generic greetings if the response is too short
                 if (text.length < 50 && (text.includes('Hi!') || text.includes('Hello') || text.includes('What\\'s up'))) {
@@ -261,7 +231,7 @@ class PerplexityScraper(BaseScraper):
             }
             
             return '';
-        """)
+        """, self.ANSWER_SELECTOR)
         
         if not response_text or response_text.strip() == '':
             logger.warning("⚠️ Could not extract response text. Trying alternative method...")
@@ -0,0 +1,206 @@
+"""
+Scraper Pool
+Keeps initialized browser sessions warm so requests check one out instead of launching Chrome
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from loguru import logger
+from app.scrapers.base_scraper import BaseScraper, ScraperResponse
+
+
+class ScraperPool:
+    """
+    Fixed-size pool of initialized scrapers for one AI source
+    
+    Scrapers are handed out via an asyncio.Queue and recycled (closed and
+    relaunched) after a number of uses or after any failed query. A None in
+    the queue wakes one waiter to re-check the pool (relaunch failed or
+    pool closed).
+    """
+    
+    def __init__(
+        self,
+        ai_source: str,
+        factory: Callable[[], BaseScraper],
+        size: int,
+        recycle_after: int
+    ):
+        """
+        Args:
+            ai_source: Source name for logging ('chatgpt', 'gemini', 'perplexity')
+            factory: Scraper class (or callable) that builds an uninitialized scraper
+            size: Number of browsers to keep open
+            recycle_after: Queries served before a browser is replaced
+        """
+        self.ai_source = ai_source
+        self.factory = factory
+        self.size = max(1, size)
+        self.recycle_after = recycle_after
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._uses: Dict[int, int] = {}
+        self._live = 0  # Scrapers in the queue or checked out
+        self._tasks: set = set()  # Background retires - kept so they aren't garbage-collected
+        self._closed = False
+    
+    @property
+    def idle(self) -> int:
+        """Number of scrapers waiting in the pool"""
+        return self._idle.qsize()
+    
+    async def _spawn(self) -> Optional[BaseScraper]:
+        """Launch and initialize one scraper, or None if the browser failed to start"""
+        scraper = self.factory()
+        try:
+            # No interactive login wait - a logged-out browser fails fast instead of blocking startup
+            if await scraper.initialize(allow_manual_login=False):
+                self._uses[id(scraper)] = 0
+                return scraper
+            logger.error(f"❌ {self.ai_source} scraper failed to initialize")
+        except Exception as e:
+            logger.error(f"❌ Error launching {self.ai_source} scraper: {e}")
+        await scraper.cleanup()
+        return None
+    
+    async def _grow(self) -> bool:
+        """Add one scraper to the pool, returns True on success"""
+        if self._closed:
+            return False
+        self._live += 1
+        scraper = await self._spawn()
+        if scraper is None:
+            self._live -= 1
+            return False
+        if self._closed:
+            # Pool was closed while the browser launched
+            self._live -= 1
+            self._uses.pop(id(scraper), None)
+            await scraper.cleanup()
+            return False
+        self._idle.put_nowait(scraper)
+        return True
+    
+    async def start(self):
+        """Pre-launch the pool (sequential - parallel chromedriver patching races)"""
+        for _ in range(self.size):
+            await self._grow()
+        logger.info(f"🏊 {self.ai_source} pool ready ({self.idle}/{self.size} browsers)")
+    
+    async def _retire(self, scraper: BaseScraper):
+        """Close a scraper and launch its replacement"""
+        self._uses.pop(id(scraper), None)
+        self._live -= 1
+        try:
+            await scraper.cleanup()
+        except Exception as e:
+            logger.error(f"Error cleaning up {self.ai_source} scraper: {e}")
+        if not await self._grow():
+            # Wake a waiter so it relaunches (or fails) instead of waiting forever
+            self._idle.put_nowait(None)
+    
+    async def acquire(self) -> BaseScraper:
+        """
+        Check out a scraper, launching one if the pool is below size
+        
+        Returns:
+            Initialized scraper (must be handed back with release())
+        """
+        while True:
+            if self._closed:
+                self._idle.put_nowait(None)  # Pass the wake-up on to the next waiter
+                raise RuntimeError(f"{self.ai_source} scraper pool is closed")
+            if self._idle.empty() and self._live < self.size:
+                if not await self._grow():
+                    raise RuntimeError("Scraper initialization failed")
+            scraper = await self._idle.get()
+            if scraper is not None:
+                return scraper
+    
+    def release(self, scraper: BaseScraper, healthy: bool = True):
+        """
+        Return a scraper to the pool
+        
+        Args:
+            scraper: Scraper obtained from acquire()
+            healthy: False if the query failed - the browser is replaced
+        """
+        uses = self._uses.get(id(scraper), 0) + 1
+        self._uses[id(scraper)] = uses
+        
+        if healthy and uses < self.recycle_after and not self._closed:
+            self._idle.put_nowait(scraper)
+            return
+        
+        # After close() this only closes the browser - _grow won't relaunch
+        logger.info(f"♻️  Recycling {self.ai_source} browser after {uses} uses (healthy={healthy})")
+        task = asyncio.create_task(self._retire(scraper))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    @asynccontextmanager
+    async def checkout(self):
+        """Context manager around acquire()/release() that recycles on error"""
+        scraper = await self.acquire()
+        healthy = False
+        try:
+            yield scraper
+            healthy = True
+        finally:
+            self.release(scraper, healthy)
+    
+    async def query_batch(
+        self,
+        queries: Sequence[Tuple[str, Sequence[str]]]
+    ) -> List[Union[ScraperResponse, Exception]]:
+        """
+        Run queries in parallel, one per pooled browser
+        
+        At most `size` queries are in flight (one worker per browser) and each
+        browser keeps its own rate limit. A failed query only recycles the
+        browser it ran in - the worker checks out another for its next prompt.
+        
+        Args:
+            queries: (prompt, brands) pairs
+            
+        Returns:
+            One ScraperResponse or Exception per query, in order
+        """
+        results: List[Union[ScraperResponse, Exception, None]] = [None] * len(queries)
+        pending = iter(range(len(queries)))  # Shared by all workers
+        
+        async def worker():
+            for index in pending:
+                prompt, brands = queries[index]
+                try:
+                    async with self.checkout() as scraper:
+                        results[index] = await scraper.query(prompt, list(brands))
+                except Exception as e:
+                    results[index] = e
+        
+        await asyncio.gather(*(worker() for _ in range(min(self.size, len(queries)))))
+        return results
+    
+    async def close(self):
+        """
+        Close every idle scraper (called on shutdown)
+        
+        Pending retires finish without relaunching, and scrapers still checked
+        out are closed when they are released.
+        """
+        self._closed = True
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        
+        while not self._idle.empty():
+            scraper = self._idle.get_nowait()
+            if scraper is None:
+                continue
+            self._live -= 1
+            try:
+                await scraper.cleanup()
+            except Exception as e:
+                logger.error(f"Error cleaning up {self.ai_source}: {e}")
+        self._uses.clear()
+        
+        # Wake anyone still waiting in acquire() so they fail instead of hanging
+        self._idle.put_nowait(None)
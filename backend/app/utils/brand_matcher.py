@@ -0,0 +1,293 @@
+"""
+Brand Matcher
+Compiles a brand list once and finds which brands a response mentions
+"""
+import re
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Set, Tuple
+from loguru import logger
+
+try:
+    import hyperscan  # Optional - SIMD literal scan, preferred when installed
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick  # Optional - single-pass literal scan (pyahocorasick)
+except ImportError:
+    ahocorasick = None
+
+
+# Word runs of the lowercased text - normalizing punctuation and whitespace in one scan
+WORD_RE = re.compile(r'\w+')
+
+# Common CRM/PM tool aliases
+BRAND_ALIASES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'salesforce': ('sfdc', 'sales force', 'salesforce.com'),
+    'hubspot': ('hub spot', 'hubspot crm'),
+    'zoho crm': ('zoho', 'zohocrm'),
+    'pipedrive': ('pipe drive',),
+    'freshsales': ('fresh sales', 'freshworks crm'),
+    'monday crm': ('monday.com crm',),
+    'monday.com': ('monday', 'mondaycom'),
+    'sugarcrm': ('sugar crm', 'sugar'),
+    'jira': ('jira software', 'atlassian jira'),
+    'asana': ('asana.com',),
+    'trello': ('trello.com',),
+    'clickup': ('click up', 'clickup.com'),
+    'notion': ('notion.so',),
+    'linear': ('linear.app',),
+    'basecamp': ('base camp',),
+    'smartsheet': ('smart sheet',),
+    'wrike': ('wrike.com',),
+    'copper': ('copper crm',),
+    'close': ('close crm', 'close.com'),
+    'insightly': ('insightly crm',),
+})
+
+# Suffixes dropped to get a shorter variation ("Zoho CRM" -> "zoho")
+BRAND_SUFFIXES = (' crm', ' software', '.com', '.io', ' app')
+
+
+@lru_cache(maxsize=4096)
+def brand_variations(brand: str) -> Tuple[str, ...]:
+    """
+    Get common variations of a brand name
+    
+    Args:
+        brand: Brand name as stored
+        
+    Returns:
+        Known aliases plus the name without a common suffix
+    """
+    brand_lower = brand.lower()
+    variations = BRAND_ALIASES.get(brand_lower, ())
+    
+    # Check if brand ends with common suffixes and try without
+    return variations + tuple(
+        brand_lower[:-len(suffix)] for suffix in BRAND_SUFFIXES if brand_lower.endswith(suffix)
+    )
+
+
+def _is_word_char(char: str) -> bool:
+    """Same character class as \\w for str patterns"""
+    return char.isalnum() or char == '_'
+
+
+def _at_boundary(text: str, index: int) -> bool:
+    """Equivalent of \\b at position index in text"""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _at_byte_boundary(data: bytes, index: int) -> bool:
+    """Equivalent of \\b at a character-aligned byte offset in UTF-8 data"""
+    before = data[max(0, index - 4):index].decode('utf-8', 'ignore')[-1:]
+    after = data[index:index + 4].decode('utf-8', 'ignore')[:1]
+    return bool(before and _is_word_char(before)) != bool(after and _is_word_char(after))
+
+
+class _BrandRule:
+    """Compiled matching strategies for a single brand"""
+    
+    __slots__ = (
+        "brand", "literals", "anchors", "pattern", "flexible", "flexible_anchor",
+        "normalized", "normalized_literal", "no_space"
+    )
+    
+    def __init__(self, brand: str, variations: Callable[[str], List[str]]):
+        brand_lower = brand.lower()
+        self.brand = brand
+        
+        # Strategy 1: Exact word boundary match
+        self.literals = [brand_lower]
+        
+        # Strategy 2: Match without spaces (e.g., "Hub Spot" matches "hubspot").
+        # The space-free text is all word characters, so \b..\b only matches the whole string
+        brand_no_space = brand_lower.replace(' ', '')
+        self.no_space = brand_no_space if len(brand_no_space) > 3 else None
+        
+        # Strategy 3: Match with flexible spacing (e.g., "HubSpot" matches "Hub Spot")
+        self.flexible: Optional[re.Pattern] = None
+        self.flexible_anchor = ''
+        flexible_body = None
+        brand_parts = brand_lower.split()
+        if len(brand_parts) > 1:
+            flexible_body = r'\s*'.join(re.escape(part) for part in brand_parts)
+            self.flexible = re.compile(r'\b' + flexible_body + r'\b')
+            self.flexible_anchor = brand_parts[0]
+        
+        # Strategy 4: Handle CamelCase brands (e.g., "HubSpot" -> "hub spot")
+        self.normalized: Optional[re.Pattern] = None
+        self.normalized_literal = ''
+        camel_split = re.sub(r'([a-z])([A-Z])', r'\1 \2', brand).lower()
+        if camel_split != brand_lower:
+            self.literals.append(camel_split)
+            # Also try without spaces
+            self.normalized_literal = camel_split.replace(' ', '')
+            self.normalized = re.compile(r'\b' + re.escape(self.normalized_literal) + r'\b')
+        
+        # Strategy 5: Common variations and aliases
+        self.literals.extend(variation.lower() for variation in variations(brand))
+        
+        # Regex fallback: every text_lower strategy in one alternation
+        alternatives = [re.escape(literal) for literal in self.literals]
+        if flexible_body is not None:
+            alternatives.append(flexible_body)
+        self.pattern = re.compile(r'\b(?:' + '|'.join(alternatives) + r')\b')
+        
+        # Substrings at least one of which must occur for the pattern to match -
+        # most brands are absent, and `in` rules them out far faster than a regex search
+        anchors = dict.fromkeys(self.literals)
+        if flexible_body is not None:
+            anchors[self.flexible_anchor] = None
+        self.anchors = tuple(anchors)
+    
+    def matches_lower(self, text_lower: str) -> bool:
+        """Exact, flexible-spacing, CamelCase and alias strategies on the lowercased text"""
+        return (
+            any(anchor in text_lower for anchor in self.anchors)
+            and self.pattern.search(text_lower) is not None
+        )
+    
+    def matches_flexible(self, text_lower: str) -> bool:
+        """Flexible-spacing strategy alone (the literal scan covers the rest)"""
+        return (
+            self.flexible is not None
+            and self.flexible_anchor in text_lower
+            and self.flexible.search(text_lower) is not None
+        )
+    
+    def matches_rest(self, text_normalized: str, text_no_space: str) -> bool:
+        """Strategies that run on the normalized text"""
+        return self.no_space == text_no_space or (
+            self.normalized is not None
+            and self.normalized_literal in text_normalized
+            and self.normalized.search(text_normalized) is not None
+        )
+
+
+class BrandMatcher:
+    """
+    Finds brand mentions using every matching strategy at once
+    
+    Literal names, CamelCase splits and aliases are scanned in one pass
+    regardless of brand count - with a Hyperscan literal database when
+    hyperscan is installed, else an Aho-Corasick automaton when pyahocorasick
+    is. Without either, each brand uses one precompiled regex.
+    """
+    
+    def __init__(self, brands: List[str], variations: Callable[[str], List[str]]):
+        """
+        Args:
+            brands: Brand names to look for
+            variations: Returns aliases for a brand (e.g. BaseScraper._get_brand_variations)
+        """
+        self._rules = [_BrandRule(brand, variations) for brand in brands]
+        self._database = None
+        self._automaton = None
+        owners = self._literal_owners()
+        if hyperscan is not None:
+            self._database = self._build_database(owners)
+        if self._database is None and ahocorasick is not None:
+            self._automaton = self._build_automaton(owners)
+    
+    def _literal_owners(self) -> Dict[str, tuple]:
+        """Map every literal to the brands it identifies"""
+        owners: Dict[str, Set[str]] = {}
+        for rule in self._rules:
+            for literal in rule.literals:
+                if literal:
+                    owners.setdefault(literal, set()).add(rule.brand)
+        return {literal: tuple(brands) for literal, brands in owners.items()}
+    
+    def _build_database(self, owners: Dict[str, tuple]):
+        """Compile the literals into a Hyperscan block-mode database, or None on failure"""
+        if not owners:
+            return None
+        self._patterns = [(len(literal.encode()), brands) for literal, brands in owners.items()]
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=[literal.encode() for literal in owners],
+                ids=list(range(len(owners))),
+                elements=len(owners),
+                flags=0,
+                literal=True
+            )
+        except hyperscan.error as e:
+            logger.warning(f"⚠️  Hyperscan compile failed, using fallback matcher: {e}")
+            return None
+        # Scratch space can't be shared between concurrent scans - one clone per thread
+        self._scratch = hyperscan.Scratch(database)
+        self._local = threading.local()
+        return database
+    
+    def _build_automaton(self, owners: Dict[str, tuple]):
+        """Load the literals into an Aho-Corasick automaton"""
+        automaton = ahocorasick.Automaton()
+        for literal, brands in owners.items():
+            automaton.add_word(literal, (len(literal), brands))
+        automaton.make_automaton()
+        return automaton
+    
+    def _scan_database(self, text_lower: str) -> Set[str]:
+        """Hyperscan pass over the UTF-8 text, keeping matches on word boundaries"""
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = self._scratch.clone()
+        
+        data = text_lower.encode()
+        found: Set[str] = set()
+        
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context):
+            length, brands = self._patterns[pattern_id]
+            if _at_byte_boundary(data, end - length) and _at_byte_boundary(data, end):
+                found.update(brands)
+        
+        self._database.scan(data, match_event_handler=on_match, scratch=scratch)
+        return found
+    
+    def _scan_literals(self, text_lower: str) -> Set[str]:
+        """Single pass over the text, keeping matches that sit on word boundaries"""
+        if self._database is not None:
+            return self._scan_database(text_lower)
+        found: Set[str] = set()
+        for end, (length, brands) in self._automaton.iter(text_lower):
+            if _at_boundary(text_lower, end - length + 1) and _at_boundary(text_lower, end + 1):
+                found.update(brands)
+        return found
+    
+    def find(self, text: str) -> Set[str]:
+        """
+        Get the brands mentioned in text
+        
+        Args:
+            text: Response text to search
+        
+        Returns:
+            Set of matched brand names
+        """
+        text_lower = text.lower()
+        
+        # Pre-process text: punctuation and whitespace runs become single spaces
+        words = WORD_RE.findall(text_lower)
+        text_normalized = ' '.join(words)
+        text_no_space = ''.join(words)
+        
+        if self._database is None and self._automaton is None:
+            return {
+                rule.brand for rule in self._rules
+                if rule.matches_lower(text_lower) or rule.matches_rest(text_normalized, text_no_space)
+            }
+        
+        mentioned = self._scan_literals(text_lower)
+        for rule in self._rules:
+            if rule.brand in mentioned:
+                continue
+            if rule.matches_flexible(text_lower) or rule.matches_rest(text_normalized, text_no_space):
+                mentioned.add(rule.brand)
+        return mentioned
@@ -0,0 +1,66 @@
+"""
+Compression helpers for large text payloads
+Used to shrink raw HTML before it is sent to Supabase
+"""
+from typing import Union
+import zstandard as zstd
+
+
+# Reused across calls - building a compressor context is not free
+_compressor = zstd.ZstdCompressor(level=6)
+_decompressor = zstd.ZstdDecompressor()
+
+
+def compress_bytes(text: Union[str, bytes]) -> bytes:
+    """
+    Compress text with zstd
+    
+    Args:
+        text: Text to compress (e.g. raw HTML), or already UTF-8 encoded bytes
+        
+    Returns:
+        zstd frame bytes (e.g. for a .zst Storage object)
+    """
+    if isinstance(text, str):
+        text = text.encode('utf-8')
+    return _compressor.compress(text)
+
+
+def compress_text(text: str) -> str:
+    """
+    Compress text with zstd for a Postgres BYTEA column
+    
+    Args:
+        text: Text to compress (e.g. raw HTML)
+        
+    Returns:
+        Compressed bytes as a BYTEA hex literal ("\\x...") for PostgREST
+    """
+    return '\\x' + compress_bytes(text).hex()
+
+
+def decompress_bytes(data: bytes) -> str:
+    """
+    Decompress a zstd frame produced by compress_bytes
+    
+    Args:
+        data: zstd frame bytes
+        
+    Returns:
+        Original text
+    """
+    return _decompressor.decompress(data).decode('utf-8')
+
+
+def decompress_text(value: str) -> str:
+    """
+    Decompress a BYTEA hex literal produced by compress_text
+    
+    Args:
+        value: BYTEA value as returned by PostgREST ("\\x...")
+        
+    Returns:
+        Original text
+    """
+    data = bytes.fromhex(value[2:] if value.startswith('\\x') else value)
+    return decompress_bytes(data)
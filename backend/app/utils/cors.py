@@ -0,0 +1,76 @@
+"""
+Lightweight CORS middleware
+Pure ASGI wrapper that adds permissive CORS headers without per-request header parsing
+"""
+
+
+# Preflight answers are identical for every route
+_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+
+
+def _request_header(scope: dict, name: bytes) -> bytes:
+    """
+    Find a raw request header in an ASGI scope
+    
+    Args:
+        scope: ASGI connection scope
+        name: Lower-case header name
+    
+    Returns:
+        Header value, or b"" if absent
+    """
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return b""
+
+
+class CORSLite:
+    """
+    Allow-all CORS for the Next.js frontend
+    
+    Same behaviour as CORSMiddleware(allow_origins=["*"], allow_credentials=True,
+    allow_methods=["*"], allow_headers=["*"]): the request Origin is echoed back
+    so credentialed requests keep working.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        origin = _request_header(scope, b"origin")
+        if not origin:
+            # Not a cross-origin request - nothing to add
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["method"] == "OPTIONS" and _request_header(scope, b"access-control-request-method"):
+            # Preflight - answer directly without touching the app
+            headers = [(b"access-control-allow-origin", origin), *_PREFLIGHT_HEADERS]
+            requested = _request_header(scope, b"access-control-request-headers")
+            if requested:
+                headers.append((b"access-control-allow-headers", requested))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"access-control-allow-origin", origin),
+                    (b"access-control-allow-credentials", b"true"),
+                    (b"vary", b"Origin"),
+                ]
+            await send(message)
+        
+        await self.app(scope, receive, send_wrapper)
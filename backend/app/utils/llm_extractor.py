@@ -2,11 +2,128 @@
 LLM-powered extraction of structured data from AI responses
 Uses Google Gemini API to extract citations, context, sentiment, and keywords
 """
-import json
-from typing import List, Dict
+import asyncio
+import importlib.util
+import re
+from functools import lru_cache
+from typing import List, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+import httpx
+import orjson
 from loguru import logger
 from app.config import settings
 
+try:
+    from google import genai  # google-genai package - only needed with LLM_ENABLED
+    from google.genai import types as genai_types
+except ImportError:
+    genai = None
+    genai_types = None
+
+
+# Generation settings shared by every extraction call
+GENERATION_CONFIG = {
+    'temperature': 0.1,  # Low temperature for consistency
+    'top_p': 0.95,
+    'top_k': 40,
+    'max_output_tokens': 10000,  # Reduced to stay under free limits
+    'response_mime_type': 'application/json',  # Force JSON output
+}
+
+# Most extraction calls extract_many() keeps in flight at once
+EXTRACT_CONCURRENCY = 8
+
+# Keep-alive pool for the Gemini API - sized above EXTRACT_CONCURRENCY so no call waits on a socket
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+# HTTP/2 multiplexes concurrent calls over one connection, but needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Responses this short, with this few brands and no URLs, are extracted locally (no LLM call)
+LOCAL_EXTRACT_MAX_CHARS = 400
+LOCAL_EXTRACT_MAX_BRANDS = 3
+
+# Sentence boundaries for local context extraction
+SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Markdown code fence around the JSON (```json ... ```), if the model added one
+FENCE_RE = re.compile(r'^\s*```(?:json)?|```\s*$')
+
+# Host part of an http(s) URL - skips urlparse for the usual citation URL
+URL_NETLOC_RE = re.compile(r'https?://([^/?#]*)', re.IGNORECASE)
+
+# Extraction prompt, in the pieces around the prompt, response and brand list
+PROMPT_HEAD = '\nExtract structured data from this AI response about brand mentions.\n\nPROMPT: "'
+PROMPT_RESPONSE = '"\n\nRESPONSE:\n'
+PROMPT_BRANDS = '\n\nBRANDS: '
+PROMPT_INSTRUCTIONS = """
+
+For each brand, extract:
+1. Citations: URLs in format "text (URL)" - extract URL and its domain, infer title, note position
+2. Context: 2-3 sentence summary of how brand is mentioned
+3. Sentiment: positive/neutral/negative
+4. Keywords: 3-5 key themes
+
+Return valid JSON only:
+{
+  "brands": {
+    "BrandName": {
+      "citations": [{"url": "https://...", "domain": "example.com", "title": "...", "position": 1}],
+      "context": "2-3 sentence summary",
+      "sentiment": "positive",
+      "keywords": ["word1", "word2"]
+    }
+  }
+}
+
+Rules:
+- Empty citations array if no URLs
+- domain is the host part of url without "www."
+- Use "neutral" if sentiment unclear
+- Only include actually mentioned brands
+- Keep context concise (2-3 sentences max)
+"""
+
+
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client for Gemini calls
+    
+    Every LLMExtractor routes its async calls through this client by default,
+    so the TLS handshake to the API is paid once per process, not per extractor.
+    
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS)
+    return _shared_http_client
+
+
+@lru_cache(maxsize=4096)
+def url_domain(url: str) -> str:
+    """
+    Get the domain of a URL, without "www." (cached - citation URLs repeat a lot)
+    
+    Args:
+        url: Citation URL
+        
+    Returns:
+        Domain, or '' if the URL can't be parsed
+    """
+    try:
+        match = URL_NETLOC_RE.match(url)
+        if match:
+            return match.group(1).replace('www.', '')
+        parsed = urlparse(url)
+        return parsed.netloc.replace('www.', '')
+    except:
+        return ''
+
 
 class LLMExtractor:
     """
@@ -19,27 +136,127 @@ class LLMExtractor:
     - Keywords per brand (key themes/topics)
     """
     
-    def __init__(self):
-        """Initialize Gemini API client"""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize Gemini API client
+        
+        Args:
+            http_client: Async HTTP client for API calls (defaults to the shared keep-alive client)
+        """
         if not settings.GOOGLE_API_KEY:
             logger.warning("⚠️ GOOGLE_API_KEY not set - LLM extraction disabled")
             self.client = None
             return
         
+        if genai is None:
+            logger.error("❌ google-genai package not installed. Run: pip install google-genai")
+            self.client = None
+            return
+        
         try:
-            # Use the new google-genai package
-            from google import genai
-            
-            self.client = genai.Client(api_key=settings.GOOGLE_API_KEY)
+            self.client = genai.Client(
+                api_key=settings.GOOGLE_API_KEY,
+                http_options=genai_types.HttpOptions(
+                    httpx_async_client=http_client or shared_http_client()
+                )
+            )
             self.model_name = settings.LLM_MODEL
             logger.info(f"✅ LLM extractor initialized with model: {self.model_name}")
-        except ImportError:
-            logger.error("❌ google-genai package not installed. Run: pip install google-genai")
-            self.client = None
         except Exception as e:
             logger.error(f"❌ Failed to initialize LLM extractor: {e}")
             self.client = None
     
+    def _should_extract(self, brands_mentioned: List[str]) -> bool:
+        """Whether an extraction call is possible and worthwhile"""
+        if not self.client:
+            logger.warning("⚠️ LLM client not initialized - skipping extraction")
+            return False
+        
+        if not brands_mentioned:
+            logger.info("ℹ️ No brands mentioned - skipping LLM extraction")
+            return False
+        
+        return True
+    
+    def _local_extract(self, response_text: str, brands_mentioned: List[str]) -> Optional[Dict]:
+        """
+        Extract a trivial response without the LLM
+        
+        A short response with no URLs has no citations to find, so the only
+        useful output is the sentences naming each brand.
+        
+        Args:
+            response_text: The AI's response
+            brands_mentioned: List of brands that were mentioned
+            
+        Returns:
+            Same shape as extract_all_data(), or None if the LLM is needed
+        """
+        if (
+            len(response_text) >= LOCAL_EXTRACT_MAX_CHARS
+            or len(brands_mentioned) > LOCAL_EXTRACT_MAX_BRANDS
+            or 'http' in response_text
+        ):
+            return None
+        
+        sentences = [sentence.strip() for sentence in SENTENCE_RE.split(response_text) if sentence.strip()]
+        brands = {}
+        for brand in brands_mentioned:
+            brand_lower = brand.lower()
+            mentions = [sentence for sentence in sentences if brand_lower in sentence.lower()]
+            brands[brand] = {
+                'citations': [],
+                'context': ' '.join(mentions[:2]) or response_text.strip(),
+                'sentiment': 'neutral',
+                'keywords': []
+            }
+        
+        logger.info(f"ℹ️ Short response without URLs - extracted {len(brands)} brands locally")
+        return {'brands': brands}
+    
+    def _build_prompt(self, response_text: str, brands_mentioned: List[str], prompt_text: str) -> str:
+        """Build the extraction prompt for one response"""
+        return ''.join((
+            PROMPT_HEAD, prompt_text,
+            PROMPT_RESPONSE, response_text,
+            PROMPT_BRANDS, ', '.join(brands_mentioned),
+            PROMPT_INSTRUCTIONS
+        ))
+    
+    def _parse_result(self, response) -> Dict:
+        """
+        Parse a Gemini response into the extraction result
+        
+        Args:
+            response: generate_content() response
+            
+        Returns:
+            Parsed result, or {'brands': {}} if it isn't valid JSON
+        """
+        try:
+            # Get the text response, without markdown code blocks if present
+            result_text = FENCE_RE.sub('', response.text.strip())
+            
+            result = orjson.loads(result_text)
+            
+        except orjson.JSONDecodeError as e:
+            logger.error(f"❌ Failed to parse LLM response as JSON: {e}")
+            if hasattr(response, 'text'):
+                logger.error(f"Full response text ({len(response.text)} chars):")
+                logger.error(response.text)
+            else:
+                logger.error("Response text: N/A")
+            return {'brands': {}}
+        
+        # Backfill domains the model left out
+        for brand_name, brand_data in result.get('brands', {}).items():
+            for citation in brand_data.get('citations', []):
+                if 'url' in citation and 'domain' not in citation:
+                    citation['domain'] = self.extract_domain(citation['url'])
+        
+        logger.success(f"✅ Extracted data for {len(result.get('brands', {}))} brands")
+        return result
+    
     def extract_all_data(
         self, 
         response_text: str, 
@@ -73,48 +290,14 @@ class LLMExtractor:
                 }
             }
         """
-        if not self.client:
-            logger.warning("⚠️ LLM client not initialized - skipping extraction")
+        if not self._should_extract(brands_mentioned):
             return {'brands': {}}
         
-        if not brands_mentioned:
-            logger.info("ℹ️ No brands mentioned - skipping LLM extraction")
-            return {'brands': {}}
+        local_result = self._local_extract(response_text, brands_mentioned)
+        if local_result is not None:
+            return local_result
         
-        prompt = f"""
-Extract structured data from this AI response about brand mentions.
-
-PROMPT: "{prompt_text}"
-
-RESPONSE:
-{response_text}
-
-BRANDS: {', '.join(brands_mentioned)}
-
-For each brand, extract:
-1. Citations: URLs in format "text (URL)" - extract URL, infer title, note position
-2. Context: 2-3 sentence summary of how brand is mentioned
-3. Sentiment: positive/neutral/negative
-4. Keywords: 3-5 key themes
-
-Return valid JSON only:
-{{
-  "brands": {{
-    "BrandName": {{
-      "citations": [{{"url": "https://...", "title": "...", "position": 1}}],
-      "context": "2-3 sentence summary",
-      "sentiment": "positive",
-      "keywords": ["word1", "word2"]
-    }}
-  }}
-}}
-
-Rules:
-- Empty citations array if no URLs
-- Use "neutral" if sentiment unclear
-- Only include actually mentioned brands
-- Keep context concise (2-3 sentences max)
-"""
+        prompt = self._build_prompt(response_text, brands_mentioned, prompt_text)
         
         try:
             logger.info("🤖 Calling Gemini API for structured extraction...")
@@ -124,57 +307,77 @@ Rules:
             response = self.client.models.generate_content(
                 model=self.model_name,
                 contents=prompt,
-                config={
-                    'temperature': 0.1,  # Low temperature for consistency
-                    'top_p': 0.95,
-                    'top_k': 40,
-                    'max_output_tokens': 10000,  # Reduced to stay under free limits
-                    'response_mime_type': 'application/json',  # Force JSON output
-                }
+                config=GENERATION_CONFIG
             )
+            return self._parse_result(response)
             
-            # Get the text response
-            result_text = response.text.strip()
-            
-            # Remove markdown code blocks if present
-            if result_text.startswith('```json'):
-                result_text = result_text[7:]
-            if result_text.startswith('```'):
-                result_text = result_text[3:]
-            if result_text.endswith('```'):
-                result_text = result_text[:-3]
-            
-            result = json.loads(result_text.strip())
-            
-            # Extract domain from URLs
-            for brand_name, brand_data in result.get('brands', {}).items():
-                for citation in brand_data.get('citations', []):
-                    if 'url' in citation and 'domain' not in citation:
-                        citation['domain'] = self.extract_domain(citation['url'])
-            
-            logger.success(f"✅ Extracted data for {len(result.get('brands', {}))} brands")
-            return result
+        except Exception as e:
+            logger.exception(f"❌ LLM extraction failed: {e}")
+            return {'brands': {}}
+    
+    async def extract_all_data_async(
+        self,
+        response_text: str,
+        brands_mentioned: List[str],
+        prompt_text: str
+    ) -> Dict:
+        """
+        Non-blocking extract_all_data() - awaits the Gemini call instead of
+        holding up the event loop for the whole round-trip
+        
+        Args:
+            response_text: The AI's response
+            brands_mentioned: List of brands that were mentioned
+            prompt_text: Original prompt for context
             
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Failed to parse LLM response as JSON: {e}")
-            if hasattr(response, 'text'):
-                logger.error(f"Full response text ({len(response.text)} chars):")
-                logger.error(response.text)
-            else:
-                logger.error("Response text: N/A")
+        Returns:
+            Same shape as extract_all_data()
+        """
+        if not self._should_extract(brands_mentioned):
             return {'brands': {}}
+        
+        local_result = self._local_extract(response_text, brands_mentioned)
+        if local_result is not None:
+            return local_result
+        
+        prompt = self._build_prompt(response_text, brands_mentioned, prompt_text)
+        
+        try:
+            logger.info("🤖 Calling Gemini API for structured extraction...")
+            logger.debug(f"Extracting data for brands: {', '.join(brands_mentioned)}")
+            
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config=GENERATION_CONFIG
+            )
+            return self._parse_result(response)
             
         except Exception as e:
-            logger.error(f"❌ LLM extraction failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ LLM extraction failed: {e}")
             return {'brands': {}}
     
+    async def extract_many(self, items: Sequence[Tuple[str, List[str], str]]) -> List[Dict]:
+        """
+        Extract several responses concurrently on the shared client
+        
+        Up to EXTRACT_CONCURRENCY calls are in flight at once, so a batch costs
+        roughly one round-trip per EXTRACT_CONCURRENCY responses.
+        
+        Args:
+            items: (response_text, brands_mentioned, prompt_text) tuples
+            
+        Returns:
+            One extract_all_data()-shaped result per item, in order
+        """
+        semaphore = asyncio.Semaphore(EXTRACT_CONCURRENCY)
+        
+        async def extract(item: Tuple[str, List[str], str]) -> Dict:
+            async with semaphore:
+                return await self.extract_all_data_async(*item)
+        
+        return await asyncio.gather(*(extract(item) for item in items))
+    
     def extract_domain(self, url: str) -> str:
         """Extract domain from URL"""
-        from urllib.parse import urlparse
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc.replace('www.', '')
-        except:
-            return ''
+        return url_domain(url)
@@ -3,10 +3,113 @@ Local response storage manager
 Saves all scraping responses to local files for backup and analysis
 """
 import os
+import sqlite3
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional, Tuple
+import orjson
 from loguru import logger
 from app.config import settings
+from app.utils.compression import compress_bytes, decompress_bytes
+
+
+# Write buffer for response files - one syscall for all but the largest responses
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Response files hold one zstd-compressed JSON record (a single JSONL line)
+RESPONSE_FILE_SUFFIX = '.jsonl.zst'
+
+# Text files from before the JSON format (compressed, then plain) - still listed and readable
+LEGACY_FILE_SUFFIXES = ('.txt.zst', '.txt')
+
+# Index of saved files, so listing and stats don't walk the whole tree
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    response_id TEXT NOT NULL,
+    ts INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_date_platform ON files (date, platform);
+"""
+
+# Human-readable layout of a response, used by render_response() (and by legacy files)
+SEPARATOR = "=" * 80
+RESPONSE_TEMPLATE = f"""{SEPARATOR}
+SCRAPE RESPONSE - {{ai_upper}}
+{SEPARATOR}
+
+Response ID: {{response_id}}
+Timestamp: {{timestamp}}
+AI Platform: {{ai_source}}
+
+{SEPARATOR}
+PROMPT
+{SEPARATOR}
+
+{{prompt}}
+
+{SEPARATOR}
+RESPONSE
+{SEPARATOR}
+
+{{response_text}}
+
+{SEPARATOR}
+BRANDS MENTIONED ({{brand_count}})
+{SEPARATOR}
+
+{{brands}}
+
+{SEPARATOR}
+END OF RESPONSE
+{SEPARATOR}
+"""
+
+
+def render_response(record: dict) -> str:
+    """
+    Format a stored response record as readable text
+    
+    Args:
+        record: Record from ResponseStorage.read_record()
+        
+    Returns:
+        Response laid out with section headers
+    """
+    brands = record.get('brands') or []
+    ts = record['ts']
+    return RESPONSE_TEMPLATE.format_map({
+        'ai_upper': record['ai'].upper(),
+        'response_id': record['id'],
+        'timestamp': datetime.fromisoformat(ts).strftime('%Y-%m-%d %H:%M:%S') if ts else '',
+        'ai_source': record['ai'],
+        'prompt': record['prompt'],
+        'response_text': record['response'],
+        'brand_count': len(brands),
+        'brands': ', '.join(brands) if brands else 'None'
+    })
+
+
+def _scan_response_files(path: str, parts: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], os.DirEntry]]:
+    """
+    Walk a directory tree with os.scandir, yielding saved response files
+    
+    Args:
+        path: Directory to scan
+        parts: Directory names between the storage root and path
+    
+    Yields:
+        (directory names, DirEntry) for every response file
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_response_files(entry.path, parts + (entry.name,))
+            elif entry.name.endswith((RESPONSE_FILE_SUFFIX, *LEGACY_FILE_SUFFIXES)):
+                yield parts, entry
 
 
 class ResponseStorage:
@@ -19,8 +122,38 @@ class ResponseStorage:
         """Initialize storage manager"""
         self.base_path = os.path.join(settings.STORAGE_PATH, 'responses')
         os.makedirs(self.base_path, exist_ok=True)
+        
+        # Date/platform directories already created (skips a makedirs per save)
+        self._created_dirs = set()
+        
+        # File index - autocommit, WAL; one connection shared under a lock
+        index_path = os.path.join(self.base_path, 'index.db')
+        is_new_index = not os.path.exists(index_path)
+        self._index = sqlite3.connect(index_path, isolation_level=None, check_same_thread=False)
+        self._index.execute('PRAGMA journal_mode=WAL')
+        self._index.execute('PRAGMA synchronous=NORMAL')
+        self._index.executescript(INDEX_SCHEMA)
+        self._index_lock = threading.Lock()
+        if is_new_index:
+            self._rebuild_index()
+        
         logger.info(f"📁 Response storage initialized at {self.base_path}")
     
+    def _rebuild_index(self):
+        """Index files saved before the index existed (one scandir pass, no extra stat per file)"""
+        rows = []
+        for parts, entry in _scan_response_files(self.base_path):
+            if len(parts) < 2:
+                continue
+            stat = entry.stat()
+            response_id = entry.name.split('.', 1)[0].rpartition('_')[2]
+            rows.append((entry.path, parts[0], parts[1], stat.st_size, response_id, int(stat.st_mtime)))
+        
+        if rows:
+            with self._index_lock:
+                self._index.executemany('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)', rows)
+            logger.info(f"📇 Indexed {len(rows)} existing response files")
+    
     def save_response(
         self,
         response_id: str,
@@ -50,50 +183,36 @@ class ResponseStorage:
         # Create directory structure: responses/YYYY-MM-DD/ai_source/
         date_str = timestamp.strftime('%Y-%m-%d')
         platform_dir = os.path.join(self.base_path, date_str, ai_source)
-        os.makedirs(platform_dir, exist_ok=True)
+        if platform_dir not in self._created_dirs:
+            os.makedirs(platform_dir, exist_ok=True)
+            self._created_dirs.add(platform_dir)
         
         # Create filename with timestamp and ID
         time_str = timestamp.strftime('%H-%M-%S')
-        filename = f"{time_str}_{response_id[:8]}.txt"
+        filename = f"{time_str}_{response_id[:8]}{RESPONSE_FILE_SUFFIX}"
         filepath = os.path.join(platform_dir, filename)
         
-        # Prepare content
-        separator = "=" * 80
-        content = f"""{separator}
-SCRAPE RESPONSE - {ai_source.upper()}
-{separator}
-
-Response ID: {response_id}
-Timestamp: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-AI Platform: {ai_source}
-
-{separator}
-PROMPT
-{separator}
-
-{prompt}
-
-{separator}
-RESPONSE
-{separator}
-
-{response_text}
-
-{separator}
-BRANDS MENTIONED ({len(brands_mentioned)})
-{separator}
-
-{', '.join(brands_mentioned) if brands_mentioned else 'None'}
-
-{separator}
-END OF RESPONSE
-{separator}
-"""
+        # One compact JSON line - render_response() gives the readable layout on demand
+        record = {
+            'id': response_id,
+            'ts': timestamp.isoformat(),
+            'ai': ai_source,
+            'prompt': prompt,
+            'response': response_text,
+            'brands': brands_mentioned
+        }
         
         # Write to file
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            data = compress_bytes(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(data)
+            
+            with self._index_lock:
+                self._index.execute(
+                    'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)',
+                    (filepath, date_str, ai_source, len(data), response_id, int(timestamp.timestamp()))
+                )
             
             logger.info(f"💾 Response saved to: {filepath}")
             return filepath
@@ -116,10 +235,53 @@ END OF RESPONSE
         """
         date_str = timestamp.strftime('%Y-%m-%d')
         time_str = timestamp.strftime('%H-%M-%S')
-        filename = f"{time_str}_{response_id[:8]}.txt"
+        filename = f"{time_str}_{response_id[:8]}{RESPONSE_FILE_SUFFIX}"
         
         return os.path.join(self.base_path, date_str, ai_source, filename)
     
+    def read_response(self, filepath: str) -> str:
+        """
+        Read a stored response file
+        
+        Args:
+            filepath: Path from save_response(), list_responses() or get_response_path()
+            
+        Returns:
+            File contents as text ("" if it can't be read)
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+            if filepath.endswith('.zst'):
+                return decompress_bytes(data)
+            return data.decode('utf-8')
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to read response file: {e}")
+            return ""
+    
+    def read_record(self, filepath: str) -> Optional[dict]:
+        """
+        Read a stored response as a record
+        
+        Args:
+            filepath: Path from save_response(), list_responses() or get_response_path()
+            
+        Returns:
+            Dict with id, ts, ai, prompt, response and brands, or None for
+            legacy text files and unreadable files
+        """
+        if not filepath.endswith(RESPONSE_FILE_SUFFIX):
+            return None
+        content = self.read_response(filepath)
+        if not content:
+            return None
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"❌ Failed to parse response file: {e}")
+            return None
+    
     def list_responses(self, ai_source: Optional[str] = None, date: Optional[str] = None) -> list:
         """
         List all stored response files
@@ -131,25 +293,23 @@ END OF RESPONSE
         Returns:
             List of file paths
         """
-        responses = []
+        conditions = []
+        params = []
+        if date:
+            conditions.append('date = ?')
+            params.append(date)
+        if ai_source:
+            conditions.append('platform = ?')
+            params.append(ai_source)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
         
         try:
-            if date:
-                # Search specific date
-                search_path = os.path.join(self.base_path, date)
-                if ai_source:
-                    search_path = os.path.join(search_path, ai_source)
-            else:
-                # Search all dates
-                search_path = self.base_path
-            
-            # Walk through directory structure
-            for root, dirs, files in os.walk(search_path):
-                for file in files:
-                    if file.endswith('.txt'):
-                        responses.append(os.path.join(root, file))
-            
-            return sorted(responses, reverse=True)  # Most recent first
+            with self._index_lock:
+                rows = self._index.execute(
+                    f'SELECT path FROM files{where} ORDER BY path DESC',  # Most recent first
+                    params
+                ).fetchall()
+            return [row[0] for row in rows]
             
         except Exception as e:
             logger.error(f"❌ Error listing responses: {e}")
@@ -170,25 +330,15 @@ END OF RESPONSE
         }
         
         try:
-            for root, dirs, files in os.walk(self.base_path):
-                for file in files:
-                    if file.endswith('.txt'):
-                        stats['total_responses'] += 1
-                        
-                        # Get file size
-                        filepath = os.path.join(root, file)
-                        size = os.path.getsize(filepath)
-                        stats['total_size_mb'] += size / (1024 * 1024)
-                        
-                        # Extract platform and date from path
-                        parts = root.replace(self.base_path, '').strip(os.sep).split(os.sep)
-                        if len(parts) >= 2:
-                            date = parts[0]
-                            platform = parts[1]
-                            
-                            stats['by_platform'][platform] = stats['by_platform'].get(platform, 0) + 1
-                            stats['by_date'][date] = stats['by_date'].get(date, 0) + 1
+            with self._index_lock:
+                total, size = self._index.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM files').fetchone()
+                by_platform = self._index.execute('SELECT platform, COUNT(*) FROM files GROUP BY platform').fetchall()
+                by_date = self._index.execute('SELECT date, COUNT(*) FROM files GROUP BY date').fetchall()
             
+            stats['total_responses'] = total
+            stats['total_size_mb'] = size / (1024 * 1024)
+            stats['by_platform'] = dict(by_platform)
+            stats['by_date'] = dict(by_date)
             return stats
             
         except Exception as e:
@@ -0,0 +1,19 @@
+"""
+Fast JSON responses
+orjson-backed replacement for FastAPI's stdlib JSONResponse
+"""
+import orjson
+from typing import Any
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson
+    
+    orjson handles UUID/datetime natively, so handlers can return database rows
+    directly in this response and skip FastAPI's jsonable_encoder pass.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
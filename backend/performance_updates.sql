@@ -0,0 +1,153 @@
+-- ============================================================================
+-- AI Visibility Tracker - Performance Updates
+-- Functions and indexes used by the worker and API hot paths
+-- Run this AFTER supabase_schema.sql and llm_extraction_schema.sql
+-- ============================================================================
+
+-- 1. Composite index for "was this prompt scraped recently by this AI source?"
+CREATE INDEX IF NOT EXISTS idx_responses_prompt_source_time
+    ON responses(prompt_id, ai_source, created_at DESC);
+
+-- 2. Pending prompts for a worker (single round-trip anti-join)
+-- Returns prompts with no response from p_ai_source since p_cutoff
+CREATE OR REPLACE FUNCTION get_pending_prompts(
+    p_ai_source TEXT,
+    p_category_id TEXT DEFAULT NULL,
+    p_cutoff TIMESTAMP WITH TIME ZONE DEFAULT NOW() - INTERVAL '2 hours',
+    p_limit INTEGER DEFAULT 10
+)
+RETURNS SETOF prompts AS $$
+    SELECT p.*
+    FROM prompts p
+    WHERE (p_category_id IS NULL OR p.category_id = p_category_id)
+      AND NOT EXISTS (
+          SELECT 1
+          FROM responses r
+          WHERE r.prompt_id = p.id
+            AND r.ai_source = p_ai_source
+            AND r.created_at >= p_cutoff
+      )
+    ORDER BY p.created_at, p.id
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION get_pending_prompts IS 'Prompts not scraped by an AI source since the cutoff (worker queue)';
+
+-- 3. Response counts for a category (aggregated server-side)
+-- Returns a single row so the API never downloads responses just to count them
+CREATE OR REPLACE FUNCTION get_category_response_stats(p_category_id TEXT)
+RETURNS TABLE (
+    total_responses BIGINT,
+    chatgpt_responses BIGINT,
+    gemini_responses BIGINT,
+    completed_responses BIGINT
+) AS $$
+    SELECT
+        COUNT(*) AS total_responses,
+        COUNT(*) FILTER (WHERE r.ai_source = 'chatgpt') AS chatgpt_responses,
+        COUNT(*) FILTER (WHERE r.ai_source = 'gemini') AS gemini_responses,
+        COUNT(*) FILTER (WHERE r.status = 'completed') AS completed_responses
+    FROM responses r
+    INNER JOIN prompts p ON p.id = r.prompt_id
+    WHERE p.category_id = p_category_id;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION get_category_response_stats IS 'Response counts per AI source and status for category analytics';
+
+-- 4. Compressed raw HTML (zstd, written by the scraper instead of raw_html)
+-- brands_mentioned is already TEXT[] with a GIN index (supabase_schema.sql)
+ALTER TABLE responses
+ADD COLUMN IF NOT EXISTS raw_html_zstd BYTEA;
+
+COMMENT ON COLUMN responses.raw_html_zstd IS 'zstd-compressed raw HTML (debugging only)';
+
+-- Large pages are uploaded to Supabase Storage instead (responses/{id}.html.zst)
+ALTER TABLE responses
+ADD COLUMN IF NOT EXISTS raw_html_key TEXT;
+
+INSERT INTO storage.buckets (id, name, public)
+VALUES ('scrape-artifacts', 'scrape-artifacts', false)
+ON CONFLICT (id) DO NOTHING;
+
+COMMENT ON COLUMN responses.raw_html_key IS 'Storage object key of zstd-compressed raw HTML (bucket: scrape-artifacts)';
+
+-- 5. Bulk partial update of scraped responses (write-behind buffer)
+-- p_updates: JSON array of {id, response_text, brands_mentioned, status, error_message?, raw_html_zstd?, raw_html_key?}
+CREATE OR REPLACE FUNCTION update_responses_batch(p_updates JSONB)
+RETURNS VOID AS $$
+    UPDATE responses r
+    SET
+        response_text = u.response_text,
+        brands_mentioned = COALESCE(u.brands_mentioned, '{}'),
+        status = u.status,
+        error_message = COALESCE(u.error_message, r.error_message),
+        raw_html_zstd = COALESCE(u.raw_html_zstd, r.raw_html_zstd),
+        raw_html_key = COALESCE(u.raw_html_key, r.raw_html_key),
+        completed_at = NOW()
+    FROM jsonb_to_recordset(p_updates) AS u(
+        id UUID,
+        response_text TEXT,
+        brands_mentioned TEXT[],
+        status VARCHAR(20),
+        error_message TEXT,
+        raw_html_zstd BYTEA,
+        raw_html_key TEXT
+    )
+    WHERE r.id = u.id;
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION update_responses_batch IS 'Apply many scrape results in one statement (used by the API/worker write buffer)';
+
+-- 6. Wake idle workers when a prompt is added (LISTEN new_prompt, see worker.py)
+CREATE OR REPLACE FUNCTION notify_new_prompt()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('new_prompt', NEW.id::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS prompts_notify_new ON prompts;
+CREATE TRIGGER prompts_notify_new
+    AFTER INSERT ON prompts
+    FOR EACH ROW EXECUTE FUNCTION notify_new_prompt();
+
+COMMENT ON FUNCTION notify_new_prompt IS 'NOTIFY new_prompt with the new prompt id so waiting workers skip their poll interval';
+
+-- 7. Claim pending prompts for a worker (fetch + 'processing' response rows in one transaction)
+-- Claims for one AI source are serialized by an advisory lock, so two workers (or a
+-- restarted one) never get the same prompt. Returns each prompt with its new response id
+CREATE OR REPLACE FUNCTION claim_pending_prompts(
+    p_ai_source TEXT,
+    p_category_id TEXT DEFAULT NULL,
+    p_cutoff TIMESTAMP WITH TIME ZONE DEFAULT NOW() - INTERVAL '2 hours',
+    p_limit INTEGER DEFAULT 10
+)
+RETURNS TABLE (
+    id UUID,
+    text TEXT,
+    category_id VARCHAR(100),
+    created_at TIMESTAMP WITH TIME ZONE,
+    response_id UUID
+) AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('claim_pending_prompts:' || p_ai_source));
+    
+    RETURN QUERY
+    WITH pending AS (
+        SELECT p.id, p.text, p.category_id, p.created_at
+        FROM get_pending_prompts(p_ai_source, p_category_id, p_cutoff, p_limit) p
+    ), claimed AS (
+        INSERT INTO responses (prompt_id, prompt_text, ai_source, brands_mentioned, status)
+        SELECT pending.id, pending.text, p_ai_source, '{}', 'processing'
+        FROM pending
+        RETURNING responses.id AS response_id, responses.prompt_id
+    )
+    SELECT pending.id, pending.text, pending.category_id, pending.created_at, claimed.response_id
+    FROM pending
+    JOIN claimed ON claimed.prompt_id = pending.id
+    ORDER BY pending.created_at, pending.id;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION claim_pending_prompts IS 'Atomically take pending prompts for an AI source and create their processing responses (worker queue)';
@@ -6,9 +6,15 @@ Usage:
     python setup_gemini_login.py
 """
 import asyncio
+import os
 from loguru import logger
+
+# Force visible mode and disable proxy for clean cookie capture.
+# Settings are frozen once loaded, so override via the environment before app imports.
+os.environ['HEADLESS'] = 'false'
+os.environ['USE_PROXY'] = 'false'  # Disable proxy to avoid domain issues
+
 from app.scrapers.gemini_scraper import GeminiScraper
-from app.config import settings
 
 
 async def setup_login():
@@ -21,12 +27,6 @@ async def setup_login():
     logger.info("Cookies will be saved for future headless use.")
     logger.info("=" * 80 + "\n")
     
-    # Force visible mode and disable proxy temporarily for clean cookie capture
-    original_headless = settings.HEADLESS
-    original_proxy = settings.USE_PROXY
-    settings.HEADLESS = False
-    settings.USE_PROXY = False  # Disable proxy to avoid domain issues
-    
     scraper = None
     try:
         scraper = GeminiScraper()
@@ -45,11 +45,11 @@ async def setup_login():
         logger.info("1. The browser window should now be open at gemini.google.com")
         logger.info("2. Log in with your Google account")
         logger.info("3. Wait until you see the Gemini chat interface")
-        logger.info("4. This script will automatically save cookies in 90 seconds...")
+        logger.info("4. This script saves cookies as soon as you're logged in (up to 3 minutes)...")
         logger.info("=" * 80 + "\n")
         
-        # Wait for user to log in
-        await asyncio.sleep(90)
+        # Wait for user to log in (returns as soon as the chat interface shows up)
+        is_logged_in = await scraper.wait_for_login()
         
         # Save cookies
         logger.info("💾 Saving cookies...")
@@ -59,10 +59,6 @@ async def setup_login():
         logger.success("✅ Cookies saved successfully!")
         logger.success(f"✅ Cookie file: {scraper.cookies_path}")
         
-        # Verify login works
-        logger.info("\n🔍 Verifying login status...")
-        is_logged_in = await scraper.check_login_status()
-        
         if is_logged_in:
             logger.success("✅ Login verified! You're all set!")
         else:
@@ -75,15 +71,9 @@ async def setup_login():
         logger.info("\n⚠️  Interrupted by user")
         return False
     except Exception as e:
-        logger.error(f"❌ Error: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"❌ Error: {e}")
         return False
     finally:
-        # Restore original settings
-        settings.HEADLESS = original_headless
-        settings.USE_PROXY = original_proxy
-        
         if scraper:
             logger.info("\n⏳ Waiting 5 seconds before closing browser...")
             await asyncio.sleep(5)
@@ -3,12 +3,31 @@ Test LLM extraction on existing responses
 Run this to extract data from responses that were scraped before LLM feature was added
 """
 import asyncio
+import time
 from loguru import logger
 from app.database import db
 from app.utils.llm_extractor import LLMExtractor
 from app.config import settings
 
 
+# Columns the extraction scripts read - skips wide columns like raw_html
+TEST_RESPONSE_COLUMNS = 'id,ai_source,response_text,brands_mentioned,prompt_text'
+BATCH_RESPONSE_COLUMNS = 'id,response_text,brands_mentioned,prompt_text'
+
+# Responses fetched per page in batch_extract_all
+RESPONSE_PAGE_SIZE = 500
+
+# Response ids per citations lookup in batch_extract_all
+CITATION_CHECK_CHUNK = 200
+
+# Rows per page of that lookup (PostgREST's default max-rows)
+CITATION_PAGE_SIZE = 1000
+
+# Batch extraction pacing: Gemini free tier allows 15 requests/minute
+REQUEST_INTERVAL = 60 / 15
+EXTRACTION_CONCURRENCY = 5
+
+
 async def test_extraction():
     """Test LLM extraction on a few existing responses"""
     
@@ -24,7 +43,7 @@ async def test_extraction():
     # Get a few completed responses
     logger.info("📊 Fetching completed responses...")
     result = db.client.table('responses')\
-        .select('*')\
+        .select(TEST_RESPONSE_COLUMNS)\
         .eq('status', 'completed')\
         .not_.is_('brands_mentioned', 'null')\
         .limit(3)\
@@ -76,21 +95,7 @@ async def test_extraction():
         if save == 'y':
             logger.info("💾 Saving to database...")
             
-            for brand_name, brand_data in extracted_data.get('brands', {}).items():
-                # Save citations
-                if brand_data.get('citations'):
-                    await db.save_citations(
-                        response_id=response['id'],
-                        brand_name=brand_name,
-                        citations=brand_data['citations']
-                    )
-                
-                # Save mention context
-                await db.save_brand_mention(
-                    response_id=response['id'],
-                    brand_name=brand_name,
-                    mention_data=brand_data
-                )
+            await db.save_extraction(response['id'], extracted_data.get('brands', {}))
             
             logger.success("✅ Saved to database")
         else:
@@ -115,31 +120,48 @@ async def batch_extract_all():
     
     # Get all completed responses without citations
     logger.info("📊 Fetching responses...")
-    result = db.client.table('responses')\
-        .select('*')\
-        .eq('status', 'completed')\
-        .not_.is_('brands_mentioned', 'null')\
-        .execute()
+    responses = []
+    offset = 0
+    while True:
+        # Paged (ordered by id so pages don't overlap) - PostgREST caps rows per request
+        result = db.client.table('responses')\
+            .select(BATCH_RESPONSE_COLUMNS)\
+            .eq('status', 'completed')\
+            .not_.is_('brands_mentioned', 'null')\
+            .order('id')\
+            .range(offset, offset + RESPONSE_PAGE_SIZE - 1)\
+            .execute()
+        responses.extend(result.data)
+        if len(result.data) < RESPONSE_PAGE_SIZE:
+            break
+        offset += RESPONSE_PAGE_SIZE
     
-    if not result.data:
+    if not responses:
         logger.warning("⚠️ No responses found")
         return
     
-    responses = result.data
     logger.info(f"✅ Found {len(responses)} responses")
     
-    # Filter out responses that already have citations
-    responses_to_process = []
-    for response in responses:
-        # Check if citations exist
-        citations = db.client.table('citations')\
-            .select('id')\
-            .eq('response_id', response['id'])\
-            .limit(1)\
-            .execute()
-        
-        if not citations.data:
-            responses_to_process.append(response)
+    # Filter out responses that already have citations - one query per chunk of ids
+    # (ids go in the URL, so chunks keep it well under request-line limits)
+    response_ids = [response['id'] for response in responses]
+    has_citations = set()
+    for start in range(0, len(response_ids), CITATION_CHECK_CHUNK):
+        chunk = response_ids[start:start + CITATION_CHECK_CHUNK]
+        offset = 0
+        while True:
+            # Paged - a chunk can have more citation rows than PostgREST returns at once
+            citations = db.client.table('citations')\
+                .select('response_id')\
+                .in_('response_id', chunk)\
+                .range(offset, offset + CITATION_PAGE_SIZE - 1)\
+                .execute()
+            has_citations.update(row['response_id'] for row in citations.data)
+            if len(citations.data) < CITATION_PAGE_SIZE:
+                break
+            offset += CITATION_PAGE_SIZE
+    
+    responses_to_process = [response for response in responses if response['id'] not in has_citations]
     
     logger.info(f"📋 {len(responses_to_process)} responses need extraction")
     
@@ -152,43 +174,48 @@ async def batch_extract_all():
     
     success_count = 0
     error_count = 0
-    
-    for i, response in enumerate(responses_to_process, 1):
-        logger.info(f"\n[{i}/{len(responses_to_process)}] Processing {response['id']}...")
-        
-        try:
-            # Extract data
-            extracted_data = extractor.extract_all_data(
-                response_text=response['response_text'],
-                brands_mentioned=response['brands_mentioned'],
-                prompt_text=response['prompt_text']
-            )
+    total = len(responses_to_process)
+    
+    # Up to EXTRACTION_CONCURRENCY calls in flight, starts spaced REQUEST_INTERVAL apart
+    # (15/min limit) - replaces a fixed 4 second sleep after every finished call
+    semaphore = asyncio.Semaphore(EXTRACTION_CONCURRENCY)
+    start_lock = asyncio.Lock()
+    next_start = 0.0
+    
+    async def wait_for_slot():
+        nonlocal next_start
+        async with start_lock:
+            now = time.monotonic()
+            if next_start > now:
+                await asyncio.sleep(next_start - now)
+            next_start = max(now, next_start) + REQUEST_INTERVAL
+    
+    async def process(i: int, response: dict):
+        nonlocal success_count, error_count
+        async with semaphore:
+            await wait_for_slot()
+            logger.info(f"\n[{i}/{total}] Processing {response['id']}...")
             
-            # Save to database
-            for brand_name, brand_data in extracted_data.get('brands', {}).items():
-                if brand_data.get('citations'):
-                    await db.save_citations(
-                        response_id=response['id'],
-                        brand_name=brand_name,
-                        citations=brand_data['citations']
-                    )
-                
-                await db.save_brand_mention(
-                    response_id=response['id'],
-                    brand_name=brand_name,
-                    mention_data=brand_data
+            try:
+                # Extract data
+                extracted_data = await extractor.extract_all_data_async(
+                    response_text=response['response_text'],
+                    brands_mentioned=response['brands_mentioned'],
+                    prompt_text=response['prompt_text']
                 )
-            
-            success_count += 1
-            logger.success(f"✅ [{i}/{len(responses_to_process)}] Success")
-            
-            # Rate limiting - wait 4 seconds between requests (15/min limit)
-            if i < len(responses_to_process):
-                await asyncio.sleep(4)
-            
-        except Exception as e:
-            error_count += 1
-            logger.error(f"❌ [{i}/{len(responses_to_process)}] Error: {e}")
+                
+                # Save to database
+                if not await db.save_extraction(response['id'], extracted_data.get('brands', {})):
+                    raise RuntimeError("Failed to save extraction")
+                
+                success_count += 1
+                logger.success(f"✅ [{i}/{total}] Success")
+                
+            except Exception as e:
+                error_count += 1
+                logger.error(f"❌ [{i}/{total}] Error: {e}")
+    
+    await asyncio.gather(*(process(i, response) for i, response in enumerate(responses_to_process, 1)))
     
     logger.info("\n" + "=" * 80)
     logger.info("📊 BATCH EXTRACTION COMPLETE")
@@ -3,24 +3,51 @@ Background Worker for Continuous AI Scraping
 Runs independently and continuously scrapes pending prompts
 """
 import asyncio
+import multiprocessing
+import signal
 from loguru import logger
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Set
 import sys
 
 from app.database import db
+from app.scrapers.base_scraper import BaseScraper, ScraperResponse
 from app.scrapers.chatgpt_scraper import ChatGPTScraper
 from app.scrapers.gemini_scraper import GeminiScraper
 from app.scrapers.perplexity_scraper import PerplexityScraper
 from app.config import settings
 from app.utils.llm_extractor import LLMExtractor
 
+try:
+    import asyncpg  # Optional - LISTEN/NOTIFY wake-up instead of polling for new prompts
+except ImportError:
+    asyncpg = None
+
+try:
+    import uvloop  # Cheaper per await than the default loop; no Windows build
+except ImportError:
+    uvloop = None
+
+
+# Failed prompts stretch the gap between prompt starts, doubling up to this factor
+MAX_BACKOFF = 8
+
+# Prompts fetched per iteration
+PROMPT_BATCH_SIZE = 15
+
+# Longest wait for new prompts when none are pending (also the poll interval without LISTEN)
+IDLE_WAIT_SECONDS = 300
+
+# Channel notified by the prompts insert trigger (performance_updates.sql)
+NEW_PROMPT_CHANNEL = 'new_prompt'
+
 
 class ScraperWorker:
     """
     Background worker that continuously scrapes prompts from the queue
     
-    Uses fresh browser instances for each prompt to ensure clean state.
+    Each prompt runs in a fresh conversation on a warm pooled browser.
+    Up to one prompt per pooled browser runs at once.
     """
     
     def __init__(self, ai_source: str):
@@ -35,52 +62,77 @@ class ScraperWorker:
         self.prompts_completed = 0
         self.errors = 0
         self.last_scrape_at: Optional[datetime] = None
+        self._extractor: Optional[LLMExtractor] = None  # One Gemini client for every prompt
+        self._extraction_tasks: Set[asyncio.Task] = set()  # Extractions still running
+        
+        # Prompts in flight at once - one per warm browser, so none waits on a cold launch
+        self.concurrency = max(1, settings.BROWSER_POOL_SIZE)
+        self._slots = asyncio.Semaphore(self.concurrency)
+        
+        # Prompt starts are spaced evenly for the whole source (widened while prompts fail)
+        self._start_interval = 60 / settings.WORKER_PROMPTS_PER_MINUTE
+        self._backoff = 1
+        self._next_start = 0.0
+        self._start_lock = asyncio.Lock()
+        
+        # Set by a NOTIFY on NEW_PROMPT_CHANNEL - ends the idle wait early
+        self._wake = asyncio.Event()
+        
+        # Set by stop() - every wait in the worker ends as soon as it is set
+        self._stop = asyncio.Event()
+        self._listen_conn = None
         
         logger.info(f"🤖 Worker initialized for {ai_source}")
     
-    async def process_prompt(self, prompt: dict) -> bool:
+    async def process_prompt(self, prompt: dict, response_record: Optional[dict] = None) -> bool:
         """
-        Process a single prompt with FRESH browser instance
+        Process a single prompt in a fresh conversation on a pooled browser
         
         Args:
             prompt: Prompt dictionary from database
+            response_record: Response row already created for this prompt (created here if None)
             
         Returns:
             True if successful, False otherwise
         """
         scraper = None
-        response_record = None
         
         try:
-            logger.info("\n" + "=" * 80)
-            logger.info(f"🔄 Processing prompt: {prompt['id']}")
-            logger.info(f"📝 Text: {prompt['text'][:80]}...")
-            logger.info("=" * 80)
+            logger.info("🔄 Processing prompt: {}", prompt['id'])
+            logger.debug("📝 Text: {}...", prompt['text'][:80])
             
             # Get brands for this category
             brands = await db.get_brand_names(prompt['category_id'])
             if not brands:
                 logger.warning(f"⚠️ No brands found for category: {prompt['category_id']}")
+                if response_record:
+                    await db.update_response(
+                        response_id=response_record['id'],
+                        response_text="",
+                        brands_mentioned=[],
+                        status='failed',
+                        error_message="No brands for category"
+                    )
                 return False
             
-            logger.info(f"🏷️  Tracking {len(brands)} brands")
+            logger.debug("🏷️  Tracking {} brands", len(brands))
             
-            # Create response record
-            response_record = await db.create_response(
-                prompt_id=prompt['id'],
-                prompt_text=prompt['text'],
-                ai_source=self.ai_source
-            )
+            # Create response record (unless the batch already did)
+            if response_record is None:
+                response_record = await db.create_response(
+                    prompt_id=prompt['id'],
+                    prompt_text=prompt['text'],
+                    ai_source=self.ai_source
+                )
             
             if not response_record:
                 logger.error("❌ Failed to create response record")
                 return False
             
             response_id = response_record['id']
-            logger.info(f"✅ Created response record: {response_id}")
+            logger.debug("✅ Using response record: {}", response_id)
             
-            # Create fresh scraper instance
-            logger.info(f"🔧 Creating fresh {self.ai_source} scraper instance...")
+            # Create scraper instance (browser comes from the warm pool)
             if self.ai_source == 'chatgpt':
                 scraper = ChatGPTScraper()
             elif self.ai_source == 'gemini':
@@ -91,9 +143,18 @@ class ScraperWorker:
                 logger.error(f"❌ Unsupported AI source: {self.ai_source}")
                 return False
             
-            # Execute query with fresh browser (opens, queries, closes automatically)
-            logger.info("🔍 Querying AI platform with fresh browser...")
-            result = await scraper.query_with_fresh_browser(prompt['text'], brands)
+            # Execute query on a pooled browser (returned to the pool afterwards).
+            # A hung browser (e.g. stuck on a challenge page) is killed on timeout
+            # instead of holding its slot - a launch still in progress quits itself.
+            # A logged-out browser fails fast: nobody logs in to a worker's browser
+            logger.debug("🔍 Querying AI platform...")
+            try:
+                result = await asyncio.wait_for(
+                    scraper.query_with_fresh_browser(prompt['text'], brands, allow_manual_login=False),
+                    timeout=settings.SCRAPE_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                raise RuntimeError(f"{self.ai_source} query timed out after {settings.SCRAPE_TIMEOUT_SECONDS}s")
             
             # Update database
             await db.update_response(
@@ -104,45 +165,19 @@ class ScraperWorker:
                 raw_html=result.raw_html
             )
             
-            # LLM-powered extraction (if enabled and brands were mentioned)
+            # LLM-powered extraction (if enabled and brands were mentioned).
+            # Runs in the background so the next prompt's scrape overlaps the LLM call
             if settings.LLM_ENABLED and result.brands_mentioned:
-                logger.info("🤖 Starting LLM-powered extraction...")
-                try:
-                    extractor = LLMExtractor()
-                    
-                    # Single LLM call to extract everything
-                    extracted_data = extractor.extract_all_data(
-                        response_text=result.text,
-                        brands_mentioned=result.brands_mentioned,
-                        prompt_text=prompt['text']
-                    )
-                    
-                    # Process each brand's data
-                    for brand_name, brand_data in extracted_data.get('brands', {}).items():
-                        # Save citations
-                        if brand_data.get('citations'):
-                            await db.save_citations(
-                                response_id=response_id,
-                                brand_name=brand_name,
-                                citations=brand_data['citations']
-                            )
-                        
-                        # Save mention context
-                        await db.save_brand_mention(
-                            response_id=response_id,
-                            brand_name=brand_name,
-                            mention_data=brand_data
-                        )
-                    
-                    logger.success(f"✅ LLM extraction complete for {len(extracted_data.get('brands', {}))} brands")
-                    
-                except Exception as llm_error:
-                    logger.error(f"❌ LLM extraction failed (non-fatal): {llm_error}")
-                    # Don't fail the whole process if LLM extraction fails
+                task = asyncio.create_task(self._extract_and_save(response_id, result, prompt['text']))
+                self._extraction_tasks.add(task)
+                task.add_done_callback(self._extraction_tasks.discard)
             
-            logger.success(f"✅ Prompt processed successfully")
-            logger.success(f"📊 Response: {len(result.text)} chars")
-            logger.success(f"🏷️  Brands mentioned: {', '.join(result.brands_mentioned) if result.brands_mentioned else 'None'}")
+            logger.success(
+                "✅ Prompt {} processed | 📊 {} chars | 🏷️  {}",
+                prompt['id'],
+                len(result.text),
+                ', '.join(result.brands_mentioned) if result.brands_mentioned else 'None'
+            )
             
             self.prompts_completed += 1
             self.last_scrape_at = datetime.now()
@@ -150,9 +185,7 @@ class ScraperWorker:
             return True
             
         except Exception as e:
-            logger.error(f"❌ Error processing prompt: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Error processing prompt: {e}")
             
             self.errors += 1
             
@@ -179,11 +212,200 @@ class ScraperWorker:
                 except:
                     pass
     
+    async def _extract_and_save(self, response_id: str, result: ScraperResponse, prompt_text: str):
+        """
+        LLM-powered extraction for one scraped response, saved to the database
+        
+        Failures are logged and swallowed - extraction is non-fatal.
+        
+        Args:
+            response_id: UUID of the response record
+            result: Scraped response
+            prompt_text: Original prompt for context
+        """
+        logger.debug("🤖 Starting LLM-powered extraction for {}", response_id)
+        try:
+            if self._extractor is None:
+                self._extractor = LLMExtractor()
+            
+            # Single LLM call to extract everything
+            extracted_data = await self._extractor.extract_all_data_async(
+                response_text=result.text,
+                brands_mentioned=result.brands_mentioned,
+                prompt_text=prompt_text
+            )
+            
+            # Save every brand's citations and mention context (one insert per table)
+            await db.save_extraction(response_id, extracted_data.get('brands', {}))
+            
+            logger.debug("✅ LLM extraction complete for {} brands", len(extracted_data.get('brands', {})))
+            
+        except Exception as llm_error:
+            logger.error(f"❌ LLM extraction failed (non-fatal): {llm_error}")
+            # Don't fail the whole process if LLM extraction fails
+    
+    async def _process_in_slot(
+        self,
+        prompt: dict,
+        response_record: Optional[dict] = None,
+        on_start: Optional[Callable[[], None]] = None
+    ) -> bool:
+        """
+        Process a prompt once a browser slot is free and its start time has come
+        
+        Args:
+            prompt: Prompt dictionary from database
+            response_record: Response row created for the prompt up front, if any
+            on_start: Called once the prompt has a slot and is about to run
+            
+        Returns:
+            True if successful, False otherwise (or if the worker was stopped)
+        """
+        async with self._slots:
+            await self._wait_for_turn()
+            
+            if not self.is_running:
+                if response_record:
+                    # Created with the batch but never scraped - don't leave it 'processing'
+                    await db.update_response(
+                        response_id=response_record['id'],
+                        response_text="",
+                        brands_mentioned=[],
+                        status='failed',
+                        error_message="Worker stopped"
+                    )
+                return False
+            
+            if on_start is not None:
+                on_start()
+            success = await self.process_prompt(prompt, response_record)
+            
+            if success:
+                self._backoff = 1
+            else:
+                # Likely throttled or blocked - slow down until a prompt goes through
+                self._backoff = min(self._backoff * 2, MAX_BACKOFF)
+                logger.warning(f"⚠️ Prompt processing failed, continuing (backoff x{self._backoff})...")
+            return success
+    
+    async def _wait_for_turn(self):
+        """Wait until the next prompt start slot (WORKER_PROMPTS_PER_MINUTE, stretched by backoff)"""
+        async with self._start_lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._next_start > now:
+                logger.info(f"⏳ Waiting {self._next_start - now:.0f} seconds before next prompt...")
+                await self._pause(self._next_start - now)
+            self._next_start = max(now, self._next_start) + self._start_interval * self._backoff
+    
+    async def _create_response_records(self, prompts: List[dict]) -> Dict[str, dict]:
+        """
+        Create the 'processing' response rows for a whole batch with one insert
+        
+        Args:
+            prompts: Prompts about to be processed
+            
+        Returns:
+            Created response record per prompt id (empty if the insert failed -
+            process_prompt then creates each record itself)
+        """
+        records = await db.create_responses_batch([
+            {'prompt_id': prompt['id'], 'prompt_text': prompt['text'], 'ai_source': self.ai_source}
+            for prompt in prompts
+        ])
+        return {record['prompt_id']: record for record in records}
+    
+    async def _fetch_pending(self, category_id: Optional[str]) -> List[dict]:
+        """
+        Claim pending prompts (haven't been scraped in last 2 hours)
+        
+        Claimed prompts already have their 'processing' response row, so another
+        worker for the same source won't pick them up.
+        
+        Args:
+            category_id: Optional category filter
+            
+        Returns:
+            Prompts with the 'response_id' of their response record (None if
+            the record couldn't be created - process_prompt then creates it)
+        """
+        claimed = await db.claim_pending_prompts(
+            ai_source=self.ai_source,
+            category_id=category_id,
+            limit=PROMPT_BATCH_SIZE
+        )
+        if claimed is not None:
+            return claimed
+        
+        # claim_pending_prompts not installed (a failed claim returns [] and is retried) - fetch, then create the records in one insert
+        prompts = await db.get_pending_prompts(
+            ai_source=self.ai_source,
+            category_id=category_id,
+            limit=PROMPT_BATCH_SIZE
+        )
+        response_records = await self._create_response_records(prompts) if prompts else {}
+        for prompt in prompts:
+            prompt['response_id'] = response_records.get(prompt['id'], {}).get('id')
+        return prompts
+    
+    async def _release_unprocessed(self, prompts: Optional[List[dict]], reason: str = "Worker stopped"):
+        """Mark the response records of claimed prompts that won't be processed as failed"""
+        for prompt in prompts or []:
+            if prompt.get('response_id'):
+                await db.update_response(
+                    response_id=prompt['response_id'],
+                    response_text="",
+                    brands_mentioned=[],
+                    status='failed',
+                    error_message=reason
+                )
+    
+    async def _listen_for_prompts(self):
+        """Subscribe to new-prompt notifications (no-op without asyncpg or DATABASE_URL)"""
+        if asyncpg is None or not settings.DATABASE_URL:
+            logger.info(f"⏱️  Polling for new prompts every {IDLE_WAIT_SECONDS}s")
+            return
+        
+        try:
+            self._listen_conn = await asyncpg.connect(settings.DATABASE_URL)
+            await self._listen_conn.add_listener(NEW_PROMPT_CHANNEL, self._on_new_prompt)
+            logger.info(f"👂 Listening for new prompts on '{NEW_PROMPT_CHANNEL}'")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not LISTEN for new prompts, polling instead: {e}")
+            self._listen_conn = None
+    
+    def _on_new_prompt(self, connection, pid, channel, payload):
+        """asyncpg notification callback"""
+        self._wake.set()
+    
+    async def _pause(self, seconds: float):
+        """Sleep for up to seconds, returning early if the worker is stopped"""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def _wait_for_prompts(self):
+        """Wait until a prompt is added or IDLE_WAIT_SECONDS pass, whichever is first (stop() wakes it too)"""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=IDLE_WAIT_SECONDS)
+            if self.is_running:
+                logger.info("🔔 New prompt added - checking again")
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+    
+    async def _finish_extractions(self):
+        """Wait for background LLM extractions still in flight"""
+        if self._extraction_tasks:
+            logger.info(f"⏳ Waiting for {len(self._extraction_tasks)} LLM extraction(s) to finish...")
+            await asyncio.gather(*self._extraction_tasks, return_exceptions=True)
+    
     async def run(self, category_id: Optional[str] = None, max_iterations: Optional[int] = None):
         """
         Main worker loop - continuously processes pending prompts
         
-        Each prompt is processed with a fresh browser instance.
+        Each prompt runs in a fresh conversation on a warm pooled browser.
         
         Args:
             category_id: Optional category filter (None = all categories)
@@ -191,90 +413,213 @@ class ScraperWorker:
         """
         logger.info("=" * 80)
         logger.info(f"🚀 Starting {self.ai_source} worker")
-        logger.info(f"🌐 Fresh browser per prompt: ENABLED")
+        logger.info(f"🌐 Warm browser pool: {settings.BROWSER_POOL_SIZE} per source")
         logger.info(f"📂 Category filter: {category_id or 'All categories'}")
         logger.info(f"🔄 Max iterations: {max_iterations or 'Unlimited'}")
         logger.info("=" * 80)
         
         self.is_running = True
+        self._stop.clear()
         iteration = 0
+        await self._listen_for_prompts()
+        next_batch: Optional[asyncio.Task] = None  # Next iteration's prompts, fetched during this one
+        prefetched: Optional[List[dict]] = None
+        unfinished: Dict[str, dict] = {}  # This batch's prompts still running or queued
         
         try:
             while self.is_running:
                 iteration += 1
                 
-                logger.info(f"\n{'='*80}")
-                logger.info(f"🔄 Iteration {iteration}")
-                logger.info(f"✅ Completed: {self.prompts_completed} | ❌ Errors: {self.errors}")
-                logger.info(f"{'='*80}")
-                
-                # Get pending prompts (haven't been scraped in last 2 hours)
-                pending_prompts = await db.get_pending_prompts(
-                    ai_source=self.ai_source,
-                    category_id=category_id,
-                    limit=15  # Process 15 prompts per iteration
+                logger.info(
+                    "🔄 Iteration {} | ✅ Completed: {} | ❌ Errors: {}",
+                    iteration, self.prompts_completed, self.errors
                 )
                 
+                # Get pending prompts - already fetched if the last batch prefetched them
+                if prefetched is not None:
+                    pending_prompts = prefetched
+                    prefetched = None
+                else:
+                    pending_prompts = await self._fetch_pending(category_id)
+                
                 if not pending_prompts:
-                    logger.info("✨ No pending prompts - waiting 5 minutes before checking again...")
-                    await asyncio.sleep(300)  # Wait 5 minutes
+                    logger.info("✨ No pending prompts - waiting up to 5 minutes for new ones...")
+                    await self._wait_for_prompts()
                     continue
                 
                 logger.info(f"📋 Found {len(pending_prompts)} pending prompts")
                 
-                # Process each prompt
-                for prompt in pending_prompts:
-                    if not self.is_running:
-                        logger.info("🛑 Worker stopped")
-                        break
-                    
-                    success = await self.process_prompt(prompt)
-                    
-                    if not success:
-                        logger.warning("⚠️ Prompt processing failed, continuing...")
-                    
-                    # Small delay between prompts
-                    logger.info("⏳ Waiting 30 seconds before next prompt...")
-                    await asyncio.sleep(30)
+                is_last_iteration = bool(max_iterations and iteration >= max_iterations)
+                batch_ids = {prompt['id'] for prompt in pending_prompts}
+                started = 0
+                
+                def on_start():
+                    # Once the last prompt has a slot, fetch the next batch while this one finishes
+                    nonlocal started, next_batch
+                    started += 1
+                    if started == len(pending_prompts) and not is_last_iteration:
+                        next_batch = asyncio.create_task(self._fetch_pending(category_id))
+                
+                unfinished = {prompt['id']: prompt for prompt in pending_prompts}
+                
+                async def process(prompt: dict):
+                    await self._process_in_slot(
+                        prompt,
+                        {'id': prompt['response_id']} if prompt.get('response_id') else None,
+                        on_start
+                    )
+                    unfinished.pop(prompt['id'], None)
+                
+                # Process prompts concurrently, at most self.concurrency at a time
+                await asyncio.gather(
+                    *(process(prompt) for prompt in pending_prompts),
+                    return_exceptions=True
+                )
+                
+                if not self.is_running:
+                    logger.info("🛑 Worker stopped")
+                
+                # Extractions from this batch must land before the next batch is picked
+                await self._finish_extractions()
                 
                 # Check if we've reached max iterations
-                if max_iterations and iteration >= max_iterations:
+                if is_last_iteration:
                     logger.info(f"✅ Reached max iterations ({max_iterations})")
                     break
                 
-                # Wait before next iteration
-                logger.info("⏳ Iteration complete - waiting 1 minute before next cycle...")
-                await asyncio.sleep(60)  # 1 minute between iterations
+                # If the batch insert failed, the prefetch can race the last prompts' response
+                # records - drop this batch's prompts (if nothing else is left, fetch again)
+                if next_batch is not None:
+                    fetched = await next_batch
+                    next_batch = None
+                    await self._release_unprocessed(
+                        [p for p in fetched if p['id'] in batch_ids], "Duplicate of a running prompt"
+                    )
+                    prefetched = [p for p in fetched if p['id'] not in batch_ids] or None
+                
+                logger.info("✅ Iteration complete - starting next cycle")
                 
         except KeyboardInterrupt:
             logger.info("\n⚠️ Received interrupt signal")
         except Exception as e:
-            logger.error(f"❌ Worker error: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Worker error: {e}")
         finally:
             self.is_running = False
+            # Claimed prompts that will never run - an in-flight claim is awaited so its rows aren't stranded
+            if next_batch is not None:
+                try:
+                    prefetched = await next_batch
+                except Exception:
+                    pass
+            await self._release_unprocessed(prefetched)
+            # Only left after a cancellation (e.g. Ctrl+C without signal handlers) - don't leave them 'processing'
+            await self._release_unprocessed(list(unfinished.values()))
             await self.cleanup()
     
     async def stop(self):
         """Stop the worker gracefully"""
+        self.request_stop()
+    
+    def request_stop(self):
+        """
+        Stop the worker, ending any wait right away (safe to call from a signal handler)
+        
+        Prompts already scraping finish; queued ones are marked failed.
+        """
         logger.info(f"🛑 Stopping {self.ai_source} worker...")
         self.is_running = False
+        self._stop.set()
+        self._wake.set()
     
     async def cleanup(self):
-        """Cleanup resources (no persistent scraper to cleanup)"""
+        """Cleanup resources (pooled browsers and queued writes)"""
+        await BaseScraper.close_driver_pool(self.ai_source)
+        
+        if self._listen_conn is not None:
+            try:
+                await self._listen_conn.close()
+            except Exception as e:
+                logger.error(f"Error closing LISTEN connection: {e}")
+            self._listen_conn = None
+        
+        # Let in-flight extractions save their results
+        await self._finish_extractions()
+        
+        # Send any queued response/session writes before reporting
+        await db.flush_writes()
+        
         logger.info("=" * 80)
         logger.info(f"📊 WORKER SUMMARY - {self.ai_source}")
         logger.info(f"✅ Prompts completed: {self.prompts_completed}")
         logger.info(f"❌ Errors: {self.errors}")
         logger.info(f"🕐 Last scrape: {self.last_scrape_at}")
-        logger.info(f"🌐 Fresh browser used for each prompt")
         logger.info("=" * 80)
 
 
-async def main():
+def _configure_logging(log_name: Optional[str] = None):
+    """
+    Route this process's logs through loguru's background writer thread
+    
+    Prompts run concurrently, so log writes must not block the event loop.
+    
+    Args:
+        log_name: Also log to {LOG_PATH}/{log_name}.log (one file per process)
+    """
+    logger.remove()  # Remove default (synchronous stderr) handler
+    logger.add(
+        sys.stdout,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
+        level=settings.LOG_LEVEL,
+        colorize=True,
+        enqueue=True
+    )
+    if log_name:
+        logger.add(
+            f"{settings.LOG_PATH}/{log_name}.log",
+            rotation="500 MB",
+            retention="10 days",
+            level="DEBUG",
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
+            enqueue=True
+        )
+
+
+async def _serve(worker: ScraperWorker, category_id: Optional[str], max_iterations: Optional[int]):
+    """Run a worker, stopping it gracefully on SIGTERM or Ctrl+C"""
+    loop = asyncio.get_running_loop()
+    try:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, worker.request_stop)
+    except NotImplementedError:
+        pass  # No loop signal handlers on Windows - Ctrl+C cancels run(), whose finally cleans up
+    await worker.run(category_id, max_iterations)
+
+
+def _run_worker(ai_source: str, category_id: Optional[str], max_iterations: Optional[int]):
+    """
+    Run one AI source's worker with its own event loop (child process entry point)
+    
+    Args:
+        ai_source: AI platform name
+        category_id: Optional category filter
+        max_iterations: Max number of iterations (None = run forever)
+    """
+    _configure_logging(f"worker_{ai_source}")
+    run = uvloop.run if uvloop is not None else asyncio.run
+    try:
+        run(_serve(ScraperWorker(ai_source), category_id, max_iterations))
+    except KeyboardInterrupt:
+        pass  # Ctrl+C reaches every process in the group - the worker already cleaned up
+    finally:
+        logger.complete()  # Drain the enqueued sinks before the process exits
+
+
+def main():
     """
     Run workers for both ChatGPT, Gemini and Perplexity based on command-line args
+    
+    Each AI source gets its own process, so browser work and parsing for one
+    source never waits on another's event loop or the GIL.
     """
     import argparse
     
@@ -297,6 +642,7 @@ async def main():
     )
     
     args = parser.parse_args()
+    _configure_logging()
     
     logger.info("=" * 80)
     logger.info("🤖 AI SCRAPING BACKGROUND WORKER")
@@ -306,32 +652,51 @@ async def main():
     logger.info(f"Max Iterations: {args.max_iterations or 'Unlimited'}")
     logger.info("=" * 80)
     
-    workers = []
+    sources = [
+        source for source in ('chatgpt', 'gemini', 'perplexity')
+        if args.ai_source in (source, 'all')
+    ]
+    
+    # Single source - no need for a child process
+    if len(sources) == 1:
+        _run_worker(sources[0], args.category, args.max_iterations)
+        return
+    
+    # Spawn (not fork) - each child starts clean instead of inheriting loggers, pools and clients
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(
+            target=_run_worker,
+            args=(source, args.category, args.max_iterations),
+            name=f"{source}-worker"
+        )
+        for source in sources
+    ]
+    
+    def forward_sigterm(signum, frame):
+        # Children stop gracefully on SIGTERM (see _serve)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
     
     try:
-        if args.ai_source in ['chatgpt', 'all']:
-            worker = ScraperWorker('chatgpt')
-            workers.append(worker.run(args.category, args.max_iterations))
-        
-        if args.ai_source in ['gemini', 'all']:
-            worker = ScraperWorker('gemini')
-            workers.append(worker.run(args.category, args.max_iterations))
-        
-        if args.ai_source in ['perplexity', 'all']:
-            worker = ScraperWorker('perplexity')
-            workers.append(worker.run(args.category, args.max_iterations))
-        
-        # Run all workers concurrently
-        await asyncio.gather(*workers)
+        for process in processes:
+            process.start()
+        signal.signal(signal.SIGTERM, forward_sigterm)
+        for process in processes:
+            process.join()
         
     except KeyboardInterrupt:
+        # Children got the same SIGINT - let them finish their cleanup
         logger.info("\n⚠️ Shutting down workers...")
+        for process in processes:
+            process.join()
     except Exception as e:
-        logger.error(f"❌ Fatal error: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"❌ Fatal error: {e}")
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
 
 
 if __name__ == "__main__":
-    # Run the async main function
-    asyncio.run(main())
+    main()